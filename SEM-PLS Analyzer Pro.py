@@ -5,7 +5,51 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
 from io import BytesIO
-import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from pls_cache import DatasetStore, FitCache, ReplicateStore, approx_nbytes, fingerprint_frame, make_cache_key
+from pls_data import HAS_PYARROW, UPLOAD_TYPES, PopulationModel, read_upload, write_synthetic
+from pls_effects import mediation_table
+from pls_engine import (
+    INNER_SCHEMES, PRECISIONS, fit_pls, jackknife_estimates, parse_model_syntax, precision_report, progressive_bootstrap,
+    run_analysis,
+)
+from pls_jobs import JobManager
+from pls_memory import MemoryGovernor, render_memory_panel, streamlit_session_id
+from pls_mga import multigroup_analysis
+from pls_pipeline import merge_boot_pvalues, model_syntax
+from pls_predict import blindfolding, pls_predict, predictive_power
+from pls_profile import StageProfiler, render_profiler_panel
+from pls_report import TABLE_FORMATS, export_bundle, html_report
+from pls_validity import (
+    HTMT_THRESHOLD, RELIABILITY_COLS, fornell_larcker, fornell_larcker_violations, htmt_bootstrap, reliability_bootstrap, reliability_table,
+)
+
+# Batas cache hasil fit (MB) dan direktori spill opsional, dapat diatur via environment
+FIT_CACHE_MAX_MB = int(os.environ.get('SEMPLS_CACHE_MB', 512))
+FIT_CACHE_DIR = os.environ.get('SEMPLS_CACHE_DIR') or None
+# Direktori penyimpanan matriks replikasi bootstrap (.npz)
+REPLICATE_DIR = os.environ.get('SEMPLS_REPLICATE_DIR') or os.path.join(tempfile.gettempdir(), 'sempls_replicates')
+# Direktori dataset kolumnar (memory-map) yang dibagi semua sesi
+DATASET_DIR = os.environ.get('SEMPLS_DATASET_DIR') or os.path.join(tempfile.gettempdir(), 'sempls_datasets')
+# Direktori file data sintetis (ditulis streaming per chunk, dipakai ulang untuk parameter yang sama)
+SYNTHETIC_DIR = os.environ.get('SEMPLS_SYNTHETIC_DIR') or os.path.join(tempfile.gettempdir(), 'sempls_synthetic')
+SYNTHETIC_MAX_FILES = 8
+# Batas ukuran file sintetis (MB) yang ditawarkan lewat tombol unduh; unduhan dibaca utuh ke memori
+SYNTHETIC_DOWNLOAD_MAX_MB = int(os.environ.get('SEMPLS_SYNTHETIC_DOWNLOAD_MB', 200))
+# Jumlah job analisis latar belakang yang berjalan bersamaan (semua sesi)
+JOB_WORKERS = int(os.environ.get('SEMPLS_JOB_WORKERS', 2))
+
+# Label mode bootstrap di UI -> mode internal `run_analysis`
+BOOTSTRAP_MODE_KEYS = {
+    "Paralel (multi-core)": 'parallel',
+    "Progresif (early stopping)": 'progressive',
+    "semopy (single-core)": 'semopy',
+}
 
 # --- Konfigurasi dan Styling Halaman ---
 st.set_page_config(page_title="SEM-PLS Analyzer ProMax", layout="wide", initial_sidebar_state="expanded")
@@ -76,125 +120,254 @@ st.title("💡 SmartPLS Light: Analisis SEM-PLS")
 
 # --- Helper Functions ---
 
-@st.cache_data
-def generate_template():
-    """Menghasilkan template data dummy."""
-    data = {
-        'responden_id': range(1, 101),
-        'KL_1': np.random.randint(1, 6, 100), 'KL_2': np.random.randint(1, 6, 100), 'KL_3': np.random.randint(1, 6, 100), 'KL_4': np.random.randint(1, 6, 100), 'KL_5': np.random.randint(1, 6, 100),
-        'CM_1': np.random.randint(1, 6, 100), 'CM_2': np.random.randint(1, 6, 100), 'CM_3': np.random.randint(1, 6, 100), 'CM_4': np.random.randint(1, 6, 100), 'CM_5': np.random.randint(1, 6, 100),
-        'KP_1': np.random.randint(1, 6, 100), 'KP_2': np.random.randint(1, 6, 100), 'KP_3': np.random.randint(1, 6, 100), 'KP_4': np.random.randint(1, 6, 100), 'KP_5': np.random.randint(1, 6, 100),
-        'KE_1': np.random.randint(1, 6, 100), 'KE_2': np.random.randint(1, 6, 100), 'KE_3': np.random.randint(1, 6, 100), 'KE_4': np.random.randint(1, 6, 100), 'KE_5': np.random.randint(1, 6, 100),
-        'LO_1': np.random.randint(1, 6, 100), 'LO_2': np.random.randint(1, 6, 100), 'LO_3': np.random.randint(1, 6, 100), 'LO_4': np.random.randint(1, 6, 100), 'LO_5': np.random.randint(1, 6, 100),
-    }
-    return pd.DataFrame(data)
+def synthetic_template_path(latent_vars, paths, n_rows, loading, path_coef, exogenous_corr, seed, fmt='csv'):
+    """Path file data sintetis untuk kombinasi parameter ini (nama file = hash parameter)."""
+    params = json.dumps([latent_vars, paths, n_rows, loading, path_coef, exogenous_corr, seed], sort_keys=True, default=str)
+    return os.path.join(SYNTHETIC_DIR, f"{hashlib.blake2b(params.encode(), digest_size=12).hexdigest()}.{fmt}")
+
+def prune_synthetic_files(keep):
+    """Simpan hanya `SYNTHETIC_MAX_FILES` file sintetis terbaru; file yang sudah dihapus sesi lain dilewati."""
+    entries = []
+    for name in os.listdir(SYNTHETIC_DIR):
+        path = os.path.join(SYNTHETIC_DIR, name)
+        if name.endswith('.tmp') or path == keep:
+            continue
+        try:
+            entries.append((os.path.getmtime(path), path))
+        except FileNotFoundError:
+            continue
+    for _, path in sorted(entries, reverse=True)[SYNTHETIC_MAX_FILES - 1:]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def generate_template(latent_vars, paths, n_rows, loading, path_coef, exogenous_corr, seed, fmt='csv'):
+    """Tulis data sintetis (CSV/Parquet) dari model populasi yang diketahui ke file dan kembalikan path-nya.
+
+    Baris ditulis streaming per chunk (`write_synthetic`), jadi data penuh
+    tidak pernah ada di memori. File untuk parameter yang sama dipakai ulang
+    dan dibangkitkan lagi bila sudah di-prune; hanya `SYNTHETIC_MAX_FILES`
+    file terbaru yang disimpan.
+    """
+    target = synthetic_template_path(latent_vars, paths, n_rows, loading, path_coef, exogenous_corr, seed, fmt)
+    try:
+        os.utime(target)
+        return target
+    except FileNotFoundError:
+        pass
+    os.makedirs(SYNTHETIC_DIR, exist_ok=True)
+    population = PopulationModel(latent_vars, paths, loadings=loading, path_coefs=path_coef, exogenous_corr=exogenous_corr)
+    # Sesi Streamlit berbagi satu proses: file sementara diberi ID thread agar tidak bertabrakan
+    tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write_synthetic(population, n_rows, tmp, fmt=fmt, seed=seed)
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    prune_synthetic_files(keep=target)
+    return target
+
+def read_template(*template_args):
+    """Isi file data sintetis untuk diunduh; dibangkitkan ulang bila file di-prune sesi lain sejak dibuat."""
+    try:
+        with open(synthetic_template_path(*template_args), 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        with open(generate_template(*template_args), 'rb') as f:
+            return f.read()
 
-def download_link(df, filename):
-    """Menyediakan link untuk mengunduh DataFrame sebagai CSV."""
-    csv = df.to_csv(index=False).encode()
-    b64 = base64.b64encode(csv).decode()
-    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}" style="color: #00695c; text-decoration: underline; font-weight: bold;">Unduh Template Data ({filename})</a>'
-    return href
+@st.cache_resource
+def get_fit_cache():
+    """Cache hasil fit/bootstrap yang dibagi oleh semua sesi pengguna."""
+    return FitCache(max_bytes=FIT_CACHE_MAX_MB * 2**20, disk_dir=FIT_CACHE_DIR)
 
-def get_lv_positions(lvs):
-    """Menentukan posisi visual (x, y) untuk LV dalam diagram jalur."""
+@st.cache_resource
+def get_replicate_store():
+    """Penyimpanan replikasi bootstrap di disk, dibagi oleh semua sesi."""
+    return ReplicateStore(REPLICATE_DIR)
+
+@st.cache_resource
+def get_dataset_store():
+    """Dataset upload dalam format kolumnar memory-map, dibagi oleh semua sesi."""
+    return DatasetStore(DATASET_DIR)
+
+def session_data():
+    """Proyeksi kolom aktif dataset sesi (tanpa ID responden) sebagai view memory-map tanpa salinan.
+
+    Setiap pemanggilan memperbarui rujukan sesi agar dataset tidak di-prune selama sesi masih aktif.
+    """
+    store, key = get_dataset_store(), st.session_state['dataset_key']
+    if key not in store:
+        raise FileNotFoundError("Dataset sesi ini sudah tidak tersedia di penyimpanan bersama; upload ulang data di Langkah 1.")
+    store.acquire(streamlit_session_id(), key)
+    columns = [col for col in st.session_state['dataset_columns'] if col != 'responden_id']
+    return store.frame(key, columns)
+
+@st.cache_resource
+def get_job_manager():
+    """Antrian job analisis latar belakang yang dibagi oleh semua sesi."""
+    return JobManager(max_workers=JOB_WORKERS)
+
+@st.cache_resource
+def get_memory_governor():
+    """Akuntansi memori semua sesi; cache fit dan hasil job boleh dibuang karena dapat diambil ulang."""
+    governor = MemoryGovernor()
+    fit_cache, job_manager = get_fit_cache(), get_job_manager()
+    governor.register_shared("Cache fit", lambda: fit_cache.nbytes, lambda: fit_cache.shrink(fit_cache.nbytes // 2))
+    governor.register_shared("Hasil job selesai", lambda: approx_nbytes(job_manager.results()), job_manager.release_results)
+    governor.register_evictable('profiler', lambda state, key: state[key].clear())
+    return governor
+
+def show_solver_status(res, label):
+    """Keterangan iterasi & konvergensi fit native (semopy tidak melaporkan telemetri solver)."""
+    if not hasattr(res, 'solver_summary'):
+        return
+    info = res.solver_summary()
+    text = (f"{label}: **{info['n_iter']}** iterasi, perubahan bobot terakhir **{info['delta']:.1e}**, "
+            f"{info['near_tol_iter']} iterasi dekat toleransi.")
+    if info['converged']:
+        st.caption(f"✅ {text}")
+    else:
+        st.warning(f"⚠️ {text} Solver **tidak konvergen** (batas iterasi maksimum tercapai); "
+                   "naikkan iterasi maksimum atau longgarkan toleransi di Langkah 2.")
+
+def get_lv_positions(lvs, paths=()):
+    """Menentukan posisi visual (x, y) untuk LV dengan layout berlapis (topologis) dari jalur."""
     num_lvs = len(lvs)
     if num_lvs == 0:
         return {}
-    
-    # Simple layered layout approximation for up to 5 LVs
-    # Assuming the order in LVs list roughly corresponds to the path flow
+
+    edges = [(f, t) for f, t in dict.fromkeys(paths) if f in lvs and t in lvs and f != t]
+    preds = {lv: [f for f, t in edges if t == lv] for lv in lvs}
+    succs = {lv: [t for f, t in edges if f == lv] for lv in lvs}
+
+    # 1. Layer = panjang jalur terpanjang dari sumber (Kahn); siklus diputus pada node berindegree terkecil
+    indeg = {lv: len(preds[lv]) for lv in lvs}
+    layer = {lv: 0 for lv in lvs}
+    placed = set()
+    remaining = list(lvs)
+    while remaining:
+        ready = [lv for lv in remaining if indeg[lv] == 0]
+        if not ready:
+            ready = [min(remaining, key=lambda lv: (indeg[lv], lvs.index(lv)))]
+        for lv in ready:
+            remaining.remove(lv)
+            placed.add(lv)
+            for t in succs[lv]:
+                if t not in placed:
+                    indeg[t] -= 1
+                    layer[t] = max(layer[t], layer[lv] + 1)
+
+    n_layers = max(layer.values()) + 1
+    layers = [[lv for lv in lvs if layer[lv] == k] for k in range(n_layers)]
+
+    # 2. Urutan dalam layer: heuristik barycenter (beberapa sapuan) untuk mengurangi persilangan
+    order = {lv: i for members in layers for i, lv in enumerate(members)}
+    for sweep in range(4):
+        for k in (range(1, n_layers) if sweep % 2 == 0 else range(n_layers - 2, -1, -1)):
+            neighbours = preds if sweep % 2 == 0 else succs
+            def barycenter(lv):
+                ns = [order[n] for n in neighbours[lv] if layer[n] != k]
+                return sum(ns) / len(ns) if ns else order[lv]
+            layers[k].sort(key=barycenter)
+            for i, lv in enumerate(layers[k]):
+                order[lv] = i
+
+    # 3. Koordinat: x = layer, y = posisi dalam layer (dipusatkan)
     positions = {}
-    if num_lvs == 5:
-        # Layer 1 (IVs)
-        positions[lvs[0]] = (-1, 1.5)
-        positions[lvs[1]] = (-1, 0.5)
-        # Layer 2 (Mediator/Second IV)
-        positions[lvs[2]] = (0, 1.5)
-        # Layer 3 (Third IV/DV)
-        positions[lvs[3]] = (1, 1.5)
-        # Layer 4 (Final DV)
-        positions[lvs[4]] = (2, 1)
-    elif num_lvs > 0:
-        # General layout: arrange in a circle/vertical stack
-        angle_step = 2 * np.pi / num_lvs
-        for i, lv in enumerate(lvs):
-            angle = i * angle_step
-            # Position LVs in a slight vertical spread
-            positions[lv] = (np.cos(angle) * 1.5, np.sin(angle) * 1.5)
-            
+    for k, members in enumerate(layers):
+        for i, lv in enumerate(members):
+            positions[lv] = (k * 1.5, ((len(members) - 1) / 2 - i) * 1.2)
     return positions
 
-def plot_sem_paths(model_dict, hypotheses, path_df, alpha):
+def path_diagram_items(hypotheses, path_df):
+    """Ringkas koefisien & p-value tiap hipotesis menjadi tuple (hashable untuk cache gambar)."""
+    paths = path_df[path_df['op'] == '~']
+    has_p = 'p-value' in paths.columns
+    lookup = {
+        (row['rval'], row['lval']): (float(row['Estimate']), float(row['p-value']) if has_p else 0.5) # Fallback
+        for _, row in paths.iterrows()
+    }
+    return tuple((f, t) + lookup[(f, t)] for f, t in hypotheses if (f, t) in lookup)
+
+def plot_sem_paths(lvs, hypotheses, path_items, alpha):
     """Membuat plot diagram jalur yang disederhanakan."""
-    fig, ax = plt.subplots(figsize=(10, 8))
+    positions = get_lv_positions(list(lvs), hypotheses)
+    n_layers = len({x for x, _ in positions.values()}) or 1
+    max_layer = max([sum(1 for x2, _ in positions.values() if x2 == x) for x, _ in positions.values()] or [1])
+    fig, ax = plt.subplots(figsize=(max(8, 2.8 * n_layers), max(5, 1.6 * max_layer)))
     ax.set_title("Path Diagram: Koefisien Jalur (PLS-SEM)", fontsize=14, color='#004d40')
     ax.set_axis_off()
     
-    lvs = list(model_dict.keys())
-    positions = get_lv_positions(lvs)
-    
     # Define colors for significance (Green for Significant, Red for Non-significant)
     cmap = LinearSegmentedColormap.from_list("sig_colors", ["#d32f2f", "#4CAF50"]) # Red (Non-sig) to Green (Sig)
     
     # 1. Draw Nodes (LVs)
     for lv, (x, y) in positions.items():
         # Draw node (simple circle/box)
-        ax.scatter(x, y, s=5000, color='#e0f2f1', edgecolor='#00695c', linewidth=2, zorder=3)
-        ax.text(x, y, lv, ha='center', va='center', fontsize=12, weight='bold', color='#004d40', zorder=4)
+        ax.scatter(x, y, s=4000, color='#e0f2f1', edgecolor='#00695c', linewidth=2, zorder=3)
+        ax.text(x, y, lv, ha='center', va='center', fontsize=11, weight='bold', color='#004d40', zorder=4)
 
     # 2. Draw Edges (Paths) and Labels
-    for from_var, to_var in hypotheses:
+    for from_var, to_var, beta, p_val in path_items:
         if from_var in positions and to_var in positions:
             x1, y1 = positions[from_var]
             x2, y2 = positions[to_var]
             
-            # Find the path coefficient and p-value
-            path_data = path_df[(path_df['lval'] == to_var) & (path_df['op'] == '~') & (path_df['rval'] == from_var)]
+            is_significant = p_val < alpha
+            path_color = cmap(1.0) if is_significant else cmap(0.0)
+            linestyle = '-' if is_significant else '--'
+            linewidth = 2.5 if is_significant else 1.5
             
-            if not path_data.empty:
-                beta = path_data['Estimate'].iloc[0]
-                p_val = path_data['p-value'].iloc[0] if 'p-value' in path_data.columns else 0.5 # Fallback
-                
-                is_significant = p_val < alpha
-                path_color = cmap(1.0) if is_significant else cmap(0.0)
-                linestyle = '-' if is_significant else '--'
-                linewidth = 2.5 if is_significant else 1.5
-                
-                # Calculate text position (midpoint + slight offset for clarity)
-                mid_x = (x1 + x2) / 2
-                mid_y = (y1 + y2) / 2
-                
-                # Draw Arrow
-                ax.annotate(
-                    '', xy=(x2, y2), xytext=(x1, y1),
-                    arrowprops=dict(
-                        arrowstyle="->", color=path_color, linewidth=linewidth, linestyle=linestyle,
-                        shrinkA=0.15, shrinkB=0.15, mutation_scale=20
-                    ),
-                    zorder=1
-                )
-                
-                # Label text
-                label = f"β={beta:.3f}\nP={p_val:.3f}"
-                
-                # Calculate rotation for text
-                dx = x2 - x1
-                dy = y2 - y1
-                angle = np.degrees(np.arctan2(dy, dx))
-                
-                # Place the label slightly offset from the midpoint
-                offset_x = 0.05 * dy / np.linalg.norm([dx, dy]) if np.linalg.norm([dx, dy]) > 0 else 0
-                offset_y = 0.05 * dx / np.linalg.norm([dx, dy]) if np.linalg.norm([dx, dy]) > 0 else 0
-                
-                # Add text label
-                ax.text(mid_x - offset_x, mid_y + offset_y, label, 
-                        ha='center', va='center', fontsize=10, 
-                        bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.3'),
-                        color='black', zorder=5)
+            # Calculate text position (midpoint + slight offset for clarity)
+            mid_x = (x1 + x2) / 2
+            mid_y = (y1 + y2) / 2
+            
+            # Draw Arrow
+            ax.annotate(
+                '', xy=(x2, y2), xytext=(x1, y1),
+                arrowprops=dict(
+                    arrowstyle="->", color=path_color, linewidth=linewidth, linestyle=linestyle,
+                    shrinkA=22, shrinkB=22, mutation_scale=20
+                ),
+                zorder=1
+            )
+            
+            # Label text
+            label = f"β={beta:.3f}\nP={p_val:.3f}"
+            
+            # Place the label slightly offset from the midpoint
+            dx = x2 - x1
+            dy = y2 - y1
+            norm = np.hypot(dx, dy)
+            offset_x = 0.05 * dy / norm if norm > 0 else 0
+            offset_y = 0.05 * dx / norm if norm > 0 else 0
+            
+            # Add text label
+            ax.text(mid_x - offset_x, mid_y + offset_y, label, 
+                    ha='center', va='center', fontsize=9, 
+                    bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', boxstyle='round,pad=0.3'),
+                    color='black', zorder=5)
 
+    xs = [x for x, _ in positions.values()] or [0]
+    ys = [y for _, y in positions.values()] or [0]
+    ax.set_xlim(min(xs) - 0.8, max(xs) + 0.8)
+    ax.set_ylim(min(ys) - 0.8, max(ys) + 0.8)
     return fig
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def render_path_diagram(lvs, hypotheses, path_items, alpha, fmt='png'):
+    """Render diagram jalur ke bytes PNG/SVG; di-cache per model & estimasi, figure langsung ditutup."""
+    fig = plot_sem_paths(lvs, hypotheses, path_items, alpha)
+    buf = BytesIO()
+    try:
+        fig.savefig(buf, format=fmt, dpi=110, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
 # --- Sidebar Navigation ---
 st.sidebar.title("🛠️ Workflow Analisis")
 page = st.sidebar.selectbox(
@@ -222,29 +395,148 @@ if 'alpha' not in st.session_state:
     st.session_state['alpha'] = 0.05
 if 'bootstrap_samples' not in st.session_state:
     st.session_state['bootstrap_samples'] = 5000
+if 'estimator' not in st.session_state:
+    st.session_state['estimator'] = "semopy (algo='PLS')"
+if 'inner_scheme' not in st.session_state:
+    st.session_state['inner_scheme'] = 'path'
+if 'bootstrap_mode' not in st.session_state:
+    st.session_state['bootstrap_mode'] = "Paralel (multi-core)"
+if 'bootstrap_workers' not in st.session_state:
+    st.session_state['bootstrap_workers'] = os.cpu_count() or 1
+if 'bootstrap_seed' not in st.session_state:
+    st.session_state['bootstrap_seed'] = 42
+if 'bootstrap_warm_start' not in st.session_state:
+    st.session_state['bootstrap_warm_start'] = True
+if 'bootstrap_precision' not in st.session_state:
+    st.session_state['bootstrap_precision'] = 'float64'
+if 'solver_settings' not in st.session_state:
+    # Toleransi/iterasi maksimum solver native: fit sampel penuh dan replikasi bootstrap
+    st.session_state['solver_settings'] = {'tol': 1e-7, 'max_iter': 300, 'boot_tol': 1e-7, 'boot_max_iter': 300}
+if 'exclude_nonconverged' not in st.session_state:
+    st.session_state['exclude_nonconverged'] = False
+if 'run_in_background' not in st.session_state:
+    st.session_state['run_in_background'] = False
+if 'analysis_jobs' not in st.session_state:
+    st.session_state['analysis_jobs'] = {}
+if 'export_jobs' not in st.session_state:
+    # Kunci paket ekspor -> job_id pembuatan paket di latar belakang
+    st.session_state['export_jobs'] = {}
 if 'is_validated' not in st.session_state:
     st.session_state['is_validated'] = False
+if 'mga_group_col' not in st.session_state:
+    st.session_state['mga_group_col'] = None
+if 'mga_permutations' not in st.session_state:
+    st.session_state['mga_permutations'] = 1000
 if 'loading_threshold' not in st.session_state:
     st.session_state['loading_threshold'] = 0.708
+if 'compact_ingest' not in st.session_state:
+    st.session_state['compact_ingest'] = True
+if 'profiler' not in st.session_state:
+    st.session_state['profiler'] = StageProfiler()
+
+# --- Profil Per Tahap (Sidebar) ---
+show_profiler = st.sidebar.checkbox("⏱️ Tampilkan profil per tahap", key='show_profiler')
+profiler = st.session_state['profiler']
+profiler.trace_memory = show_profiler and st.sidebar.checkbox(
+    "Lacak puncak alokasi Python (tracemalloc, lebih lambat)", key='profile_memory'
+)
+profiler.begin_run(page)
+# Panel diisi di akhir script agar memuat semua tahap rerun ini
+profiler_box = st.sidebar.container() if show_profiler else None
+
+# --- Memori Sesi (Sidebar) ---
+memory_governor = get_memory_governor()
+session_id = streamlit_session_id()
+with profiler.stage("Akuntansi memori sesi"):
+    memory_governor.account(session_id, st.session_state, app="SEM-PLS Analyzer Pro")
+if st.sidebar.checkbox("🧠 Tampilkan memori sesi", key='show_memory'):
+    st.sidebar.markdown("#### 🧠 Memori Sesi")
+    render_memory_panel(memory_governor, session_id, st.sidebar)
 
 # --- Page 1: Upload Data ---
 if page == "1. Import Data":
-    st.header("1. Upload File Data CSV")
+    st.header("1. Upload File Data (CSV / Parquet / Feather)")
     
-    col_temp, col_info = st.columns([1, 2])
-    with col_temp:
-        template_df = generate_template()
-        st.markdown(download_link(template_df, "template_sem_pls.csv"), unsafe_allow_html=True)
-    with col_info:
-        st.info("Pastikan data Anda hanya berisi kolom ID Responden dan Indikator (skala Likert/rasio).")
+    st.info("Pastikan data Anda hanya berisi kolom ID Responden dan Indikator (skala Likert/rasio).")
+
+    with st.expander("🧪 Generator Data Sintetis (Template dengan Model Populasi)"):
+        st.caption("Data Likert berkorelasi dibangkitkan dari variabel laten & jalur yang sedang didefinisikan, dengan loading dan koefisien jalur populasi yang diketahui.")
+        col_n, col_load, col_path = st.columns(3)
+        with col_n:
+            gen_rows = st.number_input("Jumlah Responden (N)", min_value=10, max_value=5_000_000, value=100, step=100)
+        with col_load:
+            gen_loading = st.slider("Loading Populasi (λ)", 0.40, 0.95, 0.80, 0.01)
+        with col_path:
+            gen_path = st.slider("Koefisien Jalur Populasi (β)", -0.60, 0.60, 0.30, 0.01)
+        col_exo, col_seed, col_fmt = st.columns(3)
+        with col_exo:
+            gen_exo_corr = st.slider("Korelasi Antar Konstrak Eksogen", 0.0, 0.8, 0.0, 0.05)
+        with col_seed:
+            gen_seed = st.number_input("Seed", min_value=0, max_value=2**32 - 1, value=2024)
+        with col_fmt:
+            gen_fmt = st.selectbox("Format", ["csv", "parquet"] if HAS_PYARROW else ["csv"])
+        template_args = (
+            st.session_state['latent_vars'], tuple(st.session_state['paths']), int(gen_rows),
+            gen_loading, gen_path, gen_exo_corr, int(gen_seed), gen_fmt
+        )
+        template_path = synthetic_template_path(*template_args)
+        if st.button("🧪 Bangkitkan Data Sintetis"):
+            try:
+                with profiler.stage("Generator data sintetis"):
+                    generate_template(*template_args)
+            except (ValueError, OSError) as gen_e:
+                st.error(f"Gagal membangkitkan data sintetis: {gen_e}")
+        try:
+            template_mb = os.path.getsize(template_path) / 2**20
+        except FileNotFoundError:
+            template_mb = None
+        if template_mb is None:
+            st.caption("Atur parameter lalu klik **Bangkitkan Data Sintetis**; tombol unduh muncul setelah file selesai ditulis.")
+        elif template_mb > SYNTHETIC_DOWNLOAD_MAX_MB:
+            st.warning(
+                f"File data sintetis berukuran {template_mb:,.0f} MB, melebihi batas unduhan lewat browser "
+                f"({SYNTHETIC_DOWNLOAD_MAX_MB} MB). File tersimpan di server: `{template_path}`. "
+                "Kurangi N atau pilih format Parquet untuk mengunduh lewat aplikasi."
+            )
+        else:
+            try:
+                with profiler.stage("Siapkan unduhan data sintetis"):
+                    template_data = read_template(*template_args)
+                st.download_button(
+                    f"⬇️ Unduh Data Sintetis ({gen_rows:,} baris, {template_mb:.1f} MB)",
+                    template_data, file_name=f"template_sem_pls.{gen_fmt}",
+                    mime="text/csv" if gen_fmt == "csv" else "application/octet-stream"
+                )
+            except (ValueError, OSError) as gen_e:
+                st.error(f"Gagal menyiapkan unduhan data sintetis: {gen_e}")
     
-    uploaded_file = st.file_uploader("Pilih file CSV", type="csv")
+    st.session_state['compact_ingest'] = st.checkbox(
+        "Mode ingest hemat memori (parser tercepat + downcast indikator Likert ke integer kecil)",
+        value=st.session_state['compact_ingest']
+    )
+    uploaded_file = st.file_uploader("Pilih file data", type=UPLOAD_TYPES)
     if uploaded_file is not None:
         try:
-            df = pd.read_csv(uploaded_file)
-            st.session_state['df'] = df
+            with profiler.stage("Parsing data upload", file=uploaded_file.name, size=uploaded_file.size):
+                if st.session_state['compact_ingest']:
+                    df, ingest_info = read_upload(uploaded_file)
+                else:
+                    df, ingest_info = read_upload(uploaded_file, compact=False, sep=',')
+            with profiler.stage("Simpan dataset (memory-map bersama)"):
+                st.session_state['dataset_key'] = get_dataset_store().put(df)
+                get_dataset_store().acquire(streamlit_session_id(), st.session_state['dataset_key'])
+            st.session_state['dataset_columns'] = list(df.columns)
             st.session_state['is_validated'] = False # Reset validation flag on new upload
             st.success(f"Data berhasil diupload! Ukuran: **{df.shape[0]}** responden x **{df.shape[1]}** kolom.")
+
+            col_parse, col_mem, col_rss = st.columns(3)
+            col_parse.metric("Waktu Parsing", f"{ingest_info['parse_seconds']:.3f} s", help=f"Parser: {ingest_info['parser']}")
+            col_mem.metric(
+                "Memori Data", f"{ingest_info['nbytes'] / 2**20:.2f} MB",
+                delta=f"{(ingest_info['nbytes'] - ingest_info['raw_nbytes']) / 2**20:.2f} MB vs tanpa downcast",
+                delta_color="inverse"
+            )
+            col_rss.metric("Resident Memory Proses", f"{ingest_info['rss_after'] / 2**20:.0f} MB")
             
             # Preview data
             st.subheader("Preview Data")
@@ -261,7 +553,7 @@ if page == "1. Import Data":
 # --- Page 2: Definisi Model ---
 elif page == "2. Model & Hipotesis":
     st.header("2. Definisi Model Pengukuran & Struktural")
-    if 'df' not in st.session_state or not st.session_state['indicator_cols']:
+    if 'dataset_key' not in st.session_state or not st.session_state['indicator_cols']:
         st.warning("Upload data terlebih dahulu di langkah 1.")
         st.stop()
     
@@ -373,6 +665,101 @@ elif page == "2. Model & Hipotesis":
     with col_alpha:
         st.session_state['alpha'] = st.slider("Tingkat Signifikansi (α)", 0.01, 0.10, st.session_state['alpha'])
 
+    col_est, col_scheme = st.columns(2)
+    with col_est:
+        estimators = ["semopy (algo='PLS')", "Native NumPy (vektorisasi)"]
+        st.session_state['estimator'] = st.selectbox(
+            "Mesin Estimasi PLS", estimators, index=estimators.index(st.session_state['estimator'])
+        )
+    with col_scheme:
+        st.session_state['inner_scheme'] = st.selectbox(
+            "Skema Inner Weighting", INNER_SCHEMES, index=INNER_SCHEMES.index(st.session_state['inner_scheme']),
+            disabled=st.session_state['estimator'] != "Native NumPy (vektorisasi)",
+            help="Hanya berlaku untuk estimator native (Mode A outer estimation)."
+        )
+
+    col_mode, col_workers, col_seed = st.columns(3)
+    with col_mode:
+        boot_modes = list(BOOTSTRAP_MODE_KEYS.keys())
+        st.session_state['bootstrap_mode'] = st.selectbox(
+            "Mesin Bootstrap", boot_modes, index=boot_modes.index(st.session_state['bootstrap_mode'])
+        )
+    with col_workers:
+        st.session_state['bootstrap_workers'] = st.number_input(
+            "Jumlah Worker (CPU)", min_value=1, max_value=os.cpu_count() or 1,
+            value=min(st.session_state['bootstrap_workers'], os.cpu_count() or 1),
+            disabled=st.session_state['bootstrap_mode'] == "semopy (single-core)"
+        )
+    with col_seed:
+        st.session_state['bootstrap_seed'] = st.number_input(
+            "Seed Bootstrap", min_value=0, max_value=2**32 - 1, value=st.session_state['bootstrap_seed'],
+            help="Seed yang sama menghasilkan replikasi identik berapa pun jumlah worker."
+        )
+    st.session_state['bootstrap_warm_start'] = st.checkbox(
+        "Warm start replikasi bootstrap dari bobot sampel penuh",
+        value=st.session_state['bootstrap_warm_start'],
+        disabled=st.session_state['estimator'] != "Native NumPy (vektorisasi)",
+        help="Setiap replikasi memulai iterasi PLS dari bobot outer hasil fit sampel penuh (estimator native)."
+    )
+    precisions = list(PRECISIONS)
+    st.session_state['bootstrap_precision'] = st.selectbox(
+        "Presisi Resampling (Bootstrap, HTMT, Permutasi MGA)", precisions,
+        index=precisions.index(st.session_state['bootstrap_precision']),
+        disabled=st.session_state['estimator'] != "Native NumPy (vektorisasi)",
+        help="float32 menghemat separuh memori/bandwidth resample dan ukuran replikasi tersimpan; normalisasi dan "
+             "pemusatan tetap float64. Periksa laporan akurasi di halaman hasil sebelum dipakai."
+    )
+    with st.expander("Kontrol Konvergensi Solver (Estimator Native)"):
+        native_selected = st.session_state['estimator'] == "Native NumPy (vektorisasi)"
+        solver = st.session_state['solver_settings']
+        tol_options = [1e-4, 1e-5, 1e-6, 1e-7, 1e-8]
+        col_tol, col_iter, col_btol, col_biter = st.columns(4)
+        with col_tol:
+            solver['tol'] = st.selectbox("Toleransi (sampel penuh)", tol_options, index=tol_options.index(solver['tol']),
+                                         format_func=lambda v: f"{v:.0e}", disabled=not native_selected)
+        with col_iter:
+            solver['max_iter'] = int(st.number_input("Iterasi Maks. (sampel penuh)", min_value=10, max_value=5000,
+                                                     value=solver['max_iter'], step=50, disabled=not native_selected))
+        with col_btol:
+            solver['boot_tol'] = st.selectbox("Toleransi (replikasi bootstrap)", tol_options,
+                                              index=tol_options.index(solver['boot_tol']),
+                                              format_func=lambda v: f"{v:.0e}", disabled=not native_selected,
+                                              help="Toleransi lebih longgar mempercepat bootstrap besar; estimasi sampel "
+                                                   "penuh tetap memakai toleransinya sendiri.")
+        with col_biter:
+            solver['boot_max_iter'] = int(st.number_input("Iterasi Maks. (replikasi)", min_value=10, max_value=5000,
+                                                          value=solver['boot_max_iter'], step=50,
+                                                          disabled=not native_selected))
+        st.session_state['exclude_nonconverged'] = st.checkbox(
+            "Buang replikasi bootstrap yang tidak konvergen dari uji hipotesis & interval",
+            value=st.session_state['exclude_nonconverged'], disabled=not native_selected,
+            help="Replikasi yang berhenti karena batas iterasi maksimum ditandai gagal (NaN)."
+        )
+
+    st.session_state['run_in_background'] = st.checkbox(
+        "Jalankan analisis final sebagai background job",
+        value=st.session_state['run_in_background'],
+        help="Analisis berjalan di luar sesi browser dengan progress bar dan tombol batal; hasil diambil saat halaman dibuka lagi."
+    )
+
+    st.markdown("##### Analisis Multi-Grup (MGA)")
+    model_indicators = {ind for inds in st.session_state['latent_vars'].values() for ind in inds}
+    group_options = [None] + [col for col in st.session_state['dataset_columns']
+                              if col.lower() != 'responden_id' and col not in model_indicators]
+    col_group, col_perm = st.columns(2)
+    with col_group:
+        st.session_state['mga_group_col'] = st.selectbox(
+            "Kolom Grup (mis. wilayah, gender, unit)", group_options,
+            index=group_options.index(st.session_state['mga_group_col']) if st.session_state['mga_group_col'] in group_options else 0,
+            format_func=lambda c: "(Tanpa MGA)" if c is None else c,
+            help="Model di-fit per grup; selisih koefisien jalur diuji dengan uji permutasi (estimator native)."
+        )
+    with col_perm:
+        st.session_state['mga_permutations'] = st.number_input(
+            "Jumlah Permutasi", min_value=100, max_value=20000, value=st.session_state['mga_permutations'], step=100,
+            disabled=st.session_state['mga_group_col'] is None
+        )
+
     # Final button to check validation
     if st.button("✅ Simpan Model & Lanjut ke Uji Validitas", type="primary"):
         valid_lvs = {k: v for k, v in st.session_state['latent_vars'].items() if len(v) >= 1}
@@ -388,11 +775,10 @@ elif page == "2. Model & Hipotesis":
 elif page == "3. Uji Validitas (Outer Model)":
     st.header("3. Uji Validitas Konvergen (Outer Model)")
     
-    if 'df' not in st.session_state or not st.session_state['paths']:
+    if 'dataset_key' not in st.session_state or not st.session_state['paths']:
         st.warning("Mohon definisikan Model & Hipotesis di langkah 2 terlebih dahulu.")
         st.stop()
     
-    df = st.session_state['df']
     model_dict = st.session_state['latent_vars']
     
     st.markdown("#### Tentukan Ambang Batas Validitas (Loading Factor)")
@@ -408,23 +794,43 @@ elif page == "3. Uji Validitas (Outer Model)":
         st.info(f"Umumnya, nilai batas yang digunakan adalah **0.708** (validitas tinggi) atau **0.50** (validitas sedang). Saat ini menggunakan: **{st.session_state['loading_threshold']:.3f}**.")
 
     # 1. Persiapan Model Specification (Hanya Measurement Model diperlukan)
-    data = df.drop(columns=['responden_id'] if 'responden_id' in df.columns else [], errors='ignore')
-    meas_model = "\n".join([f"{latent} =~ " + " + ".join(inds) for latent, inds in model_dict.items()])
-    
-    # Simple check for data availability
-    all_indicators = [ind for inds in model_dict.values() for ind in inds]
-    if any(ind not in data.columns for ind in all_indicators):
-        st.error("🚨 VALIDASI MODEL GAGAL! Beberapa indikator model tidak ada di data. Kembali ke Langkah 2.")
-        st.stop()
-        
+    meas_model, _ = model_syntax(model_dict, st.session_state['paths'])
+
     # 2. Jalankan PLS-SEM (Hanya fit untuk mendapatkan loadings)
     try:
+        data = session_data()
+
+        # Simple check for data availability
+        all_indicators = [ind for inds in model_dict.values() for ind in inds]
+        if any(ind not in data.columns for ind in all_indicators):
+            st.error("🚨 VALIDASI MODEL GAGAL! Beberapa indikator model tidak ada di data. Kembali ke Langkah 2.")
+            st.stop()
+
         st.info("Menghitung Outer Loading untuk Uji Validitas...")
-        model = semopy.Model(meas_model)
-        res = model.fit(data, algo="PLS")
+        use_native = st.session_state['estimator'] == "Native NumPy (vektorisasi)"
+
+        def run_meas_fit():
+            with profiler.stage("Parsing syntax model"):
+                model = parse_model_syntax(meas_model) if use_native else semopy.Model(meas_model)
+            with profiler.stage("Fit PLS (measurement model)"):
+                if use_native:
+                    return fit_pls(model, data, scheme=st.session_state['inner_scheme'], tol=solver['tol'],
+                                   max_iter=solver['max_iter'])
+                return model.fit(data, algo="PLS")
+
+        solver = st.session_state['solver_settings']
+        with profiler.stage("Fingerprint data & kunci cache"):
+            cache_key = make_cache_key(
+                data, meas_model, st.session_state['estimator'], scheme=st.session_state['inner_scheme'],
+                **({'tol': solver['tol'], 'max_iter': solver['max_iter']} if use_native else {})
+            )
+        with profiler.stage("Outer loading (cache/fit)"):
+            res = get_fit_cache().get_or_compute(cache_key, run_meas_fit)
         st.success("Perhitungan Outer Loading Selesai.")
+        show_solver_status(res, "Fit model pengukuran")
         
-        loadings_df = res.inspect(lv='all', rv='all', col='Loading', std=True, pretty_names=True)
+        with profiler.stage("Inspect hasil (loadings)"):
+            loadings_df = res.inspect(lv='all', rv='all', col='Loading', std=True, pretty_names=True)
         loadings_df = loadings_df[loadings_df['op'] == '=~'].rename(columns={'lval': 'Konstrak', 'rval': 'Indikator', 'Estimate': 'Loading'})
         
         # 3. Tentukan Validitas
@@ -471,9 +877,9 @@ elif page == "3. Uji Validitas (Outer Model)":
                 # Update session state with the cleaned model and data
                 st.session_state['latent_vars'] = new_model_dict
                 
-                # Update data: drop columns of invalid indicators
-                cols_to_drop = [col for col in invalid_indicators if col in st.session_state['df'].columns]
-                st.session_state['df'] = st.session_state['df'].drop(columns=cols_to_drop, errors='ignore')
+                # Update data: proyeksi kolom tanpa indikator tidak valid (dataset tersimpan tidak disalin)
+                cols_to_drop = [col for col in invalid_indicators if col in st.session_state['dataset_columns']]
+                st.session_state['dataset_columns'] = [col for col in st.session_state['dataset_columns'] if col not in cols_to_drop]
                 st.session_state['is_validated'] = True
                 
                 st.success(f"Model dan Data berhasil diperbaiki! {len(cols_to_drop)} kolom indikator telah dihapus.")
@@ -496,37 +902,264 @@ elif page == "4. Hasil Analisis":
         st.warning("⚠️ Anda harus menyelesaikan **Uji Validitas (Outer Model)** di Langkah 3 terlebih dahulu.")
         st.stop()
 
-    df = st.session_state['df']
     model_dict = st.session_state['latent_vars']
     hypotheses = st.session_state['paths']
     bootstrap_samples = st.session_state['bootstrap_samples']
     alpha = st.session_state['alpha']
     
     # 1. Persiapan Model Specification
-    data = df.drop(columns=['responden_id'] if 'responden_id' in df.columns else [], errors='ignore')
-    
-    meas_model = "\n".join([f"{latent} =~ " + " + ".join(inds) for latent, inds in model_dict.items()])
-    struct_model = "\n".join([f"{to_var} ~ {from_var}" for from_var, to_var in hypotheses])
-    full_model = meas_model + "\n" + struct_model
+    meas_model, full_model = model_syntax(model_dict, hypotheses)
     
     st.subheader("Ringkasan Model Akhir (Syntax `semopy`)")
     st.code(full_model)
 
     # 2. Jalankan Analisis
     try:
+        data = session_data()
         st.info(f"Menjalankan PLS-SEM Final (Bootstrap N={bootstrap_samples}).")
         
-        # Inisialisasi dan Fit Model
-        model = semopy.Model(full_model)
-        res = model.fit(data, algo="PLS")
-        
-        # Bootstrapping untuk Signifikansi
-        boot_res = model.bootstrap(data, nboot=bootstrap_samples)
-        
+        use_native = st.session_state['estimator'] == "Native NumPy (vektorisasi)"
+        precision = st.session_state['bootstrap_precision'] if use_native else 'float64'
+        solver = st.session_state['solver_settings']
+        # Pengaturan solver hanya berlaku untuk estimator native (masuk kunci cache dan argumen `run_analysis`)
+        solver_kwargs = dict(solver) if use_native else {}
+
+        def run_progressive_bootstrap(res):
+            """Bootstrap per batch dengan tabel & diagram sementara yang diperbarui langsung."""
+            live_progress = st.empty()
+            live_table = st.empty()
+            live_plot = st.empty()
+            point_df = res.inspect(mode='estimates')
+            for boot_res, stability in progressive_bootstrap(
+                full_model, data, bootstrap_samples, alpha,
+                seed=st.session_state['bootstrap_seed'],
+                n_jobs=st.session_state['bootstrap_workers'],
+                engine='native' if use_native else 'semopy',
+                fit_kwargs={'scheme': st.session_state['inner_scheme'], 'tol': solver['tol'],
+                            'max_iter': solver['max_iter']} if use_native else None,
+                warm_start=st.session_state['bootstrap_warm_start'],
+                precision=precision,
+                replicate_kwargs={'tol': solver['boot_tol'], 'max_iter': solver['boot_max_iter']} if use_native else None
+            ):
+                n_done = boot_res.replicates.shape[0]
+                live_progress.progress(
+                    n_done / bootstrap_samples,
+                    text=f"Bootstrap progresif: {n_done:,} / {bootstrap_samples:,} replikasi"
+                )
+                running_df = merge_boot_pvalues(point_df, stability)
+                running_df = running_df.merge(stability[['lval', 'op', 'rval', 'MC Error', 'Stabil']],
+                                              on=['lval', 'op', 'rval'], how='left')
+                live_rows = []
+                for i, (from_var, to_var) in enumerate(hypotheses):
+                    row = running_df[(running_df['lval'] == to_var) & (running_df['op'] == '~') & (running_df['rval'] == from_var)]
+                    if not row.empty:
+                        live_rows.append({
+                            'Hipotesis': f"H{i+1}",
+                            'Jalur': f"{from_var} -> {to_var}",
+                            'β': f"{row['Estimate'].iloc[0]:.3f}",
+                            'T-Stat': f"{row['T-stat'].iloc[0]:.3f}",
+                            'P-Value': f"{row['p-value'].iloc[0]:.4f}",
+                            'MC Error (P)': f"±{row['MC Error'].iloc[0]:.4f}",
+                            f'Keputusan Stabil (α={alpha})': "Ya" if row['Stabil'].iloc[0] else "Belum"
+                        })
+                live_table.dataframe(pd.DataFrame(live_rows).set_index('Hipotesis'), use_container_width=True)
+                with profiler.stage("Render diagram sementara"):
+                    live_items = path_diagram_items(hypotheses, running_df)
+                    fig_live = plot_sem_paths(tuple(model_dict), tuple(hypotheses), live_items, alpha)
+                    live_plot.pyplot(fig_live)
+                    plt.close(fig_live)
+
+            live_progress.empty()
+            live_table.empty()
+            live_plot.empty()
+            return boot_res
+
+        # Jumlah worker tidak memengaruhi hasil (replikasi reproducible), jadi tidak masuk kunci
+        with profiler.stage("Fingerprint data & kunci cache"):
+            cache_key = make_cache_key(
+                data, full_model, st.session_state['estimator'],
+                scheme=st.session_state['inner_scheme'],
+                nboot=bootstrap_samples,
+                bootstrap_mode=st.session_state['bootstrap_mode'],
+                seed=st.session_state['bootstrap_seed'],
+                warm_start=st.session_state['bootstrap_warm_start'],
+                precision=precision,
+                **solver_kwargs,
+                # Titik henti bootstrap progresif bergantung pada alpha
+                alpha=alpha if st.session_state['bootstrap_mode'] == "Progresif (early stopping)" else None
+            )
+        analysis_kwargs = dict(
+            engine='native' if use_native else 'semopy',
+            scheme=st.session_state['inner_scheme'],
+            nboot=bootstrap_samples,
+            bootstrap_mode=BOOTSTRAP_MODE_KEYS[st.session_state['bootstrap_mode']],
+            seed=st.session_state['bootstrap_seed'],
+            n_jobs=st.session_state['bootstrap_workers'],
+            warm_start=st.session_state['bootstrap_warm_start'],
+            alpha=alpha,
+            precision=precision,
+            **solver_kwargs
+        )
+
+        def fit_final_model():
+            with profiler.stage("Parsing syntax model"):
+                model = parse_model_syntax(full_model) if use_native else semopy.Model(full_model)
+            with profiler.stage("Fit PLS (model penuh)"):
+                if use_native:
+                    return fit_pls(model, data, scheme=st.session_state['inner_scheme'], tol=solver['tol'],
+                                   max_iter=solver['max_iter'])
+                return model.fit(data, algo="PLS")
+
+        def run_full_analysis():
+            if analysis_kwargs['bootstrap_mode'] != 'progressive':
+                return run_analysis(full_model, data, profiler=profiler, **analysis_kwargs)
+            # Mode progresif di latar depan: tampilkan hasil sementara per batch
+            res = fit_final_model()
+            with profiler.stage(f"Bootstrap (progressive, N={bootstrap_samples:,})"):
+                return res, run_progressive_bootstrap(res)
+
+        fit_cache = get_fit_cache()
+        replicate_store = get_replicate_store()
+        with profiler.stage("Ambil hasil dari cache"):
+            analysis = fit_cache.get(cache_key)
+        if analysis is None:
+            # Replikasi tersimpan: cukup fit ulang sampel penuh, tanpa bootstrap ulang
+            with profiler.stage("Muat replikasi tersimpan"):
+                stored_boot = replicate_store.load(cache_key)
+            if stored_boot is not None:
+                analysis = (fit_final_model(), stored_boot)
+                fit_cache.put(cache_key, analysis)
+        if analysis is None and st.session_state['run_in_background']:
+            job_manager = get_job_manager()
+            session_jobs = st.session_state['analysis_jobs']
+            job = job_manager.get(session_jobs[cache_key]) if cache_key in session_jobs else None
+
+            # Hasil job yang dilepas oleh akuntansi memori diperlakukan seperti job yang belum ada
+            if job is None or job.status in ('gagal', 'dibatalkan') or (job.status == 'selesai' and job.result is None):
+                if job is not None and job.status == 'gagal':
+                    st.error(f"❌ Job {job.job_id} gagal: {job.error}")
+                elif job is not None:
+                    st.info(f"Job {job.job_id} dibatalkan.")
+                if not st.button("🚀 Kirim Analisis sebagai Background Job", type="primary"):
+                    st.stop()
+
+                def analysis_job(job):
+                    # Profiler sendiri: profiler sesi dan tracemalloc hanya disentuh thread UI
+                    job.profiler = StageProfiler()
+                    result = run_analysis(full_model, data, progress=job.report, profiler=job.profiler,
+                                          **analysis_kwargs)
+                    fit_cache.put(cache_key, result)
+                    replicate_store.save(cache_key, result[1])
+                    return result
+
+                label = (f"{st.session_state['estimator']} | {len(model_dict)} LV, {len(hypotheses)} jalur | "
+                         f"{st.session_state['bootstrap_mode']} N={bootstrap_samples:,}")
+                session_jobs[cache_key] = job_manager.submit(label, analysis_job, total=bootstrap_samples)
+                job = job_manager.get(session_jobs[cache_key])
+
+            if job.is_active:
+                # Pembatalan hanya diperiksa di callback progres; bootstrap bawaan semopy tidak melaporkan progres
+                cancellable = analysis_kwargs['bootstrap_mode'] != 'semopy'
+                col_prog, col_refresh, col_cancel = st.columns([6, 2, 2])
+                with col_cancel:
+                    if st.button("⛔ Batalkan Job", disabled=not cancellable,
+                                 help=None if cancellable else "Mode bootstrap semopy tidak dapat dibatalkan di tengah jalan."):
+                        job_manager.cancel(job.job_id)
+                with col_refresh:
+                    st.button("🔄 Perbarui Progres")
+                with col_prog:
+                    st.progress(job.fraction, text=f"{job.job_id} ({job.status}): {job.done:,} / {job.total:,} replikasi bootstrap")
+                st.caption("Anda boleh berpindah halaman; job tetap berjalan dan hasilnya diambil saat halaman ini dibuka kembali.")
+                st.stop()
+            if job.profiler is not None:
+                profiler.merge(job.profiler)
+                job.profiler = None
+            analysis = job.result
+        elif analysis is None:
+            analysis = run_full_analysis()
+            fit_cache.put(cache_key, analysis)
+        res, boot_res = analysis
+        show_solver_status(res, "Fit model penuh")
+        with profiler.stage("Simpan replikasi bootstrap"):
+            replicate_store.save(cache_key, boot_res)
+        if getattr(boot_res, 'n_failed', 0):
+            st.warning(f"{boot_res.n_failed} dari {bootstrap_samples} replikasi bootstrap gagal dan diabaikan.")
+        if getattr(boot_res, 'stopped_early', False):
+            st.info(
+                f"Bootstrap progresif berhenti otomatis pada **{boot_res.replicates.shape[0]:,}** dari "
+                f"{bootstrap_samples:,} replikasi: semua keputusan hipotesis sudah stabil pada α={alpha}."
+            )
+        iter_summary = boot_res.iteration_summary() if hasattr(boot_res, 'iteration_summary') else None
+        if iter_summary:
+            start_label = "warm start" if st.session_state['bootstrap_warm_start'] else "cold start"
+            st.caption(
+                f"Iterasi PLS per replikasi ({start_label}): total **{iter_summary['total']:,}**, "
+                f"rata-rata **{iter_summary['mean']:.2f}**, median **{iter_summary['median']:.0f}**, "
+                f"maksimum **{iter_summary['max']}**."
+                + (f" Δ bobot akhir maksimum **{iter_summary['max_delta']:.1e}**." if 'max_delta' in iter_summary else "")
+                + (f" {iter_summary['near_tol_share']:.1%} iterasi berjalan dekat toleransi."
+                   if 'near_tol_share' in iter_summary else "")
+            )
+        n_nonconverged = getattr(boot_res, 'n_nonconverged', None)
+        if n_nonconverged:
+            if st.session_state['exclude_nonconverged']:
+                # Salinan baru; objek di cache fit dan store replikasi tetap utuh
+                boot_res = boot_res.exclude_nonconverged()
+                st.info(f"{n_nonconverged} replikasi yang tidak konvergen dikeluarkan dari ringkasan bootstrap "
+                        f"(tersisa **{boot_res.n_valid:,}** replikasi valid).")
+            else:
+                st.warning(f"⚠️ {n_nonconverged} replikasi mencapai iterasi maksimum tanpa konvergen dan tetap "
+                           "dipakai. Naikkan iterasi maksimum replikasi atau aktifkan pengecualian di Langkah 2.")
+            with st.expander(f"Telemetri replikasi yang tidak konvergen ({n_nonconverged})"):
+                table = boot_res.solver_table()
+                st.dataframe(table[~table['Konvergen'] & np.isfinite(table['Δ Bobot Akhir'])], hide_index=True,
+                             use_container_width=True)
+
+        if use_native:
+            with st.expander("Laporan akurasi presisi float32 vs float64 (seed yang sama)",
+                             expanded=precision == 'float32'):
+                report_nboot = min(bootstrap_samples, 1000)
+                report_key = make_cache_key(data, full_model, 'precision_report', nboot=report_nboot,
+                                            seed=st.session_state['bootstrap_seed'], scheme=st.session_state['inner_scheme'],
+                                            warm_start=st.session_state['bootstrap_warm_start'], alpha=alpha,
+                                            exclude_nonconverged=st.session_state['exclude_nonconverged'],
+                                            **solver_kwargs)
+                report_df = fit_cache.get(report_key)
+                if report_df is None and st.button(f"Jalankan Laporan Akurasi ({report_nboot:,} replikasi per presisi)"):
+                    with profiler.stage("Laporan akurasi float32"):
+                        report_df = precision_report(
+                            full_model, data, nboot=report_nboot, seed=st.session_state['bootstrap_seed'],
+                            n_jobs=st.session_state['bootstrap_workers'], scheme=st.session_state['inner_scheme'],
+                            warm_start=st.session_state['bootstrap_warm_start'], alpha=alpha, level=1 - alpha,
+                            tol=solver['tol'], max_iter=solver['max_iter'],
+                            replicate_kwargs={'tol': solver['boot_tol'], 'max_iter': solver['boot_max_iter']}
+                        )
+                    fit_cache.put(report_key, report_df)
+                if report_df is not None:
+                    info = report_df.attrs
+                    col_diff, col_time, col_size = st.columns(3)
+                    col_diff.metric("Maks |Δ| Replikasi", f"{info['max_abs_diff']:.2e}",
+                                    help=f"Toleransi penerimaan: {info['tolerance']:.0e}")
+                    col_time.metric("Waktu float32", f"{info['seconds_float32']:.2f} s",
+                                    delta=f"{info['seconds_float32'] - info['seconds_float64']:+.2f} s vs float64",
+                                    delta_color="inverse")
+                    col_size.metric("Ukuran Replikasi float32", f"{info['bytes_float32'] / 2**10:.0f} KB",
+                                    delta=f"{(info['bytes_float32'] - info['bytes_float64']) / 2**10:+.0f} KB vs float64",
+                                    delta_color="inverse")
+                    if info['accepted']:
+                        st.success(f"Mode float32 memenuhi toleransi pada {info['n_compared']:,} replikasi berpasangan "
+                                   f"dan semua keputusan signifikansi (α={alpha}) sama.")
+                    else:
+                        st.warning("Mode float32 melampaui toleransi atau mengubah keputusan signifikansi; "
+                                   "gunakan float64 untuk data ini.")
+                    st.dataframe(report_df.assign(**{'Keputusan Sama': np.where(report_df['Keputusan Sama'], "Ya", "Tidak")}),
+                                 hide_index=True, use_container_width=True)
+
         st.success("Analisis selesai! Lihat hasil di bawah.")
         
-        path_df = res.inspect(mode='estimates')
-        boot_df = boot_res.inspect(mode='estimates')
+        with profiler.stage("Inspect hasil (estimasi & bootstrap)"):
+            path_df = res.inspect(mode='estimates')
+            boot_df = boot_res.inspect(mode='estimates')
         
         # --- PATH VISUALIZATION (SmartPLS-like) ---
         st.markdown("---")
@@ -534,29 +1167,59 @@ elif page == "4. Hasil Analisis":
         st.markdown(f"**Keterangan:** Garis tebal/hijau = Signifikan ($P < \\alpha={alpha}$), Garis putus-putus/merah = Tidak Signifikan.")
         
         # Merge path data with p-values
-        try:
-            path_df = path_df.merge(boot_df[['lval', 'op', 'rval', 'T-stat', 'p-value']], 
-                                    on=['lval', 'op', 'rval'], 
-                                    how='left', suffixes=('', '_boot'))
-            path_df['p-value'] = path_df['p-value_boot'].fillna(path_df['p-value'])
-            path_df = path_df.drop(columns=['p-value_boot'], errors='ignore')
-        except:
-            pass
+        path_df = merge_boot_pvalues(path_df, boot_df)
         
-        # Generate Plot
+        # Generate Plot (gambar di-cache per model, estimasi dan alpha)
+        diagram_svg = None
         try:
-            fig_path = plot_sem_paths(model_dict, hypotheses, path_df, alpha)
-            st.pyplot(fig_path)
+            diagram_args = (tuple(model_dict), tuple(map(tuple, hypotheses)), path_diagram_items(hypotheses, path_df), alpha)
+            with profiler.stage("Render path diagram (PNG + SVG)"):
+                diagram_png = render_path_diagram(*diagram_args)
+                diagram_svg = render_path_diagram(*diagram_args, fmt='svg')
+            st.image(diagram_png)
+            st.download_button(
+                "Unduh Path Diagram (SVG)", diagram_svg,
+                file_name="path_diagram.svg", mime="image/svg+xml"
+            )
         except Exception as plot_e:
             st.warning(f"Gagal menampilkan Path Diagram: {plot_e}. Periksa urutan LV.")
 
         st.markdown("---")
         
         # --- TABULAR RESULTS ---
-        tab_hyp, tab_outer, tab_r2 = st.tabs(["Uji Hipotesis", "Model Pengukuran (Outer Model)", "Koefisien Determinasi (R²)"])
+        tab_names = ["Uji Hipotesis", "Efek Tidak Langsung & Total", "Model Pengukuran (Outer Model)",
+                     "Koefisien Determinasi (R²)", "Relevansi Prediktif (Q²)"]
+        group_col = st.session_state['mga_group_col']
+        if group_col is not None and group_col in data.columns:
+            tab_names.append(f"Multi-Grup (MGA: {group_col})")
+        tab_hyp, tab_effects, tab_outer, tab_r2, tab_q2, *tab_mga = st.tabs(tab_names)
+        # Tabel yang ditampilkan di tab, dikumpulkan untuk paket ekspor (tanpa menghitung ulang)
+        report_tables = {}
 
         with tab_hyp:
             st.write("#### Uji Hipotesis (Inner Model)")
+
+            # Interval kepercayaan dihitung dari replikasi tersimpan (tanpa bootstrap ulang)
+            ci_df = None
+            jackknife = None
+            ci_methods = {"Percentile": 'percentile', "Bias-corrected (BC)": 'bc', "BCa (jackknife)": 'bca'}
+            ci_label = "Percentile"
+            if hasattr(boot_res, 'confidence_intervals'):
+                ci_label = st.selectbox("Metode Interval Kepercayaan Bootstrap", list(ci_methods.keys()),
+                                        help="BCa menambah n fit leave-one-out (estimator native, batch) untuk koreksi percepatan.")
+                if ci_methods[ci_label] == 'bca':
+                    with profiler.stage("Jackknife (BCa)"):
+                        jackknife = fit_cache.get_or_compute(
+                            make_cache_key(data, full_model, 'jackknife', scheme=st.session_state['inner_scheme'],
+                                           tol=solver['tol'], max_iter=solver['max_iter'],
+                                           exclude_nonconverged=st.session_state['exclude_nonconverged']),
+                            lambda: jackknife_estimates(full_model, data, scheme=st.session_state['inner_scheme'],
+                                                        n_jobs=st.session_state['bootstrap_workers'],
+                                                        tol=solver['tol'], max_iter=solver['max_iter'])
+                        )
+                with profiler.stage("Interval kepercayaan bootstrap"):
+                    ci_df = boot_res.confidence_intervals(level=1 - alpha, method=ci_methods[ci_label], jackknife=jackknife)
+            ci_pct = f"{(1 - alpha) * 100:.0f}%"
             
             hyp_table = []
             for i, (from_var, to_var) in enumerate(hypotheses):
@@ -570,7 +1233,7 @@ elif page == "4. Hasil Analisis":
                     decision = "Diterima" if p_val < alpha and beta > 0 else "Ditolak"
                     sign = "Positif" if beta > 0 else "Negatif"
                     
-                    hyp_table.append({
+                    hyp_row = {
                         'Hipotesis': f"H{i+1}",
                         'Jalur': f"{from_var} -> {to_var}",
                         'β (Koef. Jalur)': f"{beta:.3f}",
@@ -578,34 +1241,299 @@ elif page == "4. Hasil Analisis":
                         'P-Value': f"{p_val:.3f}",
                         'Arah': sign,
                         f'Keputusan (α={alpha})': decision
-                    })
+                    }
+                    if ci_df is not None:
+                        ci_row = ci_df[(ci_df['lval'] == to_var) & (ci_df['op'] == '~') & (ci_df['rval'] == from_var)]
+                        if not ci_row.empty:
+                            ci_lo, ci_hi = ci_row['CI Lower'].iloc[0], ci_row['CI Upper'].iloc[0]
+                            hyp_row[f'CI {ci_pct}'] = f"[{ci_lo:.3f}, {ci_hi:.3f}]"
+                            hyp_row['CI Memuat 0'] = "Ya" if ci_lo <= 0 <= ci_hi else "Tidak"
+                    hyp_table.append(hyp_row)
             
             hyp_df = pd.DataFrame(hyp_table)
             st.dataframe(hyp_df.set_index('Hipotesis'), use_container_width=True)
+            report_tables["Uji Hipotesis"] = hyp_df
             
             st.markdown("##### Interpretasi Singkat:")
             for _, row in hyp_df.iterrows():
                 decision_emoji = "✅" if row[f'Keputusan (α={alpha})'] == 'Diterima' else "❌"
                 st.markdown(f"{decision_emoji} **{row['Hipotesis']} ({row['Jalur']}):** Hubungan **{row['Arah']}** dan **{row[f'Keputusan (α={alpha})']}** (β={row['β (Koef. Jalur)']}, P={row['P-Value']}).")
 
+        with tab_effects:
+            st.write("#### Efek Tidak Langsung Spesifik, Tidak Langsung Total & Total")
+            try:
+                with profiler.stage("Efek mediasi (batch replikasi)"):
+                    effects_df = mediation_table(full_model, path_df, boot_res, level=1 - alpha,
+                                                 method=ci_methods[ci_label], jackknife=jackknife)
+            except ValueError as eff_e:
+                st.warning(f"Efek tidak langsung tidak dapat dihitung: {eff_e}")
+            else:
+                if not effects_df.attrs['n_chains']:
+                    st.info("Model tidak memiliki rantai mediasi (jalur X -> M -> Y); hanya efek total yang ditampilkan.")
+                effect_cols = ['Jenis', 'Jalur', 'Estimate']
+                if 'p-value' in effects_df:
+                    effects_df[f'Signifikan (α={alpha})'] = np.where(effects_df['p-value'] < alpha, "Ya", "Tidak")
+                    effects_df['CI Memuat 0'] = np.where(
+                        (effects_df['CI Lower'] <= 0) & (effects_df['CI Upper'] >= 0), "Ya", "Tidak"
+                    )
+                    effect_cols += ['Std. Err', 'T-stat', 'p-value', 'CI Lower', 'CI Upper',
+                                    'CI Memuat 0', f'Signifikan (α={alpha})']
+                st.dataframe(effects_df[effect_cols], column_config={
+                    col: st.column_config.NumberColumn(format="%.3f")
+                    for col in ['Estimate', 'Std. Err', 'T-stat', 'p-value', 'CI Lower', 'CI Upper']
+                }, hide_index=True, use_container_width=True)
+                report_tables["Efek Tidak Langsung & Total"] = effects_df[effect_cols]
+                if 'p-value' in effects_df:
+                    st.caption(f"Interval {ci_pct} metode {ci_label} dari {effects_df.attrs['n_valid']:,} replikasi bootstrap "
+                               "valid (koefisien jalur replikasi yang sama, tanpa bootstrap ulang).")
+                else:
+                    st.caption("Mode bootstrap ini tidak menyimpan replikasi; hanya estimasi titik yang tersedia.")
+
         with tab_outer:
             st.write("#### Evaluasi Outer Model (Validitas & Reliabilitas)")
-            loadings = res.inspect(lv='all', rv='all', col='Loading', std=True, pretty_names=True)
+            with profiler.stage("Inspect hasil (loadings)"):
+                loadings = res.inspect(lv='all', rv='all', col='Loading', std=True, pretty_names=True)
             loadings = loadings[loadings['op'] == '=~'].rename(columns={'lval': 'Konstrak', 'rval': 'Indikator', 'Estimate': 'Loading'})
             loadings = loadings.sort_values(by='Konstrak')
             
+            loading_cols = ['Konstrak', 'Indikator', 'Loading']
+            if ci_df is not None:
+                # Interval loading memakai metode yang dipilih di tab Uji Hipotesis
+                loadings = loadings.merge(
+                    ci_df[ci_df['op'] == '=~'].rename(columns={'lval': 'Konstrak', 'rval': 'Indikator'})[['Konstrak', 'Indikator', 'CI Lower', 'CI Upper']],
+                    on=['Konstrak', 'Indikator'], how='left'
+                )
+                loading_cols += ['CI Lower', 'CI Upper']
+
             st.markdown("##### Loading Factors (Indikator yang telah valid)")
-            st.dataframe(loadings[['Konstrak', 'Indikator', 'Loading']].reset_index(drop=True), use_container_width=True)
-            
-            st.markdown("##### Composite Reliability (CR) & Average Variance Extracted (AVE)")
-            st.warning("Perhitungan CR dan AVE di `semopy` mungkin memerlukan proses yang lebih kompleks, ini adalah ringkasan yang disederhanakan.")
-            
-            st.dataframe(res.inspect(mode='variances'), use_container_width=True)
+            st.dataframe(loadings[loading_cols].reset_index(drop=True), use_container_width=True)
+            report_tables["Loading Factors"] = loadings[loading_cols].reset_index(drop=True)
+            if ci_df is not None:
+                st.caption(f"Interval {ci_pct} metode {ci_label}.")
+
+            if len(model_dict) > 1:
+                st.markdown(f"##### Validitas Diskriminan: HTMT (Bootstrap N={bootstrap_samples:,})")
+                with profiler.stage("HTMT + bootstrap korelasi"):
+                    htmt_df = fit_cache.get_or_compute(
+                        make_cache_key(data, full_model, 'htmt', nboot=bootstrap_samples, level=1 - alpha,
+                                       seed=st.session_state['bootstrap_seed'], precision=precision),
+                        lambda: htmt_bootstrap(full_model, data, bootstrap_samples, level=1 - alpha,
+                                               seed=st.session_state['bootstrap_seed'],
+                                               n_jobs=st.session_state['bootstrap_workers'], precision=precision)
+                    )
+                htmt_df = htmt_df.assign(**{
+                    f'Valid (CI Upper < {HTMT_THRESHOLD})': np.where(htmt_df['CI Upper'] < HTMT_THRESHOLD, "Ya", "Tidak")
+                })
+                st.dataframe(htmt_df, column_config={col: st.column_config.NumberColumn(format="%.3f")
+                                                     for col in ['HTMT', 'Sample Mean', 'CI Lower', 'CI Upper']},
+                             hide_index=True, use_container_width=True)
+                st.caption(f"Interval {(1 - alpha) * 100:.0f}% dari {htmt_df.attrs['n_valid']:,} matriks korelasi resample.")
+                report_tables["HTMT"] = htmt_df
+
+                st.markdown("##### Kriteria Fornell-Larcker")
+                with profiler.stage("Fornell-Larcker"):
+                    fl_df = fornell_larcker(res, full_model, data, scheme=st.session_state['inner_scheme'])
+                st.dataframe(fl_df.style.format("{:.3f}", na_rep=""), use_container_width=True)
+                report_tables["Fornell-Larcker"] = fl_df.rename_axis('Konstrak').reset_index()
+                fl_violations = fornell_larcker_violations(fl_df)
+                if fl_violations:
+                    st.warning("Korelasi melebihi √AVE: " + ", ".join(f"{a} – {b} ({corr:.3f})" for a, b, corr in fl_violations))
+                else:
+                    st.success("Semua konstrak memenuhi kriteria Fornell-Larcker (√AVE > korelasi antar konstrak).")
+
+            st.markdown("##### Reliabilitas Konstrak & Average Variance Extracted (AVE)")
+            with profiler.stage("Reliabilitas konstrak"):
+                rel_df = reliability_table(res, full_model, data, scheme=st.session_state['inner_scheme'])
+            rel_df = rel_df.assign(**{
+                'Reliabel (≥ 0.70)': np.where(rel_df[RELIABILITY_COLS[:3]].min(axis=1) >= 0.7, "Ya", "Tidak"),
+                'Valid Konvergen (AVE ≥ 0.50)': np.where(rel_df['AVE'] >= 0.5, "Ya", "Tidak"),
+            })
+            st.dataframe(rel_df, column_config={col: st.column_config.NumberColumn(format="%.3f") for col in RELIABILITY_COLS},
+                         use_container_width=True)
+            st.caption("Batas umum: Cronbach's Alpha, rho_A dan CR ≥ 0.70; AVE ≥ 0.50 (validitas konvergen).")
+            report_tables["Reliabilitas & AVE"] = rel_df.reset_index()
+
+            try:
+                with profiler.stage("Interval bootstrap reliabilitas"):
+                    rel_ci_df = fit_cache.get_or_compute(
+                        make_cache_key(data, full_model, 'reliability', analysis=cache_key, level=1 - alpha,
+                                       exclude_nonconverged=st.session_state['exclude_nonconverged'], **solver_kwargs),
+                        lambda: reliability_bootstrap(res, boot_res, full_model, data, level=1 - alpha,
+                                                      scheme=st.session_state['inner_scheme'],
+                                                      n_jobs=st.session_state['bootstrap_workers'])
+                    )
+            except ValueError as rel_e:
+                st.info(f"Interval bootstrap reliabilitas tidak tersedia: {rel_e}")
+            else:
+                with st.expander(f"Interval kepercayaan bootstrap {(1 - alpha) * 100:.0f}% (replikasi yang sama dengan koefisien jalur)"):
+                    st.dataframe(rel_ci_df, column_config={col: st.column_config.NumberColumn(format="%.3f")
+                                                           for col in ['Estimate', 'Sample Mean', 'CI Lower', 'CI Upper']},
+                                 hide_index=True, use_container_width=True)
+                    st.caption(f"Dihitung dari {rel_ci_df.attrs['n_valid']:,} replikasi bootstrap valid.")
+                report_tables["Interval Reliabilitas"] = rel_ci_df
 
         with tab_r2:
             st.write("#### R-squared ($R^2$) - Koefisien Determinasi")
-            r2_df = res.inspect(mode='r2')
+            with profiler.stage("Inspect hasil (R²)"):
+                r2_df = res.inspect(mode='r2')
             st.dataframe(r2_df, use_container_width=True)
+            report_tables["R²"] = r2_df
+
+        with tab_q2:
+            st.write("#### Relevansi Prediktif (Estimator Native)")
+            col_d, col_k, col_rep = st.columns(3)
+            with col_d:
+                omission_distance = st.number_input("Omission Distance (D)", min_value=2, max_value=25, value=7,
+                                                    help="Disarankan 5-10 dan tidak membagi habis jumlah responden.")
+            with col_k:
+                n_folds = st.number_input("Jumlah Fold (k)", min_value=2, max_value=20, value=10)
+            with col_rep:
+                n_repeats = st.number_input("Repetisi k-fold", min_value=1, max_value=100, value=10)
+
+            st.markdown("##### Q² Stone-Geisser (Blindfolding, Cross-validated Redundancy)")
+            q2_key = make_cache_key(data, full_model, 'blindfolding', D=int(omission_distance),
+                                    scheme=st.session_state['inner_scheme'])
+            q2_df = fit_cache.get(q2_key)
+            if q2_df is None and st.button(f"🚀 Jalankan Blindfolding (D={int(omission_distance)})"):
+                with profiler.stage("Blindfolding Q²"):
+                    q2_df = blindfolding(full_model, data, int(omission_distance), scheme=st.session_state['inner_scheme'])
+                fit_cache.put(q2_key, q2_df)
+            if q2_df is not None:
+                if q2_df.attrs.get('divides_n'):
+                    st.warning(f"Jumlah responden habis dibagi D={int(omission_distance)}; pilih omission distance lain agar pola penghapusan tidak berulang per baris.")
+                q2_df = q2_df.assign(**{'Relevansi Prediktif': np.where(q2_df['Q²'] > 0, "Ya (Q² > 0)", "Tidak")})
+                st.dataframe(q2_df, column_config={"Q²": st.column_config.NumberColumn(format="%.3f")},
+                             hide_index=True, use_container_width=True)
+                report_tables["Q² Blindfolding"] = q2_df
+
+            st.markdown(f"##### PLSpredict ({int(n_folds)}-fold × {int(n_repeats)} repetisi) vs Benchmark Model Linear")
+            predict_key = make_cache_key(data, full_model, 'plspredict', k=int(n_folds), repeats=int(n_repeats),
+                                         seed=st.session_state['bootstrap_seed'], scheme=st.session_state['inner_scheme'])
+            predict_df = fit_cache.get(predict_key)
+            if predict_df is None and st.button(f"🚀 Jalankan PLSpredict ({int(n_folds) * int(n_repeats):,} fit per indikator)"):
+                predict_progress = st.progress(0.0, text="PLSpredict...")
+                with profiler.stage("PLSpredict k-fold"):
+                    predict_df = pls_predict(
+                        full_model, data, k=int(n_folds), repeats=int(n_repeats), seed=st.session_state['bootstrap_seed'],
+                        n_jobs=st.session_state['bootstrap_workers'], scheme=st.session_state['inner_scheme'],
+                        progress=lambda done, total: predict_progress.progress(done / total, text=f"Repetisi: {done:,} / {total:,}")
+                    )
+                predict_progress.empty()
+                fit_cache.put(predict_key, predict_df)
+            if predict_df is not None:
+                st.dataframe(predict_df.round(4), hide_index=True, use_container_width=True)
+                report_tables["PLSpredict"] = predict_df
+                st.info(f"Daya prediksi model: **{predictive_power(predict_df)}** "
+                        f"({int((predict_df['RMSE PLS - LM'] < 0).sum())} dari {len(predict_df)} indikator endogen memiliki RMSE PLS lebih kecil dari LM).")
+
+        if tab_mga:
+            with tab_mga[0]:
+                st.write(f"#### Analisis Multi-Grup berdasarkan `{group_col}`")
+                st.caption("Model di-fit terpisah per grup dengan estimator native. Selisih koefisien antar pasangan grup "
+                           "diuji dengan uji permutasi label grup; bootstrap dijalankan per grup.")
+                n_perm = int(st.session_state['mga_permutations'])
+                mga_key = make_cache_key(
+                    data, full_model, 'mga', group_col=group_col, scheme=st.session_state['inner_scheme'],
+                    nboot=bootstrap_samples, n_perm=n_perm, seed=st.session_state['bootstrap_seed'],
+                    warm_start=st.session_state['bootstrap_warm_start'], precision=precision,
+                    tol=solver['tol'], max_iter=solver['max_iter']
+                )
+                mga = fit_cache.get(mga_key)
+                if mga is None and st.button(f"🚀 Jalankan MGA ({n_perm:,} permutasi per pasangan grup)"):
+                    mga_progress = st.progress(0.0, text="Uji permutasi...")
+                    with profiler.stage("Analisis multi-grup (MGA)"):
+                        mga = multigroup_analysis(
+                            full_model, data, group_col, hypotheses, nboot=bootstrap_samples, n_perm=n_perm,
+                            seed=st.session_state['bootstrap_seed'], n_jobs=st.session_state['bootstrap_workers'],
+                            scheme=st.session_state['inner_scheme'], warm_start=st.session_state['bootstrap_warm_start'],
+                            precision=precision, tol=solver['tol'], max_iter=solver['max_iter'],
+                            progress=lambda done, total: mga_progress.progress(done / total, text=f"Uji permutasi: {done:,} / {total:,}")
+                        )
+                    mga_progress.empty()
+                    fit_cache.put(mga_key, mga)
+                if mga is not None:
+                    st.markdown("##### Ukuran Grup")
+                    st.dataframe(pd.DataFrame({'Grup': list(mga['sizes']), 'N': list(mga['sizes'].values())}).set_index('Grup').T,
+                                 use_container_width=True)
+
+                    st.markdown(f"##### Koefisien Jalur per Grup (Bootstrap N={bootstrap_samples:,})")
+                    st.dataframe(mga['bootstrap_table'].set_index('Jalur').style.format("{:.3f}"), use_container_width=True)
+
+                    st.markdown("##### Uji Permutasi Selisih Koefisien Jalur")
+                    perm_df = mga['permutation']
+                    perm_paths = perm_df[perm_df['op'] == '~'].copy()
+                    perm_paths.insert(2, 'Jalur', perm_paths['rval'] + " -> " + perm_paths['lval'])
+                    perm_paths[f'Berbeda Signifikan (α={alpha})'] = np.where(perm_paths['p-value (permutasi)'] < alpha, "Ya", "Tidak")
+                    st.dataframe(
+                        perm_paths.drop(columns=['lval', 'op', 'rval']).reset_index(drop=True),
+                        column_config={col: st.column_config.NumberColumn(format="%.4f")
+                                       for col in ['Estimate A', 'Estimate B', 'Selisih', 'p-value (permutasi)']},
+                        use_container_width=True
+                    )
+                    with st.expander("Uji permutasi selisih outer loading"):
+                        st.dataframe(perm_df[perm_df['op'] == '=~'].reset_index(drop=True), use_container_width=True)
+                    report_tables["MGA Koefisien per Grup"] = mga['bootstrap_table']
+                    report_tables["MGA Uji Permutasi"] = perm_paths.drop(columns=['lval', 'op', 'rval'])
+
+        # --- EKSPOR PAKET HASIL ---
+        st.markdown("---")
+        st.subheader("Ekspor Paket Hasil")
+        st.caption("Tabel di atas, replikasi bootstrap (.npz) dan laporan HTML statis berisi path diagram disusun dari "
+                   "hasil yang sudah di-cache oleh job latar belakang, tanpa fit ulang. Laporan HTML dapat dicetak ke PDF "
+                   "dari browser.")
+        export_fmt = st.selectbox("Format Tabel Ekspor", TABLE_FORMATS,
+                                  help="Parquet lebih ringkas dan mempertahankan tipe kolom; CSV untuk spreadsheet.")
+        report_meta = {
+            'Estimator': st.session_state['estimator'],
+            'Skema Inner': st.session_state['inner_scheme'],
+            'Responden': len(data),
+            'Mode Bootstrap': st.session_state['bootstrap_mode'],
+            'Replikasi Bootstrap': bootstrap_samples,
+            'Seed': st.session_state['bootstrap_seed'],
+            'Presisi': precision,
+            'Alpha': alpha,
+            'Interval Kepercayaan': ci_label,
+        }
+        report_key = make_cache_key(
+            data, full_model, 'report', analysis=cache_key, fmt=export_fmt, meta=report_meta,
+            tables={name: fingerprint_frame(df) for name, df in report_tables.items()}
+        )
+        report = fit_cache.get(report_key)
+        if report is None:
+            job_manager = get_job_manager()
+            export_jobs = st.session_state['export_jobs']
+            job = job_manager.get(export_jobs[report_key]) if report_key in export_jobs else None
+            # Hasil job yang dilepas oleh akuntansi memori diperlakukan seperti job yang belum ada
+            if job is None or job.status in ('gagal', 'dibatalkan') or (job.status == 'selesai' and job.result is None):
+                if job is not None and job.status == 'gagal':
+                    st.error(f"❌ Ekspor {job.job_id} gagal: {job.error}")
+                if st.button("📦 Siapkan Paket Ekspor"):
+                    tables = dict(report_tables)
+
+                    def export_job(job):
+                        bundle = export_bundle(tables, boot_res, diagram_svg, report_meta, fmt=export_fmt,
+                                               progress=job.report)
+                        result = (bundle, html_report("Laporan Analisis SEM-PLS", tables, diagram_svg, report_meta))
+                        fit_cache.put(report_key, result)
+                        return result
+
+                    export_jobs[report_key] = job_manager.submit(f"Ekspor hasil | {len(tables)} tabel", export_job)
+                    job = job_manager.get(export_jobs[report_key])
+            if job is not None and job.is_active:
+                col_prog, col_refresh = st.columns([8, 2])
+                with col_refresh:
+                    st.button("🔄 Perbarui Progres Ekspor")
+                with col_prog:
+                    st.progress(job.fraction, text=f"{job.job_id} ({job.status}): {job.done} / {job.total or '?'} berkas")
+            elif job is not None and job.status == 'selesai':
+                report = job.result
+        if report is not None:
+            bundle, report_html = report
+            col_zip, col_html = st.columns(2)
+            col_zip.download_button(f"Unduh Paket Hasil (ZIP, {len(bundle) / 2**20:.2f} MB)", bundle,
+                                    file_name="hasil_sempls.zip", mime="application/zip")
+            col_html.download_button("Unduh Laporan (HTML)", report_html.encode('utf-8'),
+                                     file_name="laporan_sempls.html", mime="text/html")
 
     except Exception as e:
         st.error(f"❌ Terjadi Error dalam menjalankan analisis PLS-SEM: {str(e)}")
@@ -619,6 +1547,23 @@ elif page == "4. Hasil Analisis":
         """)
         
 
+# --- Daftar Job Latar Belakang (Sidebar) ---
+if st.session_state.get('analysis_jobs'):
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("#### 📋 Job Analisis")
+    for job_id in st.session_state['analysis_jobs'].values():
+        job = get_job_manager().get(job_id)
+        if job is None:
+            continue
+        st.sidebar.caption(f"**{job.job_id}** · {job.status} · {job.done:,}/{job.total or 0:,}\n\n{job.label}")
+        if job.is_active:
+            st.sidebar.progress(job.fraction)
+
+if profiler_box is not None:
+    with profiler_box:
+        st.markdown("#### ⏱️ Profil Tahap")
+        render_profiler_panel(profiler, st, file_name="sempls_trace.json")
+
 st.markdown("---")
 # Tombol reset
 if st.sidebar.button("Mulai Baru / Reset Aplikasi"):
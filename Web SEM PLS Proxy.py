@@ -4,6 +4,9 @@ import numpy as np
 import statsmodels.api as sm
 from io import StringIO
 
+from pls_memory import MemoryGovernor, render_memory_panel, streamlit_session_id
+from pls_profile import StageProfiler, render_profiler_panel
+
 # --- Header Profil ---
 st.markdown("""
     <div style="display: flex; align-items: center; gap: 20px;">
@@ -345,13 +348,40 @@ berdasarkan model: $\mathbf{X} \\rightarrow \mathbf{Y}$ dan $\mathbf{X}, \mathbf
 * $\mathbf{Z}$: Kinerja Pegawai (Dependent)
 """)
 
+# --- Profil Per Tahap (Sidebar) ---
+if 'profiler' not in st.session_state:
+    st.session_state['profiler'] = StageProfiler()
+profiler = st.session_state['profiler']
+show_profiler = st.sidebar.checkbox("⏱️ Tampilkan profil per tahap", key='show_profiler')
+profiler.trace_memory = show_profiler and st.sidebar.checkbox(
+    "Lacak puncak alokasi Python (tracemalloc, lebih lambat)", key='profile_memory'
+)
+profiler.begin_run("Analisis Proxy")
+
+
+@st.cache_resource
+def get_memory_governor():
+    """Akuntansi memori semua sesi aplikasi proxy."""
+    governor = MemoryGovernor()
+    governor.register_evictable('profiler', lambda state, key: state[key].clear())
+    return governor
+
+
+memory_governor = get_memory_governor()
+session_id = streamlit_session_id()
+memory_governor.account(session_id, st.session_state, app="Web SEM PLS Proxy")
+if st.sidebar.checkbox("🧠 Tampilkan memori sesi", key='show_memory'):
+    st.sidebar.markdown("#### 🧠 Memori Sesi")
+    render_memory_panel(memory_governor, session_id, st.sidebar)
+
 st.header("1. Upload Data")
 uploaded_file = st.file_uploader("Unggah file data kuesioner Anda (.csv)", type="csv")
 
 if uploaded_file is not None:
     try:
         # Menggunakan delimiter ';' sesuai data sebelumnya
-        df = pd.read_csv(uploaded_file, delimiter=';')
+        with profiler.stage("Parsing CSV", file=uploaded_file.name, size=uploaded_file.size):
+            df = pd.read_csv(uploaded_file, delimiter=';')
         
         # Validasi kolom yang dibutuhkan
         all_required_cols = [col for key in INDICATORS for col in INDICATORS[key]['cols']]
@@ -379,14 +409,16 @@ if uploaded_file is not None:
             if st.button("Jalankan Analisis SEM PLS (Proxy)"):
                 st.markdown("---")
                 with st.spinner('Sedang melakukan pengujian validitas dan analisis jalur...'):
-                    status, results = analyze_data(df, threshold_validity=threshold, alpha=alpha)
+                    with profiler.stage("analyze_data (validitas & regresi jalur)"):
+                        status, results = analyze_data(df, threshold_validity=threshold, alpha=alpha)
                     
                     if status.startswith("Error"):
                         st.error(status)
                     else:
                         results['threshold'] = threshold
                         results['alpha'] = alpha
-                        display_report(results, alpha)
+                        with profiler.stage("display_report (tabel & laporan)"):
+                            display_report(results, alpha)
 
     except Exception as e:
         # Menangkap semua kesalahan umum selama pemrosesan data
@@ -395,3 +427,8 @@ if uploaded_file is not None:
 else:
 
     st.info("Silakan unggah file CSV Anda untuk memulai analisis.")
+
+if show_profiler:
+    with st.sidebar:
+        st.markdown("#### ⏱️ Profil Tahap")
+        render_profiler_panel(profiler, st, file_name="sempls_proxy_trace.json")
@@ -0,0 +1,194 @@
+"""Analisis SEM-PLS headless untuk banyak dataset sekaligus (alur halaman 2 → 3 → 4 tanpa browser).
+
+Contoh:
+    python pls_batch.py model.json "survei/gelombang_*.csv" --output hasil/ --jobs 4
+
+File spesifikasi (JSON):
+    {
+        "latent_vars": {"X1": ["X1.1", "X1.2", "X1.3"], "Y": ["Y1", "Y2", "Y3"]},
+        "paths": [["X1", "Y"]],
+        "alpha": 0.05,
+        "bootstrap_samples": 5000,
+        "loading_threshold": 0.708,
+        "engine": "native",
+        "csv": {"sep": ";"}
+    }
+Kunci lain yang opsional: inner_scheme, bootstrap_mode, seed, warm_start, ci_method, precision
+('float64' atau 'float32', hanya engine native), tol, max_iter, bootstrap_tol, bootstrap_max_iter,
+exclude_nonconverged, id_column.
+
+Dengan `--stream`, setiap file dibaca per chunk dan hanya rata-rata serta
+matriks kovarians indikator yang disimpan (memori O(p²), cocok untuk puluhan
+juta baris). Mode ini memakai estimator native tanpa bootstrap.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from pls_cache import ReplicateStore
+from pls_data import read_upload, stream_moments
+from pls_pipeline import load_spec, run_moments_pipeline, run_pipeline, validate_spec
+from pls_report import TABLE_FORMATS, html_report
+
+
+def collect_inputs(patterns):
+    """Daftar file data dari direktori, glob atau path langsung (urut, tanpa duplikat)."""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [os.path.join(pattern, name) for name in os.listdir(pattern)
+                       if name.lower().endswith(('.csv', '.parquet', '.feather'))]
+        else:
+            matches = glob.glob(pattern)
+        for path in sorted(matches):
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def dataset_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def write_table(df, path_base, fmt):
+    if fmt == 'parquet':
+        df.to_parquet(f"{path_base}.parquet", index=False)
+    else:
+        df.to_csv(f"{path_base}.csv", index=False)
+
+
+def process_dataset(path, spec, output_dir, fmt=TABLE_FORMATS[0], bootstrap_jobs=1, replicate_dir=None, stream_chunk=None,
+                    report=False):
+    """Jalankan pipeline untuk satu file data dan tulis tabelnya ke `output_dir/<nama dataset>/`.
+
+    `stream_chunk` (jumlah baris per chunk) mengaktifkan mode out-of-core.
+    `report` menambahkan `laporan.html` statis berisi semua tabel.
+    Error dicatat di ringkasan, bukan dilempar, agar dataset lain tetap diproses.
+    """
+    name = dataset_name(path)
+    target = os.path.join(output_dir, name)
+    summary = {'dataset': name, 'file': path}
+    started = time.perf_counter()
+    try:
+        if stream_chunk:
+            parse_started = time.perf_counter()
+            indicators = list(dict.fromkeys(ind for inds in spec['latent_vars'].values() for ind in inds))
+            moments = stream_moments(path, columns=indicators, chunk_size=stream_chunk, **spec['csv'])
+            ingest_info = {'parse_seconds': time.perf_counter() - parse_started}
+            result = run_moments_pipeline(moments, spec)
+        else:
+            data, ingest_info = read_upload(path, **spec['csv'])
+            store = ReplicateStore(replicate_dir) if replicate_dir else None
+            result = run_pipeline(data, spec, n_jobs=bootstrap_jobs, replicate_store=store)
+        os.makedirs(target, exist_ok=True)
+        write_table(result['hypotheses'], os.path.join(target, 'hipotesis'), fmt)
+        write_table(result['loadings'], os.path.join(target, 'loadings'), fmt)
+        write_table(result['r2'], os.path.join(target, 'r2'), fmt)
+        write_table(result['effects'], os.path.join(target, 'efek'), fmt)
+        summary.update(result['summary'], status='selesai', parse_detik=ingest_info['parse_seconds'])
+        if report:
+            tables = {'Uji Hipotesis': result['hypotheses'], 'Efek Tidak Langsung & Total': result['effects'],
+                      'Loading Factors': result['loadings'], 'R²': result['r2']}
+            meta = {key: val for key, val in summary.items() if not isinstance(val, (list, dict))}
+            with open(os.path.join(target, 'laporan.html'), 'w', encoding='utf-8') as f:
+                f.write(html_report(f"Laporan Analisis SEM-PLS: {name}", tables, meta=meta))
+    except Exception as e:
+        summary.update(status='gagal', error=f"{type(e).__name__}: {e}")
+    summary['total_detik'] = time.perf_counter() - started
+    if summary['status'] == 'selesai':
+        with open(os.path.join(target, 'ringkasan.json'), 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+    return summary
+
+
+def run_batch(spec, inputs, output_dir, jobs=None, fmt=TABLE_FORMATS[0], bootstrap_jobs=1, replicate_dir=None, stream_chunk=None,
+              log=None, report=False):
+    """Proses semua dataset di process pool; kembalikan DataFrame ringkasan per dataset."""
+    os.makedirs(output_dir, exist_ok=True)
+    names = [dataset_name(p) for p in inputs]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Nama dataset ganda (folder output akan bertabrakan): {', '.join(duplicates)}")
+
+    summaries = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(process_dataset, path, spec, output_dir, fmt, bootstrap_jobs, replicate_dir, stream_chunk,
+                               report)
+                   for path in inputs]
+        for k, future in enumerate(as_completed(futures), start=1):
+            summary = future.result()
+            summaries.append(summary)
+            if log is not None:
+                if 'error' in summary:
+                    detail = summary['error']
+                elif summary['hipotesis_diterima'] is None:
+                    detail = f"{summary['jalur_dianalisis']} jalur diestimasi dari statistik cukup (tanpa bootstrap)"
+                else:
+                    detail = f"{summary['hipotesis_diterima']}/{summary['jalur_dianalisis']} hipotesis diterima"
+                    if summary.get('replikasi_tidak_konvergen'):
+                        detail += f", {summary['replikasi_tidak_konvergen']} replikasi tidak konvergen"
+                log(f"[{k}/{len(inputs)}] {summary['dataset']}: {summary['status']} ({summary['total_detik']:.1f} s) - {detail}")
+
+    order = {name: i for i, name in enumerate(names)}
+    overview = pd.DataFrame(sorted(summaries, key=lambda s: order[s['dataset']]))
+    for col in ('indikator_dihapus', 'konstrak_dihapus'):
+        if col in overview:
+            overview[col] = overview[col].map(lambda v: ", ".join(v) if isinstance(v, list) else v)
+    overview.drop(columns=['model'], errors='ignore').to_csv(os.path.join(output_dir, 'ringkasan_batch.csv'), index=False)
+    return overview
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analisis SEM-PLS batch tanpa browser (uji loading, pruning, fit & bootstrap).")
+    parser.add_argument('spec', help="File spesifikasi model (JSON).")
+    parser.add_argument('inputs', nargs='+', help="Direktori, glob (mis. 'data/*.csv') atau file data.")
+    parser.add_argument('--output', '-o', default='hasil_batch', help="Direktori output (default: hasil_batch).")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="Jumlah dataset yang diproses paralel (default: jumlah CPU).")
+    parser.add_argument('--bootstrap-jobs', type=int, default=1, help="Worker bootstrap per dataset (default: 1).")
+    parser.add_argument('--format', choices=TABLE_FORMATS, default=TABLE_FORMATS[0],
+                        help="Format tabel output (default: Parquet bila pyarrow tersedia, selain itu CSV).")
+    parser.add_argument('--replicate-dir', help="Simpan/pakai ulang replikasi bootstrap (.npz) di direktori ini.")
+    parser.add_argument('--report', action='store_true', help="Tulis juga laporan HTML statis per dataset.")
+    parser.add_argument('--nboot', type=int, help="Timpa jumlah bootstrap pada spesifikasi.")
+    parser.add_argument('--bootstrap-tol', type=float, help="Timpa toleransi konvergensi replikasi bootstrap (native).")
+    parser.add_argument('--bootstrap-max-iter', type=int, help="Timpa iterasi maksimum replikasi bootstrap (native).")
+    parser.add_argument('--stream', action='store_true',
+                        help="Mode out-of-core: baca file per chunk, fit dari matriks korelasi (tanpa bootstrap).")
+    parser.add_argument('--chunk-size', type=int, default=500_000, help="Baris per chunk untuk --stream (default: 500000).")
+    args = parser.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    if args.nboot:
+        spec['bootstrap_samples'] = args.nboot
+    if args.bootstrap_tol or args.bootstrap_max_iter:
+        spec = validate_spec(dict(spec, **{key: val for key, val in (('bootstrap_tol', args.bootstrap_tol),
+                                                                     ('bootstrap_max_iter', args.bootstrap_max_iter))
+                                           if val}))
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        parser.error("Tidak ada file data yang cocok dengan input.")
+
+    def log(message):
+        print(message, file=sys.stderr, flush=True)
+
+    if args.stream:
+        log(f"{len(inputs)} dataset, mode streaming (chunk {args.chunk_size:,} baris), engine=native tanpa bootstrap")
+    else:
+        log(f"{len(inputs)} dataset, bootstrap N={spec['bootstrap_samples']:,}, engine={spec['engine']}")
+    overview = run_batch(spec, inputs, args.output, jobs=args.jobs, fmt=args.format,
+                         bootstrap_jobs=args.bootstrap_jobs, replicate_dir=args.replicate_dir,
+                         stream_chunk=args.chunk_size if args.stream else None, log=log, report=args.report)
+    n_failed = int((overview['status'] == 'gagal').sum())
+    log(f"Selesai: {len(overview) - n_failed} berhasil, {n_failed} gagal. Ringkasan: "
+        f"{os.path.join(args.output, 'ringkasan_batch.csv')}")
+    return 1 if n_failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""Benchmark pipeline SEM-PLS: fit, bootstrap, inspect dan plotting untuk berbagai ukuran model & data.
+
+Contoh:
+    python pls_bench.py --quick --output bench.json
+    python pls_bench.py --respondents 100 1000 100000 1000000 --bootstrap 0 1000 --output bench.json
+    python pls_bench.py --compare bench_lama.json bench_baru.json
+"""
+import argparse
+import gc
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from pls_data import PopulationModel, iter_synthetic
+from pls_engine import PRECISIONS, fit_pls, parallel_bootstrap
+from pls_pipeline import merge_boot_pvalues, model_syntax
+from pls_profile import StageProfiler
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_SCRIPT = os.path.join(HERE, "SEM-PLS Analyzer Pro.py")
+PROXY_SCRIPT = os.path.join(HERE, "Web SEM PLS Proxy.py")
+
+# Konfigurasi dasar; setiap sumbu sweep diubah satu per satu dari nilai ini
+BASELINE = {'respondents': 1000, 'indicators': 5, 'constructs': 5, 'paths': 4, 'bootstrap': 500}
+QUICK_AXES = {
+    'respondents': [100, 1000, 10000],
+    'indicators': [3, 5],
+    'constructs': [5, 10],
+    'paths': [4, 8],
+    'bootstrap': [0, 500],
+}
+FULL_AXES = {
+    'respondents': [100, 1000, 10000, 100000, 1000000],
+    'indicators': [3, 5, 8],
+    'constructs': [3, 5, 10, 20],
+    'paths': [4, 8, 16],
+    'bootstrap': [0, 1000, 5000],
+}
+
+
+# --- Pengukuran per Tahap ---
+
+class StageTimer:
+    """Jalankan tahap benchmark lewat `StageProfiler`; error dicatat dan hasil tahap menjadi None."""
+
+    def __init__(self, trace_memory=True):
+        self.profiler = StageProfiler(trace_memory=trace_memory)
+
+    def run(self, name, fn, *args, **kwargs):
+        gc.collect()
+        try:
+            return self.profiler.run(name, fn, *args, category='bench', **kwargs)
+        except Exception:
+            return None
+
+    @property
+    def stages(self):
+        stages = {}
+        for r in self.profiler.records:
+            stage = {k: r[k] for k in ('seconds', 'cpu_seconds', 'rss_delta')}
+            if r['peak_bytes'] is not None:
+                stage['peak_bytes'] = r['peak_bytes']
+            if r['error']:
+                stage['error'] = r['error']
+            stages[r['stage']] = stage
+        return stages
+
+
+# --- Model & Data Sintetis ---
+
+def build_model(constructs, indicators, n_paths):
+    """Model rantai dengan jalur maju tambahan: `constructs` LV, `n_paths` jalur (DAG)."""
+    lvs = [f"LV{k + 1}" for k in range(constructs)]
+    latent_vars = {lv: [f"{lv}_{i + 1}" for i in range(indicators)] for lv in lvs}
+    candidates = [(lvs[k], lvs[k + 1]) for k in range(constructs - 1)]
+    candidates += [(lvs[i], lvs[j]) for gap in range(2, constructs) for i in range(constructs - gap) for j in [i + gap]]
+    paths = candidates[:max(1, min(n_paths, len(candidates)))]
+    return latent_vars, paths
+
+
+def synthetic_frame(latent_vars, paths, n, seed):
+    # Koefisien kecil agar varians residual tetap positif untuk banyak jalur masuk
+    n_in = max([sum(1 for _, t in paths if t == lv) for lv in latent_vars] or [1])
+    population = PopulationModel(latent_vars, paths, loadings=0.8, path_coefs=min(0.3, 0.9 / n_in))
+    return pd.concat(iter_synthetic(population, n, seed=seed, id_column=None), ignore_index=True)
+
+
+def load_script(path, name):
+    """Muat script Streamlit sebagai modul (mode bare) untuk memakai fungsi-fungsinya."""
+    # Bungkam peringatan "missing ScriptRunContext" dari pemanggilan st.* di luar `streamlit run`
+    from streamlit.logger import set_log_level
+    set_log_level('error')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# --- Kasus Benchmark ---
+
+def bench_case(case, engine, n_jobs, seed, trace_memory, app=None, precision='float64'):
+    latent_vars, paths = build_model(case['constructs'], case['indicators'], case['paths'])
+    meas_model, full_model = model_syntax(latent_vars, paths)
+    timer = StageTimer(trace_memory)
+    data = timer.run('generate', synthetic_frame, latent_vars, paths, case['respondents'], seed)
+
+    if engine == 'native':
+        timer.run('fit_measurement', fit_pls, meas_model, data)
+        res = timer.run('fit_full', fit_pls, full_model, data)
+    else:
+        import semopy
+
+        def semopy_fit(desc):
+            return semopy.Model(desc).fit(data, algo="PLS")
+        timer.run('fit_measurement', semopy_fit, meas_model)
+        res = timer.run('fit_full', semopy_fit, full_model)
+
+    boot_res = None
+    if case['bootstrap'] and res is not None:
+        boot_res = timer.run('bootstrap', parallel_bootstrap, full_model, data, case['bootstrap'],
+                             seed=seed, n_jobs=n_jobs, engine=engine, precision=precision)
+
+    def inspect_all():
+        tables = [res.inspect(mode='estimates'), res.inspect(mode='r2'), res.inspect(mode='variances')]
+        if boot_res is not None:
+            tables.append(boot_res.inspect(mode='estimates'))
+        return tables
+    tables = timer.run('inspect', inspect_all) if res is not None else None
+
+    if app is not None and tables is not None:
+        def plot():
+            path_df = merge_boot_pvalues(tables[0], tables[-1]) if boot_res is not None else tables[0]
+            items = app.path_diagram_items(paths, path_df)
+            fig = app.plot_sem_paths(tuple(latent_vars), tuple(paths), items, 0.05)
+            try:
+                fig.savefig(os.devnull, format='png', dpi=110)
+            finally:
+                app.plt.close(fig)
+        timer.run('plot', plot)
+
+    # Presisi default tidak dicatat agar kunci kasus tetap cocok dengan file benchmark lama
+    case = dict(case, engine=engine, **({} if precision == 'float64' else {'precision': precision}))
+    return {'case': case, 'stages': timer.stages}
+
+
+def bench_proxy(respondents, seed, trace_memory, proxy):
+    """Benchmark `analyze_data` dan `display_report` pada aplikasi proxy (struktur INDICATORS tetap)."""
+    latent_vars = {key: val['cols'] for key, val in proxy.INDICATORS.items()}
+    paths = [(x, 'Y') for x in ['X1', 'X2', 'X3', 'X4']] + [(x, 'Z') for x in ['X1', 'X2', 'X3', 'X4', 'Y']]
+    population = PopulationModel(latent_vars, paths, loadings=0.8, path_coefs=0.15)
+    timer = StageTimer(trace_memory)
+    df = timer.run('generate', lambda: pd.concat(iter_synthetic(population, respondents, seed=seed, id_column=None),
+                                                 ignore_index=True))
+    out = timer.run('analyze_data', proxy.analyze_data, df)
+    if out is not None and out[1] is not None:
+        results = dict(out[1], threshold=0.5, alpha=0.05)
+        timer.run('display_report', proxy.display_report, results, 0.05)
+    return {'case': {'app': 'proxy', 'respondents': respondents}, 'stages': timer.stages}
+
+
+def sweep_cases(axes, grid=False):
+    """Kasus one-at-a-time dari BASELINE, atau produk kartesius penuh bila `grid`."""
+    if grid:
+        keys = list(axes)
+        return [dict(zip(keys, values)) for values in itertools.product(*(axes[k] for k in keys))]
+    cases = []
+    for axis, values in axes.items():
+        for value in values:
+            case = dict(BASELINE, **{axis: value})
+            if case not in cases:
+                cases.append(case)
+    return cases
+
+
+def environment_info():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE, capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+# --- Perbandingan Hasil ---
+
+def compare_results(old_path, new_path, threshold=0.10):
+    """Bandingkan dua file JSON benchmark; cetak rasio waktu per tahap dan tandai regresi."""
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    def keyed(doc):
+        return {json.dumps(r['case'], sort_keys=True): r['stages'] for r in doc['results']}
+    old_k, new_k = keyed(old), keyed(new)
+    regressions = 0
+    for key in sorted(set(old_k) & set(new_k)):
+        for stage, info in new_k[key].items():
+            before = old_k[key].get(stage)
+            if not before or 'error' in info or 'error' in before or before['seconds'] <= 0:
+                continue
+            ratio = info['seconds'] / before['seconds']
+            flag = "  << REGRESI" if ratio > 1 + threshold else ""
+            regressions += bool(flag)
+            print(f"{key} {stage:16s} {before['seconds']:9.4f}s -> {info['seconds']:9.4f}s  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pipeline SEM-PLS (fit, bootstrap, inspect, plotting).")
+    parser.add_argument('--quick', action='store_true', help="Sweep kecil untuk pengecekan cepat.")
+    parser.add_argument('--grid', action='store_true', help="Produk kartesius penuh, bukan sweep satu sumbu.")
+    for axis in FULL_AXES:
+        parser.add_argument(f'--{axis}', type=int, nargs='+', help=f"Nilai sweep untuk {axis}.")
+    parser.add_argument('--engine', choices=['native', 'semopy'], default='native')
+    parser.add_argument('--jobs', type=int, default=1, help="Jumlah worker bootstrap.")
+    parser.add_argument('--precision', choices=list(PRECISIONS), default='float64',
+                        help="Presisi data resample bootstrap (float32 hanya untuk engine native).")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=1, help="Ulangi setiap kasus n kali.")
+    parser.add_argument('--no-memory', action='store_true', help="Nonaktifkan tracemalloc (overhead lebih kecil).")
+    parser.add_argument('--no-plot', action='store_true', help="Lewati tahap plotting (tanpa memuat script Streamlit).")
+    parser.add_argument('--no-proxy', action='store_true', help="Lewati benchmark `analyze_data` aplikasi proxy.")
+    parser.add_argument('--output', help="File JSON hasil (default: stdout).")
+    parser.add_argument('--compare', nargs=2, metavar=('LAMA', 'BARU'), help="Bandingkan dua file hasil.")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return 1 if compare_results(*args.compare) else 0
+
+    axes = dict(QUICK_AXES if args.quick else FULL_AXES)
+    for axis in FULL_AXES:
+        if getattr(args, axis):
+            axes[axis] = getattr(args, axis)
+    trace_memory = not args.no_memory
+
+    app = None if args.no_plot else load_script(APP_SCRIPT, 'sempls_app')
+    proxy = None if args.no_proxy else load_script(PROXY_SCRIPT, 'sempls_proxy')
+
+    results = []
+    for case in sweep_cases(axes, grid=args.grid):
+        for rep in range(args.repeat):
+            record = bench_case(case, args.engine, args.jobs, args.seed, trace_memory, app=app, precision=args.precision)
+            record['repeat'] = rep
+            results.append(record)
+            print(f"{record['case']} -> " + ", ".join(f"{k}={v['seconds']:.3f}s" for k, v in record['stages'].items()),
+                  file=sys.stderr)
+    if proxy is not None:
+        for n in axes['respondents']:
+            for rep in range(args.repeat):
+                record = bench_proxy(n, args.seed, trace_memory, proxy)
+                record['repeat'] = rep
+                results.append(record)
+
+    doc = {
+        'meta': dict(environment_info(), peak_rss_bytes=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024),
+        'results': results,
+    }
+    text = json.dumps(doc, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
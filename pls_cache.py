@@ -0,0 +1,401 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from pls_engine import SOLVER_FIELDS, BootstrapResult
+
+
+# --- Fingerprint Data & Kunci Cache ---
+
+def fingerprint_frame(df):
+    """Hash konten DataFrame (nama kolom, dtype dan byte nilai)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(list(df.columns)).encode())
+    h.update(repr([str(t) for t in df.dtypes]).encode())
+    for col in df.columns:
+        values = df[col].to_numpy()
+        if values.dtype == object:
+            values = pd.util.hash_pandas_object(df[col], index=False).to_numpy()
+        h.update(np.ascontiguousarray(values).tobytes())
+    return h.hexdigest()
+
+
+def make_cache_key(data, desc, algo, **settings):
+    """Kunci cache dari hash data, syntax model, algoritma dan pengaturan bootstrap."""
+    payload = json.dumps({'desc': desc, 'algo': algo, 'settings': settings}, sort_keys=True, default=str)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(fingerprint_frame(data).encode())
+    h.update(payload.encode())
+    return h.hexdigest()
+
+
+def approx_nbytes(obj, _seen=None):
+    """Perkiraan ukuran memori sebuah objek hasil (array, DataFrame, dict, objek)."""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(deep=True)))
+    if isinstance(obj, dict):
+        return sum(approx_nbytes(k, _seen) + approx_nbytes(v, _seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set)):
+        return sum(approx_nbytes(v, _seen) for v in obj)
+    # Objek yang melaporkan ukurannya sendiri (cache, profiler) tidak ditelusuri
+    if isinstance(getattr(type(obj), 'nbytes', None), property):
+        return int(obj.nbytes)
+    if hasattr(obj, '__dict__'):
+        return approx_nbytes(vars(obj), _seen)
+    try:
+        return len(pickle.dumps(obj))
+    except Exception:
+        return 64
+
+
+# --- Cache Hasil Fit/Bootstrap ---
+
+class FitCache:
+    """Cache LRU berbatas memori untuk hasil fit/bootstrap, opsional spill ke disk.
+
+    Satu instance dibagi oleh semua sesi (lihat `st.cache_resource` di
+    aplikasi), sehingga analisis yang identik tidak pernah dihitung ulang.
+    """
+
+    def __init__(self, max_bytes=512 * 2**20, disk_dir=None, max_disk_bytes=4 * 2**30):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._items:
+                return True
+        path = self._disk_path(key)
+        return path is not None and os.path.exists(path)
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.pkl") if self.disk_dir else None
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key][0]
+        value = self._load_from_disk(key)
+        if value is not None:
+            self.hits += 1
+            self.put(key, value)
+            return value
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        size = approx_nbytes(value)
+        with self._lock:
+            if key in self._items:
+                self.nbytes -= self._items.pop(key)[1]
+            self._items[key] = (value, size)
+            self.nbytes += size
+            evicted = []
+            # Buang item paling lama dipakai sampai kembali di bawah batas (item terbaru selalu disimpan)
+            while self.nbytes > self.max_bytes and len(self._items) > 1:
+                old_key, (old_value, old_size) = self._items.popitem(last=False)
+                self.nbytes -= old_size
+                evicted.append((old_key, old_value))
+        for old_key, old_value in evicted:
+            self._spill(old_key, old_value)
+
+    def shrink(self, max_bytes):
+        """Buang item paling lama dipakai (spill ke disk bila aktif) sampai ukuran <= `max_bytes`.
+
+        Mengembalikan perkiraan byte yang dibebaskan dari memori.
+        """
+        evicted = []
+        with self._lock:
+            before = self.nbytes
+            while self.nbytes > max_bytes and self._items:
+                old_key, (old_value, old_size) = self._items.popitem(last=False)
+                self.nbytes -= old_size
+                evicted.append((old_key, old_value))
+            freed = before - self.nbytes
+        for old_key, old_value in evicted:
+            self._spill(old_key, old_value)
+        return freed
+
+    def get_or_compute(self, key, compute):
+        """Ambil hasil dari cache, atau hitung dengan `compute()` lalu simpan."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'items': len(self._items), 'nbytes': self.nbytes, 'hits': self.hits, 'misses': self.misses}
+
+    # --- Penyimpanan disk ---
+
+    def _spill(self, key, value):
+        path = self._disk_path(key)
+        if path is None or os.path.exists(path):
+            return
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            # Objek yang tidak bisa di-pickle cukup dibuang dari memori
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self._prune_disk()
+
+    def _load_from_disk(self, key):
+        path = self._disk_path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except Exception:
+            return None
+        os.utime(path)
+        return value
+
+    def _prune_disk(self):
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if name.endswith('.pkl'):
+                path = os.path.join(self.disk_dir, name)
+                try:
+                    info = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((info.st_mtime, info.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+# --- Penyimpanan Replikasi Bootstrap ---
+
+def replicate_arrays(boot_res):
+    """Array `.npz` sebuah `BootstrapResult`: replikasi, kunci parameter, estimasi, seed dan telemetri solver."""
+    est = boot_res.estimates
+    arrays = {
+        'replicates': boot_res.replicates,
+        'lval': est['lval'].to_numpy(dtype=str),
+        'op': est['op'].to_numpy(dtype=str),
+        'rval': est['rval'].to_numpy(dtype=str),
+        'estimate': est['Estimate'].to_numpy(dtype=float),
+        'seed': np.array(boot_res.seed),
+        'stopped_early': np.array(boot_res.stopped_early),
+    }
+    # Telemetri solver per replikasi (engine native)
+    arrays.update(boot_res.telemetry())
+    return arrays
+
+
+class ReplicateStore:
+    """Penyimpanan matriks replikasi bootstrap (replikasi x parameter) dalam file `.npz`.
+
+    Setiap file dikunci dengan kunci fit yang sama seperti `FitCache`, sehingga
+    perubahan alpha atau jenis interval cukup dihitung ulang dari replikasi
+    tersimpan tanpa bootstrap ulang.
+    """
+
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.root_dir, f"{key}.npz")
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def save(self, key, boot_res):
+        """Simpan `BootstrapResult`; hasil lain (mis. bootstrap semopy bawaan) diabaikan."""
+        if not hasattr(boot_res, 'replicates') or key in self:
+            return False
+        tmp = f"{self._path(key)}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp, **replicate_arrays(boot_res))
+        os.replace(tmp, self._path(key))
+        return True
+
+    def load(self, key):
+        """Muat `BootstrapResult` tersimpan, atau None bila belum ada."""
+        if key not in self:
+            return None
+        with np.load(self._path(key), allow_pickle=False) as f:
+            estimates = pd.DataFrame({'lval': f['lval'], 'op': f['op'], 'rval': f['rval'], 'Estimate': f['estimate']})
+            result = BootstrapResult(
+                estimates, f['replicates'], int(f['seed']),
+                **{key: f[key] for key in SOLVER_FIELDS if key in f.files}
+            )
+            result.stopped_early = bool(f['stopped_early'])
+        return result
+
+
+# --- Penyimpanan Dataset Bersama (Memory-Map) ---
+
+class DatasetStore:
+    """Dataset kolumnar ber-alamat konten yang dibaca sebagai memory-map oleh semua sesi.
+
+    Setiap upload ditulis sekali ke `root_dir/<fingerprint>/`: kolom numerik
+    sebagai file `.npy` yang dibuka dengan `mmap_mode='r'`, kolom lain (teks,
+    kategori) sebagai pickle kecil. Upload identik dari sesi mana pun memakai
+    direktori yang sama, dan halaman cache OS dibagi antar sesi maupun proses.
+    Sesi yang memakai dataset mendaftarkannya lewat `acquire`; dataset yang
+    masih dirujuk sesi aktif (dalam `ref_ttl` detik) tidak pernah di-prune.
+    """
+
+    def __init__(self, root_dir, max_disk_bytes=8 * 2**30, ref_ttl=3600):
+        self.root_dir = root_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.ref_ttl = ref_ttl
+        self._views = {}
+        # Pemilik (mis. ID sesi) -> (kunci dataset, waktu rujukan terakhir)
+        self._refs = {}
+        self._lock = threading.Lock()
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _dir(self, key):
+        return os.path.join(self.root_dir, key)
+
+    def __contains__(self, key):
+        return os.path.exists(os.path.join(self._dir(key), 'meta.pkl'))
+
+    def put(self, df):
+        """Simpan DataFrame (bila belum ada) dan kembalikan kuncinya."""
+        key = fingerprint_frame(df)
+        if key in self:
+            os.utime(self._dir(key))
+            return key
+        tmp = f"{self._dir(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        files = []
+        for i, col in enumerate(df.columns):
+            values = df[col].to_numpy()
+            if isinstance(df[col].dtype, np.dtype) and values.dtype.kind in 'biufcmM':
+                name = f"{i}.npy"
+                np.save(os.path.join(tmp, name), np.ascontiguousarray(values), allow_pickle=False)
+            else:
+                name = f"{i}.pkl"
+                with open(os.path.join(tmp, name), 'wb') as f:
+                    pickle.dump(df[col].reset_index(drop=True), f, protocol=pickle.HIGHEST_PROTOCOL)
+            files.append(name)
+        with open(os.path.join(tmp, 'meta.pkl'), 'wb') as f:
+            pickle.dump({'columns': list(df.columns), 'files': files, 'n_rows': len(df)}, f)
+        try:
+            os.replace(tmp, self._dir(key))
+        except OSError:
+            # Sesi lain sudah menulis dataset yang sama
+            shutil.rmtree(tmp, ignore_errors=True)
+        self._prune_disk(keep=key)
+        return key
+
+    def acquire(self, owner, key):
+        """Catat bahwa `owner` memakai dataset `key` (menggantikan dataset sebelumnya milik `owner`)."""
+        with self._lock:
+            self._refs[owner] = (key, time.time())
+
+    def release(self, owner):
+        with self._lock:
+            self._refs.pop(owner, None)
+
+    def referenced(self):
+        """Kunci dataset yang masih dirujuk pemilik aktif; rujukan kedaluwarsa dibuang."""
+        now = time.time()
+        with self._lock:
+            for owner in [o for o, (_, seen) in self._refs.items() if now - seen > self.ref_ttl]:
+                del self._refs[owner]
+            return {key for key, _ in self._refs.values()}
+
+    def _open(self, key):
+        with self._lock:
+            if key in self._views:
+                return self._views[key]
+        with open(os.path.join(self._dir(key), 'meta.pkl'), 'rb') as f:
+            meta = pickle.load(f)
+        arrays = {}
+        for col, name in zip(meta['columns'], meta['files']):
+            path = os.path.join(self._dir(key), name)
+            if name.endswith('.npy'):
+                arrays[col] = np.load(path, mmap_mode='r')
+            else:
+                with open(path, 'rb') as f:
+                    arrays[col] = pickle.load(f)
+        with self._lock:
+            return self._views.setdefault(key, arrays)
+
+    def columns(self, key):
+        return list(self._open(key))
+
+    def frame(self, key, columns=None):
+        """DataFrame tanpa salinan untuk `columns` (proyeksi; default semua kolom).
+
+        Kolom numerik adalah view read-only atas memory-map bersama.
+        """
+        arrays = self._open(key)
+        if columns is None:
+            columns = list(arrays)
+        missing = [col for col in columns if col not in arrays]
+        if missing:
+            raise KeyError(f"Kolom tidak ada di dataset: {', '.join(map(str, missing))}")
+        return pd.DataFrame({col: arrays[col] for col in columns}, copy=False)
+
+    def _prune_disk(self, keep=None):
+        in_use = self.referenced()
+        entries = []
+        for name in os.listdir(self.root_dir):
+            path = os.path.join(self.root_dir, name)
+            if name == keep or name in in_use or name.endswith('.tmp') or not os.path.isdir(path):
+                continue
+            try:
+                size = sum(e.stat().st_size for e in os.scandir(path))
+                entries.append((os.stat(path).st_mtime, size, name))
+            except FileNotFoundError:
+                continue
+        total = sum(size for _, size, _ in entries)
+        if keep is not None and keep in self:
+            total += sum(e.stat().st_size for e in os.scandir(self._dir(keep)))
+        for _, size, name in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            with self._lock:
+                self._views.pop(name, None)
+            shutil.rmtree(self._dir(name), ignore_errors=True)
+            total -= size
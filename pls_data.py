@@ -0,0 +1,370 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Ekstensi file yang dapat diunggah di halaman 1
+UPLOAD_TYPES = ['csv', 'parquet', 'feather'] if HAS_PYARROW else ['csv']
+
+
+# --- Memori Proses ---
+
+def process_rss():
+    """Resident memory proses saat ini (bytes); fallback ke puncak RSS bila /proc tidak ada."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def frame_nbytes(df):
+    """Ukuran memori DataFrame (bytes, termasuk kolom object)."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+# --- Ingest Data ---
+
+def compact_frame(df):
+    """Downcast kolom numerik bulat (mis. skala Likert) ke dtype integer terkecil.
+
+    Kolom float yang seluruh nilainya bulat dan tanpa nilai kosong diubah ke
+    integer; kolom float lain menjadi float32. Kolom non-numerik dibiarkan.
+    """
+    out = {}
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_bool_dtype(s) or not pd.api.types.is_numeric_dtype(s):
+            out[col] = s
+        elif pd.api.types.is_integer_dtype(s):
+            out[col] = pd.to_numeric(s, downcast='integer')
+        else:
+            values = s.to_numpy()
+            if np.isfinite(values).all() and np.array_equal(values, np.round(values)):
+                out[col] = pd.to_numeric(s.astype(np.int64), downcast='integer')
+            else:
+                out[col] = s.astype(np.float32)
+    return pd.DataFrame(out, index=df.index)
+
+
+def read_upload(uploaded_file, compact=True, **csv_kwargs):
+    """Baca upload CSV/Parquet/Feather dengan parser tercepat yang tersedia.
+
+    Mengembalikan `(df, info)` dengan `info` berisi parser, waktu parsing,
+    ukuran frame sebelum/sesudah downcast dan resident memory proses.
+    """
+    name = getattr(uploaded_file, 'name', str(uploaded_file)).lower()
+    rss_before = process_rss()
+    start = time.perf_counter()
+    if name.endswith('.parquet'):
+        parser = 'pyarrow (parquet)'
+        df = pd.read_parquet(uploaded_file)
+    elif name.endswith('.feather'):
+        parser = 'pyarrow (feather)'
+        df = pd.read_feather(uploaded_file)
+    elif HAS_PYARROW and 'delimiter' not in csv_kwargs and 'sep' not in csv_kwargs:
+        parser = 'pyarrow (csv)'
+        df = pd.read_csv(uploaded_file, engine='pyarrow', **csv_kwargs)
+    else:
+        parser = 'pandas C engine'
+        df = pd.read_csv(uploaded_file, **csv_kwargs)
+    parse_seconds = time.perf_counter() - start
+
+    raw_nbytes = frame_nbytes(df)
+    if compact:
+        df = compact_frame(df)
+    info = {
+        'parser': parser,
+        'parse_seconds': parse_seconds,
+        'total_seconds': time.perf_counter() - start,
+        'raw_nbytes': raw_nbytes,
+        'nbytes': frame_nbytes(df),
+        'rss_before': rss_before,
+        'rss_after': process_rss(),
+    }
+    return df, info
+
+
+# --- Statistik Cukup Streaming (Out-of-Core) ---
+
+def iter_chunks(source, columns=None, chunk_size=100_000, **csv_kwargs):
+    """Generator chunk DataFrame dari CSV/Parquet/Feather tanpa memuat seluruh file.
+
+    `columns` membatasi kolom yang dibaca (proyeksi di level parser).
+    """
+    name = getattr(source, 'name', str(source)).lower()
+    if name.endswith(('.parquet', '.feather')):
+        if not HAS_PYARROW:
+            raise ValueError("Format Parquet/Feather memerlukan paket `pyarrow`.")
+        if name.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            batches = pq.ParquetFile(source).iter_batches(batch_size=chunk_size, columns=columns)
+        else:
+            import pyarrow.feather as feather
+            batches = feather.read_table(source, columns=columns, memory_map=True).to_batches(chunk_size)
+        for batch in batches:
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunk_size, **csv_kwargs)
+
+
+class StreamingMoments:
+    """Rata-rata dan matriks co-moment indikator yang diakumulasi per chunk.
+
+    Setiap chunk diringkas sebagai (n, mean, M2) terpusat pada rata-ratanya
+    sendiri lalu digabung dengan rumus pairwise Chan dkk., sehingga stabil
+    secara numerik untuk jutaan baris. Memori hanya O(p²).
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        p = len(self.columns)
+        self.n = 0
+        self.mean = np.zeros(p)
+        self.m2 = np.zeros((p, p))
+
+    def update(self, values):
+        """Tambahkan satu chunk (array baris x kolom, urutan `columns`)."""
+        values = np.asarray(values, dtype=float)
+        if not np.isfinite(values).all():
+            raise ValueError("Data indikator mengandung nilai kosong/non-numerik.")
+        n_b = values.shape[0]
+        if n_b == 0:
+            return self
+        mean_b = values.mean(axis=0)
+        centered = values - mean_b
+        self._merge(n_b, mean_b, centered.T @ centered)
+        return self
+
+    def merge(self, other):
+        """Gabungkan akumulator lain dengan kolom yang sama (mis. dari worker berbeda)."""
+        if other.columns != self.columns:
+            raise ValueError("Kolom akumulator momen tidak sama.")
+        if other.n:
+            self._merge(other.n, other.mean, other.m2)
+        return self
+
+    def _merge(self, n_b, mean_b, m2_b):
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.m2 += m2_b + np.outer(delta, delta) * (self.n * n_b / n)
+        self.mean += delta * (n_b / n)
+        self.n = n
+
+    def covariance(self):
+        """Matriks kovarians sampel (ddof=1) sebagai DataFrame berlabel."""
+        if self.n < 2:
+            raise ValueError("Minimal 2 baris data diperlukan.")
+        return pd.DataFrame(self.m2 / (self.n - 1), index=self.columns, columns=self.columns)
+
+    def correlation(self):
+        """Matriks korelasi indikator sebagai DataFrame berlabel."""
+        cov = self.covariance().to_numpy()
+        sd = np.sqrt(np.diag(cov))
+        if (sd == 0).any():
+            raise ValueError("Terdapat indikator dengan varians nol.")
+        return pd.DataFrame(cov / np.outer(sd, sd), index=self.columns, columns=self.columns)
+
+
+def stream_moments(source, columns=None, chunk_size=100_000, **csv_kwargs):
+    """Baca file per chunk dalam satu lintasan dan kembalikan `StreamingMoments`.
+
+    Tanpa `columns`, semua kolom numerik dari chunk pertama dipakai.
+    """
+    moments = None
+    for chunk in iter_chunks(source, columns=columns, chunk_size=chunk_size, **csv_kwargs):
+        if moments is None:
+            cols = columns if columns is not None else [
+                c for c in chunk.columns if pd.api.types.is_numeric_dtype(chunk[c]) and not pd.api.types.is_bool_dtype(chunk[c])
+            ]
+            moments = StreamingMoments(cols)
+        moments.update(chunk[moments.columns].to_numpy(dtype=float))
+    if moments is None:
+        raise ValueError("File data kosong.")
+    return moments
+
+
+# --- Generator Data Sintetis (Model Populasi) ---
+
+# Baris per blok RNG generator sintetis; setiap blok memakai stream anaknya sendiri
+SYNTHETIC_BLOCK = 10_000
+
+def _topological_order(lvs, paths):
+    preds = {lv: [f for f, t in paths if t == lv] for lv in lvs}
+    order, placed = [], set()
+    while len(order) < len(lvs):
+        ready = [lv for lv in lvs if lv not in placed and all(p in placed for p in preds[lv])]
+        if not ready:
+            raise ValueError("Model struktural mengandung siklus; generator data memerlukan model rekursif (DAG).")
+        order.extend(ready)
+        placed.update(ready)
+    return order, preds
+
+
+def _per_item(value, keys, default_group=None):
+    """Normalisasi parameter skalar/dict menjadi dict per kunci."""
+    if isinstance(value, dict):
+        out = {}
+        for k in keys:
+            if k in value:
+                out[k] = value[k]
+            elif default_group is not None and default_group.get(k) in value:
+                out[k] = value[default_group[k]]
+            else:
+                raise ValueError(f"Nilai untuk '{k}' tidak ditentukan.")
+        return out
+    return {k: value for k in keys}
+
+
+class PopulationModel:
+    """Model populasi PLS-SEM dengan loading dan koefisien jalur yang diketahui.
+
+    Variabel laten terstandarisasi (varians 1); varians residual konstrak
+    endogen dihitung agar varians totalnya tetap 1. Indikator kontinu
+    x* = λ·η + sqrt(1 - λ²)·ε dikategorikan menjadi skala Likert.
+    """
+
+    def __init__(self, latent_vars, paths, loadings=0.8, path_coefs=0.3, exogenous_corr=0.0,
+                 n_levels=5, category_probs=None):
+        self.latent_vars = {lv: list(inds) for lv, inds in latent_vars.items()}
+        self.lvs = list(self.latent_vars)
+        self.paths = [tuple(p) for p in paths]
+        self.order, self.preds = _topological_order(self.lvs, self.paths)
+
+        indicator_lv = {ind: lv for lv, inds in self.latent_vars.items() for ind in inds}
+        self.indicators = list(indicator_lv)
+        self.loadings = _per_item(loadings, self.indicators, indicator_lv)
+        self.path_coefs = _per_item(path_coefs, self.paths)
+        for ind, lam in self.loadings.items():
+            if not 0 < abs(lam) < 1:
+                raise ValueError(f"Loading {ind} harus di antara 0 dan 1 (nilai mutlak).")
+
+        # Matriks korelasi laten populasi dan varians residual endogen
+        pos = {lv: k for k, lv in enumerate(self.lvs)}
+        K = len(self.lvs)
+        sigma = np.zeros((K, K))
+        self.residual_var = {}
+        exogenous = [lv for lv in self.order if not self.preds[lv]]
+        for lv in self.order:
+            j = pos[lv]
+            P = [pos[p] for p in self.preds[lv]]
+            if P:
+                b = np.array([self.path_coefs[(p, lv)] for p in self.preds[lv]])
+                sigma[j, :] = b @ sigma[P, :]
+                sigma[:, j] = sigma[j, :]
+                psi = 1 - b @ sigma[np.ix_(P, P)] @ b
+                if psi <= 0:
+                    raise ValueError(f"Koefisien jalur ke {lv} terlalu besar: varians residual menjadi {psi:.3f}.")
+                self.residual_var[lv] = psi
+            else:
+                for other in exogenous:
+                    if other != lv and other in self.residual_var:
+                        sigma[j, pos[other]] = sigma[pos[other], j] = exogenous_corr
+                self.residual_var[lv] = 1.0
+            sigma[j, j] = 1.0
+        self.lv_corr = sigma
+        exo_idx = [pos[lv] for lv in exogenous]
+        self._exogenous = exogenous
+        self._exo_chol = np.linalg.cholesky(sigma[np.ix_(exo_idx, exo_idx)])
+
+        if category_probs is None:
+            # Distribusi jawaban sedikit condong ke kanan, umum pada survei Likert
+            category_probs = np.array([0.05, 0.15, 0.30, 0.32, 0.18]) if n_levels == 5 else np.full(n_levels, 1 / n_levels)
+        category_probs = np.asarray(category_probs, dtype=float)
+        if category_probs.size != n_levels:
+            raise ValueError("Jumlah probabilitas kategori harus sama dengan jumlah level skala.")
+        self.thresholds = stats.norm.ppf(np.cumsum(category_probs / category_probs.sum())[:-1])
+
+    def parameters(self):
+        """Parameter populasi dalam format tabel estimasi (`lval`, `op`, `rval`, `Estimate`)."""
+        rows = [(lv, '=~', ind, self.loadings[ind]) for lv, inds in self.latent_vars.items() for ind in inds]
+        rows += [(t, '~', f, self.path_coefs[(f, t)]) for f, t in self.paths]
+        return pd.DataFrame(rows, columns=['lval', 'op', 'rval', 'Estimate'])
+
+    def sample(self, n, rng):
+        """Bangkitkan `n` baris data indikator Likert (int8) secara tervektorisasi."""
+        eta = {}
+        exo = rng.standard_normal((n, len(self._exogenous))) @ self._exo_chol.T
+        for k, lv in enumerate(self._exogenous):
+            eta[lv] = exo[:, k]
+        for lv in self.order:
+            if lv in eta:
+                continue
+            value = np.sqrt(self.residual_var[lv]) * rng.standard_normal(n)
+            for p in self.preds[lv]:
+                value += self.path_coefs[(p, lv)] * eta[p]
+            eta[lv] = value
+
+        cols = {}
+        for lv, inds in self.latent_vars.items():
+            lam = np.array([self.loadings[ind] for ind in inds])
+            x = eta[lv][:, None] * lam + rng.standard_normal((n, len(inds))) * np.sqrt(1 - lam ** 2)
+            likert = (np.searchsorted(self.thresholds, x) + 1).astype(np.int8)
+            for k, ind in enumerate(inds):
+                cols[ind] = likert[:, k]
+        return pd.DataFrame(cols)
+
+
+def iter_synthetic(population, n, seed=None, chunk_size=100_000, id_column='responden_id'):
+    """Generator chunk DataFrame sintetis; reproducible untuk `seed` yang sama berapa pun `chunk_size`-nya.
+
+    Baris dibangkitkan per blok `SYNTHETIC_BLOCK` dengan stream RNG anak
+    masing-masing, lalu dipotong ulang menjadi chunk `chunk_size` baris.
+    """
+    if chunk_size < 1:
+        raise ValueError("Ukuran chunk minimal 1 baris.")
+    children = np.random.SeedSequence(seed).spawn(int(np.ceil(n / SYNTHETIC_BLOCK)))
+    block_idx, block = None, None
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        parts, pos = [], start
+        while pos < stop:
+            k, offset = divmod(pos, SYNTHETIC_BLOCK)
+            if k != block_idx:
+                block_idx = k
+                block = population.sample(min(SYNTHETIC_BLOCK, n - k * SYNTHETIC_BLOCK), np.random.default_rng(children[k]))
+            end = min(stop - k * SYNTHETIC_BLOCK, len(block))
+            parts.append(block.iloc[offset:end])
+            pos = k * SYNTHETIC_BLOCK + end
+        chunk = pd.concat(parts, ignore_index=True)
+        if id_column:
+            chunk.insert(0, id_column, np.arange(start + 1, stop + 1, dtype=np.int64))
+        yield chunk
+
+
+def write_synthetic(population, n, target, fmt='csv', seed=None, chunk_size=100_000):
+    """Tulis data sintetis ke path/file-like secara streaming per chunk (CSV atau Parquet)."""
+    if fmt == 'csv':
+        for k, chunk in enumerate(iter_synthetic(population, n, seed=seed, chunk_size=chunk_size)):
+            data = chunk.to_csv(index=False, header=(k == 0)).encode()
+            if hasattr(target, 'write'):
+                target.write(data)
+            else:
+                with open(target, 'ab' if k else 'wb') as f:
+                    f.write(data)
+    elif fmt == 'parquet':
+        if not HAS_PYARROW:
+            raise ValueError("Format Parquet memerlukan paket `pyarrow`.")
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for chunk in iter_synthetic(population, n, seed=seed, chunk_size=chunk_size):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(target, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        raise ValueError(f"Format tidak dikenal: {fmt}")
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+from pls_engine import KEY_COLS, BootstrapResult, bootstrap_intervals, bootstrap_summary, parse_model_syntax, path_matrix
+
+# Jenis efek dan operator pada kolom `op` tabel efek (jalur langsung tetap '~' di tabel estimasi)
+EFFECT_TYPES = {
+    'specific': ('Tidak Langsung Spesifik', '~ind'),
+    'total_indirect': ('Total Tidak Langsung', '~tind'),
+    'total': ('Total', '~tot'),
+}
+
+
+def mediation_chains(spec):
+    """Semua rantai mediasi (minimal dua jalur berurutan) pada model struktural, sebagai tuple indeks konstrak."""
+    K = len(spec.lvs)
+    successors = [np.flatnonzero(spec.succ[:, i]) for i in range(K)]
+    chains = []
+
+    def extend(chain):
+        for j in successors[chain[-1]]:
+            if j in chain:
+                raise ValueError("Model struktural memuat siklus; efek tidak langsung tidak terdefinisi.")
+            longer = chain + (int(j),)
+            if len(longer) >= 3:
+                chains.append(longer)
+            extend(longer)
+
+    for i in range(K):
+        extend((i,))
+    return chains
+
+
+class EffectPlan:
+    """Indeks efek untuk satu spesifikasi model: rantai mediasi dan pasangan konstrak yang saling terhubung.
+
+    `compute(paths)` mengubah matriks koefisien jalur (batch x jalur, urutan
+    `spec.path_pos`) menjadi matriks efek (batch x efek) dalam satu operasi
+    tensor, sehingga estimasi titik, replikasi bootstrap dan estimasi
+    jackknife memakai kode yang sama.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.chains = mediation_chains(spec)
+        edge_col = {edge: col for col, edge in enumerate(spec.path_pos)}
+        n_paths = len(spec.path_pos)
+        # Indeks jalur per rantai; rantai pendek diisi indeks kolom konstanta 1
+        length = max((len(c) - 1 for c in self.chains), default=1)
+        self.chain_edges = np.full((len(self.chains), length), n_paths, dtype=int)
+        for r, chain in enumerate(self.chains):
+            self.chain_edges[r, :len(chain) - 1] = [edge_col[e] for e in zip(chain[:-1], chain[1:])]
+
+        mediated = list(dict.fromkeys((c[0], c[-1]) for c in self.chains))
+        self.indirect_pairs = mediated
+        self.total_pairs = list(dict.fromkeys(list(spec.path_pos) + mediated))
+
+    def labels(self):
+        """Baris tabel efek: kunci (`lval` = konstrak tujuan, `rval` = asal), jenis dan jalur."""
+        lvs = self.spec.lvs
+        rows = []
+        for chain in self.chains:
+            rows.append(('specific', chain[-1], chain[0], " -> ".join(lvs[k] for k in chain)))
+        for i, j in self.indirect_pairs:
+            rows.append(('total_indirect', j, i, f"{lvs[i]} -> {lvs[j]}"))
+        for i, j in self.total_pairs:
+            rows.append(('total', j, i, f"{lvs[i]} -> {lvs[j]}"))
+        out = pd.DataFrame([{
+            'lval': lvs[to], 'op': EFFECT_TYPES[kind][1], 'rval': lvs[frm],
+            'Jenis': EFFECT_TYPES[kind][0], 'Jalur': label,
+        } for kind, to, frm, label in rows], columns=KEY_COLS + ['Jenis', 'Jalur'])
+        return out
+
+    def compute(self, paths):
+        """Efek spesifik, total tidak langsung dan total per baris `paths`; baris non-finite menghasilkan NaN."""
+        paths = np.asarray(paths, dtype=float)
+        batch = paths.shape[0]
+        K = len(self.spec.lvs)
+        ext = np.concatenate([paths, np.ones((batch, 1))], axis=1)
+        specific = ext[:, self.chain_edges].prod(axis=2)
+
+        # Efek total T = (I - B)^-1 - I; efek tidak langsung total = T - B
+        B = path_matrix(self.spec, paths)
+        total = np.full_like(B, np.nan)
+        ok = np.isfinite(B).all(axis=(1, 2))
+        total[ok] = np.linalg.inv(np.eye(K)[None] - B[ok]) - np.eye(K)[None]
+        indirect = total - B
+
+        def pick(M, pairs):
+            if not pairs:
+                return np.empty((batch, 0))
+            i, j = np.array(pairs).T
+            return M[:, i, j]
+
+        return np.concatenate([specific, pick(indirect, self.indirect_pairs), pick(total, self.total_pairs)], axis=1)
+
+
+def path_positions(estimates, spec):
+    """Posisi baris `(tujuan, '~', asal)` tabel estimasi untuk setiap jalur, urutan `spec.path_pos`."""
+    lookup = {key: i for i, key in enumerate(estimates[KEY_COLS].itertuples(index=False, name=None))}
+    keys = [(t, '~', f) for f, t in spec.paths]
+    missing = [f"{f} -> {t}" for t, _, f in keys if (t, '~', f) not in lookup]
+    if missing:
+        raise ValueError(f"Koefisien jalur tidak ditemukan di tabel estimasi: {', '.join(missing)}")
+    return np.array([lookup[key] for key in keys], dtype=int)
+
+
+def mediation_table(desc, estimates, boot_res=None, level=0.95, method='percentile', jackknife=None):
+    """Tabel efek tidak langsung spesifik, tidak langsung total dan total beserta uji bootstrap.
+
+    Efek dihitung dari koefisien jalur `estimates` (tabel `inspect(mode='estimates')`)
+    dan, bila `boot_res` adalah `BootstrapResult`, dari koefisien jalur setiap
+    replikasi valid sekaligus, sehingga biayanya kecil dibanding bootstrap
+    itu sendiri. Interval 'bca' memerlukan `jackknife` (lihat
+    `jackknife_estimates`) yang dikonversi ke efek dengan cara yang sama.
+    """
+    spec = parse_model_syntax(desc)
+    plan = EffectPlan(spec)
+    out = plan.labels()
+    pos = path_positions(estimates, spec)
+    out['Estimate'] = plan.compute(estimates['Estimate'].to_numpy(dtype=float)[pos][None])[0]
+    out.attrs['n_chains'] = len(plan.chains)
+
+    if not isinstance(boot_res, BootstrapResult) or out.empty:
+        return out
+    valid = boot_res.valid_replicates()
+    # Kolom replikasi mengikuti baris tabel estimasi hasil bootstrap itu sendiri
+    effects = plan.compute(valid[:, path_positions(boot_res.estimates, spec)])
+    summary = bootstrap_summary(out, effects)
+    for col in ['Sample Mean', 'Std. Err', 'T-stat', 'p-value']:
+        out[col] = summary[col]
+
+    jack_effects = None
+    if jackknife is not None:
+        columns = pd.MultiIndex.from_tuples([(t, '~', f) for f, t in spec.paths], names=KEY_COLS)
+        jack_effects = plan.compute(jackknife.reindex(columns=columns).to_numpy(dtype=float))
+    if valid.shape[0] >= 2:
+        out['CI Lower'], out['CI Upper'] = bootstrap_intervals(
+            out['Estimate'].to_numpy(), effects, level=level, method=method, jackknife=jack_effects
+        )
+    else:
+        out['CI Lower'] = out['CI Upper'] = np.nan
+    out.attrs['n_valid'] = int(valid.shape[0])
+    return out
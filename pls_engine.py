@@ -0,0 +1,1025 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+import semopy
+from scipy import stats
+
+from pls_profile import profile_stage
+
+# Kolom kunci yang mengidentifikasi satu parameter di tabel estimasi semopy
+KEY_COLS = ['lval', 'op', 'rval']
+
+
+# Skema pembobotan inner model yang didukung estimator native
+INNER_SCHEMES = ['path', 'factor', 'centroid']
+
+# Presisi data resample (bootstrap/permutasi) estimator native; float32 bersifat opt-in
+PRECISIONS = {'float64': np.float64, 'float32': np.float32}
+# Bilangan bulat terbesar yang semua pendahulunya eksak dalam float32; batas jumlah parsial per blok
+FLOAT32_EXACT = 2 ** 24
+
+# Iterasi dianggap "dekat toleransi" bila perubahan bobot sudah di bawah faktor ini x tol
+NEAR_TOL_FACTOR = 100
+# Telemetri solver per fit/replikasi yang dilaporkan `pls_solve` dan disimpan `BootstrapResult`
+SOLVER_FIELDS = ['n_iter', 'delta', 'converged', 'near_tol_iter']
+
+# Replikasi per batch tumpukan default. Tetap (tidak bergantung pada jumlah worker): batas batch
+# menentukan susunan perkalian matriks, jadi harus sama agar hasil bit-identik untuk semua n_jobs.
+BATCH_SIZE = 128
+
+
+# --- Spesifikasi Model ---
+
+class PLSSpec:
+    """Struktur model PLS hasil parsing syntax `semopy` (`=~` dan `~`)."""
+
+    def __init__(self, blocks, paths):
+        self.lvs = list(blocks.keys())
+        self.blocks = {lv: list(inds) for lv, inds in blocks.items()}
+        self.paths = list(paths)
+        for from_var, to_var in self.paths:
+            if from_var not in self.blocks or to_var not in self.blocks:
+                raise ValueError(f"Jalur {from_var} -> {to_var} memakai variabel laten yang tidak didefinisikan.")
+
+        # Indikator unik (urutan kemunculan) dan pasangan (konstrak, indikator)
+        self.indicators = list(dict.fromkeys(ind for inds in self.blocks.values() for ind in inds))
+        col_pos = {ind: i for i, ind in enumerate(self.indicators)}
+        lv_pos = {lv: k for k, lv in enumerate(self.lvs)}
+        self.pairs = [(lv_pos[lv], col_pos[ind]) for lv, inds in self.blocks.items() for ind in inds]
+        self.pair_lv = np.array([k for k, _ in self.pairs], dtype=int)
+        self.pair_col = np.array([c for _, c in self.pairs], dtype=int)
+
+        K, p = len(self.lvs), len(self.indicators)
+        self.mask = np.zeros((p, K))
+        self.mask[self.pair_col, self.pair_lv] = 1.0
+
+        # succ[i, j] = True jika j -> i (i adalah penerus j)
+        self.succ = np.zeros((K, K), dtype=bool)
+        for from_var, to_var in self.paths:
+            self.succ[lv_pos[to_var], lv_pos[from_var]] = True
+        self.adjacency = self.succ | self.succ.T
+        # Konstrak tanpa jalur (mis. model pengukuran saja) memakai skornya sendiri sebagai proxy inner
+        self.isolated = np.flatnonzero(~self.adjacency.any(axis=1))
+        self.predecessors = [np.flatnonzero(self.succ[j]) for j in range(K)]
+        self.endogenous = [j for j in range(K) if self.predecessors[j].size]
+        self.path_pos = [(lv_pos[f], lv_pos[t]) for f, t in self.paths]
+
+    @property
+    def n_params(self):
+        return len(self.pairs) + len(self.paths)
+
+
+def parse_model_syntax(desc):
+    """Parsing syntax model (`LV =~ a + b` dan `Y ~ X1 + X2`) menjadi `PLSSpec`."""
+    blocks = {}
+    paths = []
+    for raw in desc.splitlines():
+        line = raw.split('#')[0].strip()
+        if not line:
+            continue
+        if '=~' in line:
+            lv, rhs = line.split('=~', 1)
+            blocks[lv.strip()] = [t.strip() for t in rhs.split('+') if t.strip()]
+        elif '~' in line:
+            lhs, rhs = line.split('~', 1)
+            for src in rhs.split('+'):
+                if src.strip():
+                    paths.append((src.strip(), lhs.strip()))
+        else:
+            raise ValueError(f"Baris syntax model tidak dikenali: '{raw}'")
+    if not blocks:
+        raise ValueError("Model tidak memiliki variabel laten (`=~`).")
+    return PLSSpec(blocks, paths)
+
+
+# --- Estimator PLS Native (NumPy) ---
+
+def standardize(values):
+    """Standarisasi matriks indikator (mean 0, sd 1, ddof=1)."""
+    values = np.asarray(values, dtype=float)
+    if not np.isfinite(values).all():
+        raise ValueError("Data indikator mengandung nilai kosong/non-numerik.")
+    sd = values.std(axis=0, ddof=1)
+    if (sd == 0).any():
+        raise ValueError("Terdapat indikator dengan varians nol.")
+    return (values - values.mean(axis=0)) / sd
+
+
+def resample_matrix(values, precision='float64'):
+    """Matriks indikator untuk resampling: terstandarisasi (float64) atau tergeser (float32).
+
+    Korelasi resample tidak bergantung pada lokasi dan skala kolom. Pada
+    mode float32 data hanya digeser dengan rata-rata kolom yang dibulatkan,
+    sehingga data berkode bilangan bulat (Likert) tetap bilangan bulat dan
+    jumlah frekuensi x data di `weighted_moments` tetap eksak: penjumlahan
+    float32 dibagi per blok baris yang jumlah parsialnya < 2^24, lalu
+    diakumulasi dalam float64.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Presisi tidak dikenal: {precision}")
+    X = standardize(values)
+    if precision == 'float64':
+        return X
+    values = np.asarray(values, dtype=float)
+    return (values - np.round(values.mean(axis=0))).astype(np.float32)
+
+
+def _batched_solve(A, b):
+    """`np.linalg.solve` untuk batch, dengan fallback pseudo-inverse bila singular."""
+    try:
+        return np.linalg.solve(A, b)
+    except np.linalg.LinAlgError:
+        return np.linalg.pinv(A) @ b
+
+
+def _normalize_weights(R, W):
+    """Skalakan bobot agar setiap skor konstrak memiliki varians 1."""
+    var = (W * (R @ W)).sum(axis=1)
+    return W / np.sqrt(var)[:, None, :]
+
+
+def _inner_weights(C, spec, scheme):
+    """Matriks bobot inner E (batch x K x K) dengan Z_j = sum_i E[i, j] * Y_i."""
+    if scheme == 'centroid':
+        E = np.sign(C) * spec.adjacency
+    elif scheme == 'factor':
+        E = C * spec.adjacency
+    elif scheme == 'path':
+        # Path weighting: penerus memakai korelasi, pendahulu memakai koefisien regresi
+        E = C * spec.succ
+        for j in spec.endogenous:
+            P = spec.predecessors[j]
+            coef = _batched_solve(C[:, P][:, :, P], C[:, P, j][..., None])[..., 0]
+            E[:, P, j] = coef
+    else:
+        raise ValueError(f"Skema inner weighting tidak dikenal: {scheme}")
+    E[:, spec.isolated, spec.isolated] = 1.0
+    return E
+
+
+def pls_iterate(R, spec, scheme='path', W0=None, tol=1e-7, max_iter=300):
+    """Iterasi outer/inner PLS (Mode A) pada batch matriks korelasi R (batch x p x p).
+
+    Selain bobot, mengembalikan telemetri per elemen batch: jumlah iterasi,
+    perubahan bobot terakhir (maks. absolut), status konvergensi dan jumlah
+    iterasi yang dijalankan setelah perubahan turun di bawah
+    `NEAR_TOL_FACTOR` x `tol`.
+    """
+    if tol <= 0 or max_iter < 1:
+        raise ValueError("Toleransi harus positif dan iterasi maksimum minimal 1.")
+    B = R.shape[0]
+    start = spec.mask if W0 is None else W0 * spec.mask
+    W = _normalize_weights(R, np.broadcast_to(start, (B,) + spec.mask.shape).copy())
+    n_iter = np.zeros(B, dtype=int)
+    delta = np.full(B, np.inf)
+    converged = np.zeros(B, dtype=bool)
+    near_tol_iter = np.zeros(B, dtype=int)
+
+    active = np.arange(B)
+    for it in range(1, max_iter + 1):
+        Ra, Wa = R[active], W[active]
+        RW = Ra @ Wa
+        C = Wa.transpose(0, 2, 1) @ RW
+        E = _inner_weights(C, spec, scheme)
+        W_new = _normalize_weights(Ra, (RW @ E) * spec.mask)
+        change = np.abs(W_new - Wa).max(axis=(1, 2))
+
+        W[active] = W_new
+        delta[active] = change
+        n_iter[active] = it
+        done = change < tol
+        near_tol_iter[active[~done & (change < NEAR_TOL_FACTOR * tol)]] += 1
+        converged[active[done]] = True
+        active = active[~done]
+        if active.size == 0:
+            break
+    return W, n_iter, converged, delta, near_tol_iter
+
+
+def pls_solve(R, spec, scheme='path', W0=None, tol=1e-7, max_iter=300):
+    """Estimasi PLS lengkap (bobot, loading, jalur, R²) untuk batch matriks korelasi."""
+    W, n_iter, converged, delta, near_tol_iter = pls_iterate(R, spec, scheme=scheme, W0=W0, tol=tol, max_iter=max_iter)
+    RW = R @ W
+    loadings = RW[:, spec.pair_col, spec.pair_lv]
+
+    # Orientasi tanda: mayoritas loading tiap konstrak dibuat positif
+    K = len(spec.lvs)
+    block_sum = np.zeros((R.shape[0], K))
+    np.add.at(block_sum.T, spec.pair_lv, loadings.T)
+    sign = np.where(block_sum < 0, -1.0, 1.0)
+    W = W * sign[:, None, :]
+    loadings = loadings * sign[:, spec.pair_lv]
+    C = (W.transpose(0, 2, 1) @ R) @ W
+
+    paths = np.zeros((R.shape[0], len(spec.paths)))
+    r2 = np.zeros((R.shape[0], len(spec.endogenous)))
+    path_lookup = {pos: i for i, pos in enumerate(spec.path_pos)}
+    for e, j in enumerate(spec.endogenous):
+        P = spec.predecessors[j]
+        beta = _batched_solve(C[:, P][:, :, P], C[:, P, j][..., None])[..., 0]
+        r2[:, e] = (beta * C[:, P, j]).sum(axis=1)
+        for col, i in enumerate(P):
+            paths[:, path_lookup[(i, j)]] = beta[:, col]
+
+    return {
+        'weights': W[:, spec.pair_col, spec.pair_lv],
+        'W': W,
+        'loadings': loadings,
+        'paths': paths,
+        'r2': r2,
+        'lv_corr': C,
+        'n_iter': n_iter,
+        'converged': converged,
+        'delta': delta,
+        'near_tol_iter': near_tol_iter,
+    }
+
+
+def path_matrix(spec, paths):
+    """Matriks koefisien jalur bertumpuk B[b, i, j] = β(i -> j) dari kolom jalur (batch x jalur)."""
+    K = len(spec.lvs)
+    B = np.zeros((paths.shape[0], K, K))
+    for col, (i, j) in enumerate(spec.path_pos):
+        B[:, i, j] = paths[:, col]
+    return B
+
+
+class PLSResult:
+    """Hasil fit PLS native dengan antarmuka `inspect` yang meniru tabel semopy."""
+
+    def __init__(self, spec, solution, n_obs, scheme):
+        self.spec = spec
+        self.n_obs = n_obs
+        self.scheme = scheme
+        # Simpan solusi tunggal (indeks batch 0)
+        self.solution = {key: val[0] for key, val in solution.items()}
+
+    @property
+    def W(self):
+        return self.solution['W']
+
+    def solver_summary(self):
+        """Telemetri iterasi fit ini: iterasi, perubahan bobot terakhir, konvergen, iterasi dekat toleransi."""
+        sol = self.solution
+        return {
+            'n_iter': int(sol['n_iter']),
+            'delta': float(sol['delta']),
+            'converged': bool(sol['converged']),
+            'near_tol_iter': int(sol['near_tol_iter']),
+        }
+
+    def param_vector(self):
+        """Vektor parameter dengan urutan yang sama seperti baris `inspect(mode='estimates')`."""
+        return np.concatenate([self.solution['loadings'], self.solution['paths']])
+
+    def inspect(self, mode='estimates', **kwargs):
+        """Tabel hasil: 'estimates', 'weights', 'r2' atau 'variances'.
+
+        Argumen gaya semopy lain (`lv`, `rv`, `col`, `std`, `pretty_names`)
+        diterima demi kompatibilitas; semua estimasi sudah terstandarisasi.
+        """
+        spec, sol = self.spec, self.solution
+        pair_rows = [(spec.lvs[k], spec.indicators[c]) for k, c in spec.pairs]
+        if mode == 'estimates':
+            rows = [(lv, '=~', ind) for lv, ind in pair_rows] + [(t, '~', f) for f, t in spec.paths]
+            out = pd.DataFrame(rows, columns=KEY_COLS)
+            out['Estimate'] = self.param_vector()
+            out['p-value'] = np.nan
+            return out
+        if mode == 'weights':
+            out = pd.DataFrame(pair_rows, columns=['lval', 'rval'])
+            out.insert(1, 'op', '=~')
+            out['Weight'] = sol['weights']
+            return out
+        if mode == 'r2':
+            r2 = sol['r2']
+            k = np.array([spec.predecessors[j].size for j in spec.endogenous])
+            adj = 1 - (1 - r2) * (self.n_obs - 1) / (self.n_obs - k - 1)
+            return pd.DataFrame({
+                'Konstrak': [spec.lvs[j] for j in spec.endogenous],
+                'R²': r2,
+                'R² Adjusted': adj,
+            })
+        if mode == 'variances':
+            ind_rows = [(ind, '~~', ind, 1 - l ** 2) for (_, ind), l in zip(pair_rows, sol['loadings'])]
+            lv_rows = [(spec.lvs[j], '~~', spec.lvs[j], 1 - r) for j, r in zip(spec.endogenous, sol['r2'])]
+            return pd.DataFrame(ind_rows + lv_rows, columns=KEY_COLS + ['Estimate'])
+        raise ValueError(f"Mode inspect tidak dikenal: {mode}")
+
+
+def fit_pls(desc, data, scheme='path', tol=1e-7, max_iter=300):
+    """Fit PLS-SEM native (Mode A) pada data indikator terstandarisasi.
+
+    `desc` berupa syntax model atau `PLSSpec` yang sudah di-parse.
+    """
+    spec = desc if isinstance(desc, PLSSpec) else parse_model_syntax(desc)
+    missing = [ind for ind in spec.indicators if ind not in data.columns]
+    if missing:
+        raise ValueError(f"Indikator tidak ditemukan di data: {', '.join(missing)}")
+    X = standardize(data[spec.indicators].to_numpy())
+    R = (X.T @ X / (X.shape[0] - 1))[None]
+    solution = pls_solve(R, spec, scheme=scheme, tol=tol, max_iter=max_iter)
+    return PLSResult(spec, solution, X.shape[0], scheme)
+
+
+def fit_pls_correlation(corr, n_obs, desc, scheme='path', tol=1e-7, max_iter=300):
+    """Fit PLS-SEM native dari matriks korelasi indikator berlabel, tanpa data mentah.
+
+    Estimasi PLS hanya bergantung pada data melalui matriks korelasi, sehingga
+    `corr` dapat berasal dari statistik cukup streaming
+    (`pls_data.stream_moments`) untuk dataset yang tidak muat di memori.
+    """
+    spec = desc if isinstance(desc, PLSSpec) else parse_model_syntax(desc)
+    missing = [ind for ind in spec.indicators if ind not in corr.columns]
+    if missing:
+        raise ValueError(f"Indikator tidak ditemukan di data: {', '.join(missing)}")
+    R = corr.loc[spec.indicators, spec.indicators].to_numpy(dtype=float)
+    if not np.isfinite(R).all():
+        raise ValueError("Matriks korelasi mengandung nilai kosong.")
+    solution = pls_solve(R[None], spec, scheme=scheme, tol=tol, max_iter=max_iter)
+    return PLSResult(spec, solution, n_obs, scheme)
+
+
+def _float32_row_blocks(X, counts):
+    """Awal blok baris agar jumlah frekuensi x maks|x|² setiap blok < 2^24 untuk semua replikasi batch."""
+    n = X.shape[0]
+    peak = max(float(np.abs(X).max(initial=0.0)) ** 2, 1.0)
+    size = max(1, min(n, int((FLOAT32_EXACT - 1) // peak)))
+    while size > 1 and np.add.reduceat(counts, np.arange(0, n, size), axis=1).max() * peak >= FLOAT32_EXACT:
+        size //= 2
+    return np.arange(0, n, size)
+
+
+def weighted_moments(X, counts):
+    """Rata-rata dan kovarians (pembagi jumlah bobot) untuk batch bobot baris (batch x n).
+
+    Untuk `X` float32 (lihat `resample_matrix`) hanya perkalian matriks besar
+    yang berjalan dalam float32 pada frekuensi mentah, per blok baris yang
+    cukup kecil agar jumlah parsialnya eksak untuk data bilangan bulat;
+    akumulasi antarblok, normalisasi dan pemusatan (rawan cancellation)
+    dilakukan dalam float64.
+    """
+    if X.dtype == np.float32:
+        w32 = counts.astype(np.float32)
+        total = counts.sum(axis=1, keepdims=True, dtype=np.float64)
+        first = np.zeros((counts.shape[0], X.shape[1]))
+        second = np.zeros((counts.shape[0], X.shape[1], X.shape[1]))
+        starts = _float32_row_blocks(X, counts)
+        for lo, hi in zip(starts, [*starts[1:], X.shape[0]]):
+            block, wb = X[lo:hi], w32[:, lo:hi]
+            first += wb @ block
+            second += (block.T * wb[:, None, :]) @ block
+        mean = first / total
+        return mean, second / total[:, :, None] - mean[:, :, None] * mean[:, None, :]
+    w = counts / counts.sum(axis=1, keepdims=True)
+    mean = w @ X
+    cov = (X.T * w[:, None, :]) @ X - mean[:, :, None] * mean[:, None, :]
+    return mean, cov
+
+
+def bootstrap_correlations(X, counts):
+    """Matriks korelasi untuk batch resample yang dinyatakan sebagai frekuensi baris (batch x n).
+
+    Bobot baris tidak harus berjumlah n: indikator keanggotaan 0/1 memberi
+    matriks korelasi subsampel (mis. grup pada analisis multi-grup).
+    """
+    _, cov = weighted_moments(X, counts)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sd = np.sqrt(np.einsum('bii->bi', cov))
+        return cov / (sd[:, :, None] * sd[:, None, :])
+
+
+# --- Fungsi Fit ---
+
+def semopy_pls_estimates(desc, data):
+    """Fit model dengan semopy (PLS) dan kembalikan tabel estimasi."""
+    model = semopy.Model(desc)
+    res = model.fit(data, algo="PLS")
+    return res.inspect(mode='estimates')
+
+
+def native_pls_estimates(desc, data, scheme='path', tol=1e-7, max_iter=300):
+    """Fit model dengan estimator native dan kembalikan tabel estimasi."""
+    return fit_pls(desc, data, scheme=scheme, tol=tol, max_iter=max_iter).inspect(mode='estimates')
+
+
+FIT_FUNCTIONS = {
+    'semopy': semopy_pls_estimates,
+    'native': native_pls_estimates,
+}
+
+
+# --- Bootstrap Paralel ---
+
+class BootstrapResult:
+    """Hasil bootstrap: matriks replikasi (replikasi x parameter) beserta estimasi sampel penuh."""
+
+    def __init__(self, estimates, replicates, seed, n_iter=None, delta=None, converged=None, near_tol_iter=None):
+        self.estimates = estimates.reset_index(drop=True)
+        self.replicates = replicates
+        self.seed = seed
+        # Telemetri solver per replikasi (hanya tersedia untuk engine native, lihat SOLVER_FIELDS)
+        self.n_iter = n_iter
+        self.delta = delta
+        self.converged = converged
+        self.near_tol_iter = near_tol_iter
+        self.stopped_early = False
+
+    def telemetry(self):
+        """Dict array telemetri solver yang tersedia (kosong untuk engine semopy)."""
+        return {key: getattr(self, key) for key in SOLVER_FIELDS if getattr(self, key) is not None}
+
+    def iteration_summary(self):
+        """Ringkasan iterasi per replikasi: total, rata-rata, median, maksimum dan konvergensi.
+
+        `non_converged` adalah replikasi valid yang berhenti di `max_iter`;
+        `near_tol_share` adalah porsi iterasi yang dijalankan ketika
+        perubahan bobot sudah di bawah `NEAR_TOL_FACTOR` x tol.
+        """
+        if self.n_iter is None:
+            return None
+        ran = self.n_iter > 0
+        valid = self.n_iter[ran]
+        if valid.size == 0:
+            return None
+        summary = {
+            'total': int(valid.sum()),
+            'mean': float(valid.mean()),
+            'median': float(np.median(valid)),
+            'max': int(valid.max()),
+        }
+        if self.converged is not None:
+            summary['non_converged'] = self.n_nonconverged
+            summary['max_delta'] = float(self.delta[ran].max())
+        if self.near_tol_iter is not None:
+            summary['near_tol_share'] = float(self.near_tol_iter[ran].sum() / valid.sum())
+        return summary
+
+    @property
+    def n_nonconverged(self):
+        """Replikasi dengan estimasi tetapi tanpa konvergensi (None bila telemetri tidak tersedia)."""
+        if self.converged is None:
+            return None
+        return int((np.isfinite(self.replicates).all(axis=1) & ~self.converged).sum())
+
+    def exclude_nonconverged(self):
+        """Salinan hasil dengan replikasi yang tidak konvergen ditandai gagal (NaN) agar tidak ikut dirangkum."""
+        if not self.n_nonconverged:
+            return self
+        replicates = self.replicates.copy()
+        replicates[~self.converged] = np.nan
+        out = BootstrapResult(self.estimates, replicates, self.seed, **self.telemetry())
+        out.stopped_early = self.stopped_early
+        return out
+
+    def solver_table(self):
+        """Telemetri per replikasi: Replikasi, Iterasi, Δ Bobot Akhir, Konvergen, Iterasi Dekat Toleransi, Valid."""
+        if self.n_iter is None:
+            return pd.DataFrame()
+        out = pd.DataFrame({'Replikasi': np.arange(self.replicates.shape[0]), 'Iterasi': self.n_iter})
+        if self.delta is not None:
+            out['Δ Bobot Akhir'] = self.delta
+        if self.converged is not None:
+            out['Konvergen'] = self.converged
+        if self.near_tol_iter is not None:
+            out['Iterasi Dekat Toleransi'] = self.near_tol_iter
+        out['Valid'] = np.isfinite(self.replicates).all(axis=1)
+        return out
+
+    @property
+    def precision(self):
+        """Presisi penyimpanan replikasi ('float64' atau 'float32')."""
+        return 'float32' if self.replicates.dtype == np.float32 else 'float64'
+
+    @property
+    def n_valid(self):
+        return int(np.isfinite(self.replicates).all(axis=1).sum())
+
+    @property
+    def n_failed(self):
+        return self.replicates.shape[0] - self.n_valid
+
+    def inspect(self, mode='estimates'):
+        """Tabel ringkasan bootstrap dengan kolom yang sama seperti `boot_res.inspect(mode='estimates')`."""
+        if mode != 'estimates':
+            raise ValueError(f"Mode inspect tidak dikenal: {mode}")
+        return bootstrap_summary(self.estimates, self.replicates)
+
+    def valid_replicates(self):
+        # Replikasi float32 dinaikkan ke float64 sebelum dirangkum
+        return self.replicates[np.isfinite(self.replicates).all(axis=1)].astype(np.float64)
+
+    def confidence_intervals(self, level=0.95, method='percentile', jackknife=None):
+        """Interval kepercayaan bootstrap per parameter: 'percentile', 'bc' (bias-corrected) atau 'bca'.
+
+        'bca' memerlukan `jackknife` (DataFrame estimasi leave-one-out berkolom
+        kunci parameter, lihat `jackknife_estimates`); parameter tanpa kolom
+        jackknife memakai percepatan 0 (setara BC).
+        """
+        valid = self.valid_replicates()
+        out = self.estimates[KEY_COLS + ['Estimate']].copy()
+        lower, upper = bootstrap_intervals(
+            out['Estimate'].to_numpy(dtype=float), valid, level=level, method=method,
+            jackknife=None if jackknife is None else jackknife.reindex(columns=pd.MultiIndex.from_frame(out[KEY_COLS]))
+        )
+        out['CI Lower'] = lower
+        out['CI Upper'] = upper
+        return out
+
+
+def jackknife_acceleration(jack):
+    """Percepatan BCa per kolom dari estimasi leave-one-out (nilai NaN diabaikan, kolom kosong bernilai 0)."""
+    jack = np.asarray(jack, dtype=float)
+    finite = np.isfinite(jack)
+    mean = np.where(finite, jack, 0.0).sum(axis=0) / np.maximum(finite.sum(axis=0), 1)
+    d = np.where(finite, mean - jack, 0.0)
+    num = (d ** 3).sum(axis=0)
+    den = 6 * (d ** 2).sum(axis=0) ** 1.5
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(den > 0, num / den, 0.0)
+
+
+def bootstrap_intervals(original, replicates, level=0.95, method='percentile', jackknife=None):
+    """Batas bawah/atas per kolom `replicates` (replikasi valid x statistik) untuk estimasi `original`."""
+    lo_q, hi_q = (1 - level) / 2, 1 - (1 - level) / 2
+    if method == 'percentile':
+        return np.quantile(replicates, [lo_q, hi_q], axis=0)
+    if method not in ('bc', 'bca'):
+        raise ValueError(f"Metode interval tidak dikenal: {method}")
+    B = replicates.shape[0]
+    prop = (replicates < original).mean(axis=0)
+    z0 = stats.norm.ppf(np.clip(prop, 1 / (B + 1), 1 - 1 / (B + 1)))
+    accel = np.zeros_like(z0)
+    if method == 'bca':
+        if jackknife is None:
+            raise ValueError("Interval BCa memerlukan estimasi jackknife.")
+        accel = jackknife_acceleration(jackknife)
+
+    def adjusted(q):
+        z = z0 + stats.norm.ppf(q)
+        return stats.norm.cdf(z0 + z / (1 - accel * z))
+
+    a_lo, a_hi = adjusted(lo_q), adjusted(hi_q)
+    lower = np.array([np.quantile(replicates[:, i], a_lo[i]) for i in range(replicates.shape[1])])
+    upper = np.array([np.quantile(replicates[:, i], a_hi[i]) for i in range(replicates.shape[1])])
+    return lower, upper
+
+
+def bootstrap_summary(estimates, replicates):
+    """Hitung Sample Mean, Std. Err, T-stat dan p-value dari matriks replikasi."""
+    valid = replicates[np.isfinite(replicates).all(axis=1)].astype(np.float64)
+    n_valid = valid.shape[0]
+    out = estimates[KEY_COLS + ['Estimate']].copy()
+    if n_valid < 2:
+        out['Sample Mean'] = np.nan
+        out['Std. Err'] = np.nan
+        out['T-stat'] = np.nan
+        out['p-value'] = np.nan
+        return out
+
+    original = out['Estimate'].to_numpy(dtype=float)
+    std_err = valid.std(axis=0, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = np.abs(original) / std_err
+    # Two-tailed p-value dengan df = jumlah replikasi - 1 (konvensi SmartPLS)
+    p_value = 2 * stats.t.sf(t_stat, df=n_valid - 1)
+
+    out['Sample Mean'] = valid.mean(axis=0)
+    out['Std. Err'] = std_err
+    out['T-stat'] = t_stat
+    out['p-value'] = p_value
+    return out
+
+
+def _resample_counts(n, seed_seqs):
+    """Frekuensi baris per replikasi; satu stream RNG per replikasi."""
+    counts = np.empty((len(seed_seqs), n))
+    for i, seed_seq in enumerate(seed_seqs):
+        idx = np.random.default_rng(seed_seq).integers(0, n, size=n)
+        counts[i] = np.bincount(idx, minlength=n)
+    return counts
+
+
+def _bootstrap_chunk(fit_fn, desc, values, columns, param_index, seed_seqs, fit_kwargs):
+    """Worker: jalankan sekumpulan replikasi, satu stream RNG per replikasi."""
+    n = values.shape[0]
+    out = np.full((len(seed_seqs), len(param_index)), np.nan)
+    # semopy tidak melaporkan jumlah iterasi PLS
+    n_iter = None
+    for i, seed_seq in enumerate(seed_seqs):
+        rng = np.random.default_rng(seed_seq)
+        idx = rng.integers(0, n, size=n)
+        sample = pd.DataFrame(values[idx], columns=columns)
+        try:
+            est = fit_fn(desc, sample, **fit_kwargs)
+        except Exception:
+            # Replikasi gagal (mis. matriks singular) dicatat sebagai NaN
+            continue
+        est = est.set_index(KEY_COLS)['Estimate']
+        est = est[~est.index.duplicated()]
+        out[i] = est.reindex(param_index).to_numpy(dtype=float)
+    return out, n_iter
+
+
+def _native_bootstrap_chunk(spec, X, seed_seqs, fit_kwargs, batch_size, W0):
+    """Worker native: fit banyak resample sekaligus sebagai array bertumpuk.
+
+    `W0` (bobot outer sampel penuh) dipakai sebagai nilai awal iterasi
+    setiap resample; `None` berarti mulai dari bobot seragam.
+    """
+    n = X.shape[0]
+    # Replikasi disimpan dengan presisi data resample (float32 memperkecil replicate store)
+    out = np.full((len(seed_seqs), spec.n_params), np.nan, dtype=X.dtype)
+    telemetry = _empty_telemetry(len(seed_seqs))
+    for start in range(0, len(seed_seqs), batch_size):
+        counts = _resample_counts(n, seed_seqs[start:start + batch_size])
+        R = bootstrap_correlations(X, counts)
+        ok = np.isfinite(R).all(axis=(1, 2))
+        if not ok.any():
+            continue
+        sol = pls_solve(R[ok], spec, W0=W0, **fit_kwargs)
+        block = out[start:start + len(counts)]
+        block[ok] = np.hstack([sol['loadings'], sol['paths']])
+        for key in SOLVER_FIELDS:
+            telemetry[key][start:start + len(counts)][ok] = sol[key]
+    return out, telemetry
+
+
+def _empty_telemetry(n):
+    """Array telemetri solver untuk `n` replikasi yang belum/tidak di-fit."""
+    return {
+        'n_iter': np.zeros(n, dtype=int),
+        'delta': np.full(n, np.nan),
+        'converged': np.zeros(n, dtype=bool),
+        'near_tol_iter': np.zeros(n, dtype=int),
+    }
+
+
+def _concat_telemetry(parts):
+    """Gabungkan telemetri per chunk/batch berurutan; None untuk engine tanpa telemetri."""
+    if not parts or parts[0] is None:
+        return None
+    return {key: np.concatenate([part[key] for part in parts]) for key in SOLVER_FIELDS}
+
+
+def default_batch_size(X, budget_bytes):
+    """Ukuran batch resample: `BATCH_SIZE`, diperkecil bila array batch (batch x n x p) melebihi anggaran byte."""
+    return max(1, min(BATCH_SIZE, int(budget_bytes // (X.itemsize * X.shape[0] * X.shape[1]))))
+
+
+def run_chunks(worker, make_args, seed_seqs, n_jobs, pool=None, progress=None, batch_size=1):
+    """Bagi `seed_seqs` menjadi chunk, jalankan `worker(*make_args(chunk))` dan kembalikan hasil berurutan.
+
+    Ukuran chunk dibulatkan ke kelipatan `batch_size` (ukuran batch yang
+    dipakai worker di dalam chunk), sehingga batas batch selalu berada di
+    kelipatan `batch_size` dari awal `seed_seqs` berapa pun `n_jobs`-nya.
+    `progress(n_selesai, n_total)` dipanggil setiap chunk selesai; exception
+    dari callback (mis. pembatalan job) menghentikan chunk yang tersisa.
+    """
+    n_batches = int(np.ceil(len(seed_seqs) / batch_size))
+    chunk_size = batch_size * max(1, int(np.ceil(n_batches / (n_jobs * 4))))
+    chunks = [seed_seqs[i:i + chunk_size] for i in range(0, len(seed_seqs), chunk_size)]
+    done = 0
+    if pool is None:
+        blocks = []
+        for c in chunks:
+            blocks.append(worker(*make_args(c)))
+            done += len(c)
+            if progress is not None:
+                progress(done, len(seed_seqs))
+        return blocks
+    futures = {pool.submit(worker, *make_args(c)): i for i, c in enumerate(chunks)}
+    blocks = [None] * len(chunks)
+    try:
+        for f in as_completed(futures):
+            i = futures[f]
+            blocks[i] = f.result()
+            done += len(chunks[i])
+            if progress is not None:
+                progress(done, len(seed_seqs))
+    except BaseException:
+        for f in futures:
+            f.cancel()
+        raise
+    return blocks
+
+
+class _BootstrapPlan:
+    """Persiapan bootstrap bersama: fit sampel penuh dan fungsi worker per chunk."""
+
+    def __init__(self, desc, data, engine, fit_kwargs, warm_start, batch_size, precision='float64',
+                 replicate_kwargs=None):
+        self.engine = engine
+        if precision != 'float64' and engine != 'native':
+            raise ValueError("Mode presisi float32 hanya tersedia untuk engine native.")
+        if replicate_kwargs and engine != 'native':
+            raise ValueError("Pengaturan solver replikasi hanya tersedia untuk engine native.")
+        if engine == 'native':
+            full_res = fit_pls(desc, data, **fit_kwargs)
+            self.estimates = full_res.inspect(mode='estimates')
+            spec = parse_model_syntax(desc)
+            X = resample_matrix(data[spec.indicators].to_numpy(), precision)
+            if batch_size is None:
+                # Batasi array resample sekitar 64 MB per batch
+                batch_size = default_batch_size(X, 64e6)
+            self.batch_size = batch_size
+            W0 = full_res.W if warm_start else None
+            # Replikasi boleh memakai toleransi/iterasi maksimum sendiri; sampel penuh tetap memakai fit_kwargs
+            boot_kwargs = dict(fit_kwargs, **(replicate_kwargs or {}))
+            self.worker = _native_bootstrap_chunk
+            self.make_args = lambda c: (spec, X, c, boot_kwargs, batch_size, W0)
+        else:
+            fit_fn = FIT_FUNCTIONS[engine]
+            self.batch_size = 1
+            self.estimates = fit_fn(desc, data, **fit_kwargs)
+            param_index = pd.MultiIndex.from_frame(self.estimates[KEY_COLS])
+            values = data.to_numpy()
+            columns = list(data.columns)
+            self.worker = _bootstrap_chunk
+            self.make_args = lambda c: (fit_fn, desc, values, columns, param_index, c, fit_kwargs)
+
+    def run(self, seed_seqs, n_jobs, pool=None, progress=None):
+        """Jalankan replikasi untuk `seed_seqs`; hasil selalu berurutan sesuai replikasi."""
+        blocks = run_chunks(self.worker, self.make_args, seed_seqs, n_jobs, pool=pool, progress=progress,
+                            batch_size=self.batch_size)
+        replicates = np.vstack([out for out, _ in blocks])
+        return replicates, _concat_telemetry([telemetry for _, telemetry in blocks])
+
+
+def _resolve_seed_jobs(seed, n_jobs, nboot):
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % (2**32))
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    return seed, max(1, min(int(n_jobs), nboot))
+
+
+def parallel_bootstrap(desc, data, nboot, seed=None, n_jobs=None, engine='semopy', fit_kwargs=None,
+                       batch_size=None, warm_start=True, progress=None, precision='float64', replicate_kwargs=None):
+    """Bootstrap multi-core dengan stream RNG independen per replikasi.
+
+    Setiap replikasi mendapat `SeedSequence` anaknya sendiri, hasilnya
+    disusun menurut nomor replikasi dan batas batch native berada di
+    kelipatan `batch_size` yang tidak bergantung pada jumlah worker (lihat
+    `run_chunks`), sehingga untuk `seed` dan `batch_size` yang sama hasilnya
+    identik bit-per-bit berapa pun jumlah worker yang dipakai. Dengan
+    `engine='native'` setiap worker mem-fit resample-nya secara batch dan,
+    bila `warm_start`, memulai iterasi dari bobot outer sampel penuh.
+    `precision='float32'` (native) membentuk matriks korelasi resample dari
+    data float32 dan menyimpan replikasi sebagai float32. `replicate_kwargs`
+    (mis. `{'tol': 1e-5, 'max_iter': 100}`) menimpa pengaturan solver hanya
+    untuk replikasi, sehingga bootstrap besar bisa ditukar presisi demi
+    kecepatan tanpa mengubah estimasi sampel penuh.
+    """
+    seed, n_jobs = _resolve_seed_jobs(seed, n_jobs, nboot)
+    plan = _BootstrapPlan(desc, data, engine, fit_kwargs or {}, warm_start, batch_size, precision, replicate_kwargs)
+    seed_seqs = np.random.SeedSequence(seed).spawn(nboot)
+
+    if n_jobs == 1:
+        replicates, telemetry = plan.run(seed_seqs, n_jobs, progress=progress)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            replicates, telemetry = plan.run(seed_seqs, n_jobs, pool=pool, progress=progress)
+    return BootstrapResult(plan.estimates, replicates, seed, **(telemetry or {}))
+
+
+# --- Bootstrap Progresif (Early Stopping) ---
+
+def decision_stability(boot_res, alpha, confidence=0.99):
+    """Stabilitas keputusan signifikansi per parameter berdasarkan error Monte-Carlo.
+
+    Galat standar T-stat akibat jumlah replikasi terbatas didekati dengan
+    T / sqrt(2(B-1)). Keputusan dianggap stabil bila interval Monte-Carlo
+    T-stat tidak memuat nilai kritis t pada `alpha`.
+    """
+    summary = boot_res.inspect(mode='estimates')
+    B = boot_res.n_valid
+    if B < 2:
+        summary['MC Error'] = np.nan
+        summary['Stabil'] = False
+        return summary
+    df = B - 1
+    t_stat = summary['T-stat'].to_numpy(dtype=float)
+    t_crit = stats.t.isf(alpha / 2, df=df)
+    z = stats.norm.isf((1 - confidence) / 2)
+    t_se = t_stat / np.sqrt(2 * df)
+    # Error Monte-Carlo p-value via metode delta: |dp/dT| * se(T)
+    summary['MC Error'] = 2 * stats.t.pdf(t_stat, df=df) * t_se
+    summary['Stabil'] = np.abs(t_stat - t_crit) > z * t_se
+    return summary
+
+
+def progressive_bootstrap(desc, data, max_boot, alpha, seed=None, n_jobs=None, engine='semopy', fit_kwargs=None,
+                          batch=500, min_boot=1000, confidence=0.99, batch_size=None, warm_start=True,
+                          precision='float64', replicate_kwargs=None):
+    """Bootstrap bertahap: yield `(hasil_sementara, stabilitas)` setiap batch.
+
+    Berhenti otomatis ketika keputusan semua jalur struktural (`~`) stabil
+    pada `alpha` (dan minimal `min_boot` replikasi), atau saat mencapai
+    `max_boot`. Ukuran tahap `batch` dibulatkan ke kelipatan ukuran batch
+    worker agar batas batch sama dengan `parallel_bootstrap`; replikasi ke-i
+    identik dengan replikasi ke-i pada `parallel_bootstrap` dengan seed dan
+    `batch_size` yang sama.
+    """
+    seed, n_jobs = _resolve_seed_jobs(seed, n_jobs, max_boot)
+    plan = _BootstrapPlan(desc, data, engine, fit_kwargs or {}, warm_start, batch_size, precision, replicate_kwargs)
+    batch = plan.batch_size * max(1, int(np.ceil(batch / plan.batch_size)))
+    seed_seqs = np.random.SeedSequence(seed).spawn(max_boot)
+    is_path = (plan.estimates['op'] == '~').to_numpy()
+
+    pool = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+    try:
+        blocks, telemetry = [], []
+        for start in range(0, max_boot, batch):
+            out, batch_telemetry = plan.run(seed_seqs[start:start + batch], n_jobs, pool=pool)
+            blocks.append(out)
+            telemetry.append(batch_telemetry)
+            result = BootstrapResult(plan.estimates, np.vstack(blocks), seed, **(_concat_telemetry(telemetry) or {}))
+            stability = decision_stability(result, alpha, confidence=confidence)
+            done = result.replicates.shape[0] >= max_boot
+            result.stopped_early = (
+                not done and result.replicates.shape[0] >= min_boot and bool(stability['Stabil'][is_path].all())
+            )
+            yield result, stability
+            if done or result.stopped_early:
+                return
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+# --- Jackknife (untuk Interval BCa) ---
+
+def jackknife_correlations(X, XtX, rows):
+    """Matriks korelasi leave-one-out untuk baris `rows` (batch x p x p).
+
+    `X` harus terpusat (mis. hasil `standardize`) dan `XtX = X'X`; setiap
+    matriks adalah downdate rank-satu X'X - n/(n-1) x_i x_i', tanpa membaca
+    ulang data.
+    """
+    n = X.shape[0]
+    x = X[rows]
+    m2 = XtX[None] - (n / (n - 1)) * x[:, :, None] * x[:, None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sd = np.sqrt(np.einsum('bii->bi', m2))
+        return m2 / (sd[:, :, None] * sd[:, None, :])
+
+
+def _jackknife_chunk(spec, X, XtX, rows, fit_kwargs, batch_size, W0):
+    """Worker: fit leave-one-out untuk sekumpulan baris sebagai batch bertumpuk."""
+    rows = np.asarray(rows)
+    out = np.full((len(rows), spec.n_params), np.nan)
+    n_iter = np.zeros(len(rows), dtype=int)
+    for start in range(0, len(rows), batch_size):
+        R = jackknife_correlations(X, XtX, rows[start:start + batch_size])
+        ok = np.isfinite(R).all(axis=(1, 2))
+        if not ok.any():
+            continue
+        sol = pls_solve(R[ok], spec, W0=W0, **fit_kwargs)
+        out[start:start + len(R)][ok] = np.hstack([sol['loadings'], sol['paths']])
+        n_iter[start:start + len(R)][ok] = sol['n_iter']
+    return out, n_iter
+
+
+def jackknife_estimates(desc, data, scheme='path', n_jobs=1, batch_size=None, progress=None, tol=1e-7, max_iter=300):
+    """Estimasi leave-one-out estimator native (n x parameter) untuk percepatan BCa.
+
+    Semua worker memakai data terstandarisasi dan X'X yang sama; setiap fit
+    dimulai dari bobot outer sampel penuh dan memakai `tol`/`max_iter` yang
+    sama dengan fit sampel penuh. Kolom DataFrame adalah kunci parameter
+    (`lval`, `op`, `rval`) seperti tabel `inspect(mode='estimates')`.
+    """
+    full_res = fit_pls(desc, data, scheme=scheme, tol=tol, max_iter=max_iter)
+    spec = full_res.spec
+    X = standardize(data[spec.indicators].to_numpy())
+    XtX = X.T @ X
+    n = X.shape[0]
+    if batch_size is None:
+        # Batasi tumpukan matriks korelasi sekitar 32 MB per batch
+        batch_size = max(1, min(BATCH_SIZE, int(4e6 // X.shape[1] ** 2)))
+    _, n_jobs = _resolve_seed_jobs(0, n_jobs, n)
+    fit_kwargs = {'scheme': scheme, 'tol': tol, 'max_iter': max_iter}
+
+    def make_args(chunk):
+        return spec, X, XtX, chunk, fit_kwargs, batch_size, full_res.W
+
+    rows = list(range(n))
+    if n_jobs == 1:
+        blocks = run_chunks(_jackknife_chunk, make_args, rows, 1, progress=progress, batch_size=batch_size)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = run_chunks(_jackknife_chunk, make_args, rows, n_jobs, pool=pool, progress=progress,
+                                batch_size=batch_size)
+    columns = pd.MultiIndex.from_frame(full_res.inspect(mode='estimates')[KEY_COLS])
+    return pd.DataFrame(np.vstack([out for out, _ in blocks]), columns=columns)
+
+
+# --- Laporan Akurasi Mode float32 ---
+
+# Batas selisih absolut maksimum replikasi float32 vs float64 agar mode float32 diterima
+PRECISION_TOLERANCE = 1e-3
+
+
+def precision_report(desc, data, nboot=1000, seed=42, n_jobs=1, scheme='path', warm_start=True, alpha=0.05,
+                     level=0.95, tolerance=PRECISION_TOLERANCE, tol=1e-7, max_iter=300, replicate_kwargs=None):
+    """Bandingkan bootstrap native float32 dan float64 dengan seed yang sama, replikasi demi replikasi.
+
+    Karena replikasi ke-i memakai resample yang sama pada kedua presisi,
+    selisihnya murni akibat pembulatan. Tabel per parameter memuat galat
+    standar, batas interval persentil dan p-value kedua mode beserta
+    selisihnya; `attrs` berisi ringkasan (selisih maksimum, kecocokan
+    keputusan pada `alpha`, waktu dan ukuran replikasi) serta `accepted`
+    bila selisih maksimum <= `tolerance` dan semua keputusan sama. Pengaturan
+    solver (`tol`, `max_iter`, `replicate_kwargs`) sama dengan `parallel_bootstrap`.
+    """
+    fit_kwargs = {'scheme': scheme, 'tol': tol, 'max_iter': max_iter}
+    runs, seconds = {}, {}
+    for precision in PRECISIONS:
+        started = time.perf_counter()
+        runs[precision] = parallel_bootstrap(desc, data, nboot, seed=seed, n_jobs=n_jobs, engine='native',
+                                             fit_kwargs=fit_kwargs, warm_start=warm_start, precision=precision,
+                                             replicate_kwargs=replicate_kwargs)
+        seconds[precision] = time.perf_counter() - started
+    ref, low = runs['float64'], runs['float32']
+    both = np.isfinite(ref.replicates).all(axis=1) & np.isfinite(low.replicates).all(axis=1)
+    diff = np.abs(low.replicates[both].astype(np.float64) - ref.replicates[both])
+
+    out = ref.estimates[KEY_COLS + ['Estimate']].copy()
+    summaries = {precision: run.inspect(mode='estimates') for precision, run in runs.items()}
+    intervals = {precision: run.confidence_intervals(level=level) for precision, run in runs.items()}
+    for precision, label in (('float64', 'f64'), ('float32', 'f32')):
+        out[f'Std. Err ({label})'] = summaries[precision]['Std. Err']
+        out[f'CI Lower ({label})'] = intervals[precision]['CI Lower']
+        out[f'CI Upper ({label})'] = intervals[precision]['CI Upper']
+        out[f'p-value ({label})'] = summaries[precision]['p-value']
+    out['Maks |Δ Replikasi|'] = diff.max(axis=0) if diff.size else np.nan
+    out['|Δ Std. Err|'] = (out['Std. Err (f32)'] - out['Std. Err (f64)']).abs()
+    out['Maks |Δ CI|'] = np.maximum((out['CI Lower (f32)'] - out['CI Lower (f64)']).abs(),
+                                    (out['CI Upper (f32)'] - out['CI Upper (f64)']).abs())
+    out['Keputusan Sama'] = (out['p-value (f32)'] < alpha) == (out['p-value (f64)'] < alpha)
+
+    max_diff = float(np.nanmax(out['Maks |Δ Replikasi|'])) if len(out) else 0.0
+    out.attrs.update({
+        'n_compared': int(both.sum()),
+        'max_abs_diff': max_diff,
+        'decisions_agree': bool(out['Keputusan Sama'].all()),
+        'seconds_float64': seconds['float64'],
+        'seconds_float32': seconds['float32'],
+        'bytes_float64': int(ref.replicates.nbytes),
+        'bytes_float32': int(low.replicates.nbytes),
+        'tolerance': tolerance,
+    })
+    out.attrs['accepted'] = out.attrs['decisions_agree'] and max_diff <= tolerance
+    return out
+
+
+# --- Pipeline Analisis Lengkap ---
+
+# Mode bootstrap internal: 'parallel', 'progressive' atau 'semopy' (model.bootstrap bawaan)
+BOOTSTRAP_MODES = ['parallel', 'progressive', 'semopy']
+
+
+def run_analysis(desc, data, engine='semopy', scheme='path', nboot=5000, bootstrap_mode='parallel', seed=42,
+                 n_jobs=None, warm_start=True, alpha=0.05, progress=None, profiler=None, precision='float64',
+                 tol=1e-7, max_iter=300, boot_tol=None, boot_max_iter=None):
+    """Fit model final dan bootstrap tanpa UI; kembalikan `(res, boot_res)`.
+
+    Dipakai oleh job latar belakang sehingga hasilnya identik dengan
+    analisis yang dijalankan langsung di halaman 4. `profiler` opsional
+    (`pls_profile.StageProfiler`) mencatat tahap parsing, fit dan bootstrap.
+    `tol`/`max_iter` mengatur solver native; `boot_tol`/`boot_max_iter`
+    (default sama) hanya berlaku untuk replikasi bootstrap.
+    """
+    if precision != 'float64' and engine != 'native':
+        raise ValueError("Mode presisi float32 hanya tersedia untuk engine native.")
+    fit_kwargs = {'scheme': scheme, 'tol': tol, 'max_iter': max_iter} if engine == 'native' else None
+    replicate_kwargs = None
+    if engine == 'native':
+        replicate_kwargs = {key: val for key, val in (('tol', boot_tol), ('max_iter', boot_max_iter)) if val is not None}
+    with profile_stage(profiler, "Parsing syntax model", category='engine'):
+        model = parse_model_syntax(desc) if engine == 'native' else semopy.Model(desc)
+    with profile_stage(profiler, "Fit PLS (model penuh)", category='engine'):
+        if engine == 'native':
+            res = fit_pls(model, data, scheme=scheme, tol=tol, max_iter=max_iter)
+        else:
+            res = model.fit(data, algo="PLS")
+
+    with profile_stage(profiler, f"Bootstrap ({bootstrap_mode}, N={nboot:,})", category='engine'):
+        if bootstrap_mode == 'progressive':
+            for boot_res, _ in progressive_bootstrap(desc, data, nboot, alpha, seed=seed, n_jobs=n_jobs,
+                                                     engine=engine, fit_kwargs=fit_kwargs, warm_start=warm_start,
+                                                     precision=precision, replicate_kwargs=replicate_kwargs):
+                if progress is not None:
+                    progress(boot_res.replicates.shape[0], nboot)
+        elif engine == 'native' or bootstrap_mode == 'parallel':
+            boot_res = parallel_bootstrap(desc, data, nboot, seed=seed,
+                                          n_jobs=n_jobs if bootstrap_mode == 'parallel' else 1,
+                                          engine=engine, fit_kwargs=fit_kwargs, warm_start=warm_start,
+                                          progress=progress, precision=precision,
+                                          replicate_kwargs=replicate_kwargs)
+        else:
+            boot_res = model.bootstrap(data, nboot=nboot)
+    return res, boot_res
@@ -0,0 +1,126 @@
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobCancelled(Exception):
+    """Dilempar dari callback progres saat job dibatalkan pengguna."""
+
+
+class Job:
+    """Satu analisis latar belakang beserta status, progres dan hasilnya."""
+
+    def __init__(self, job_id, label, total=None):
+        self.job_id = job_id
+        self.label = label
+        self.status = 'antri'
+        self.done = 0
+        self.total = total
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        # Profiler milik thread job; digabung ke profiler sesi oleh thread UI (lihat `StageProfiler.merge`)
+        self.profiler = None
+        self._cancel = threading.Event()
+
+    @property
+    def fraction(self):
+        if not self.total:
+            return 0.0
+        return min(1.0, self.done / self.total)
+
+    @property
+    def is_active(self):
+        return self.status in ('antri', 'berjalan')
+
+    def report(self, done, total=None):
+        """Callback progres (jumlah replikasi selesai); juga titik pembatalan."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.done = done
+        if total is not None:
+            self.total = total
+
+    def cancel(self):
+        self._cancel.set()
+
+
+class JobManager:
+    """Antrian job analisis yang berjalan di thread pool, di luar thread script Streamlit.
+
+    Satu instance dibagi oleh semua sesi; setiap sesi cukup menyimpan
+    `job_id` di `st.session_state` dan mengambil hasilnya pada rerun berikutnya.
+    """
+
+    def __init__(self, max_workers=2, max_finished=50):
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sempls-job')
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, label, fn, total=None):
+        """Kirim `fn(job)` sebagai job baru; kembalikan `job_id`."""
+        with self._lock:
+            job_id = f"job-{next(self._ids)}"
+            job = Job(job_id, label, total=total)
+            self._jobs[job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job, fn)
+        return job_id
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Batalkan job antri, atau minta job berjalan berhenti pada panggilan `Job.report` berikutnya.
+
+        Fungsi job yang tidak pernah melaporkan progres tetap berjalan sampai selesai.
+        """
+        job = self.get(job_id)
+        if job is not None and job.is_active:
+            job.cancel()
+            if job.status == 'antri':
+                job.status = 'dibatalkan'
+
+    def results(self):
+        """Hasil job yang selesai dan masih dipegang di memori."""
+        with self._lock:
+            return [j.result for j in self._jobs.values() if j.status == 'selesai' and j.result is not None]
+
+    def release_results(self):
+        """Lepas hasil job yang selesai; pemanggil mengambilnya lagi dari cache fit atau replikasi tersimpan.
+
+        Mengembalikan jumlah hasil yang dilepas.
+        """
+        with self._lock:
+            finished = [j for j in self._jobs.values() if j.status == 'selesai' and j.result is not None]
+            for job in finished:
+                job.result = None
+        return len(finished)
+
+    def _run(self, job, fn):
+        if job._cancel.is_set():
+            job.status = 'dibatalkan'
+            return
+        job.status = 'berjalan'
+        job.started = time.time()
+        try:
+            job.result = fn(job)
+            job.status = 'selesai'
+        except JobCancelled:
+            job.status = 'dibatalkan'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'gagal'
+        finally:
+            job.finished = time.time()
+
+    def _prune(self):
+        finished = sorted((j for j in self._jobs.values() if not j.is_active), key=lambda j: j.created)
+        for job in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job.job_id]
@@ -0,0 +1,196 @@
+import gc
+import os
+import threading
+import time
+
+import pandas as pd
+
+from pls_cache import approx_nbytes
+from pls_data import process_rss
+
+# Anggaran memori default (MB) per sesi dan per proses, dapat diatur via environment
+SESSION_BUDGET_MB = int(os.environ.get('SEMPLS_SESSION_MB', 256))
+GLOBAL_BUDGET_MB = int(os.environ.get('SEMPLS_MEMORY_MB', 2048))
+
+
+def streamlit_session_id():
+    """ID sesi browser Streamlit yang sedang menjalankan script ('lokal' di luar Streamlit)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return 'lokal'
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else 'lokal'
+
+
+# --- Akuntansi & Eviction Memori ---
+
+class MemoryGovernor:
+    """Akuntansi memori per sesi/per kunci `st.session_state` dengan anggaran dan eviction.
+
+    Satu instance dibagi oleh semua sesi dan aplikasi dalam proses. Setiap
+    rerun memanggil `account(session_id, st.session_state)`. Hanya objek yang
+    bisa diturunkan ulang yang dibuang: kunci sesi yang didaftarkan lewat
+    `register_evictable`, dan sumber daya bersama (`register_shared`) seperti
+    cache fit atau hasil job yang tetap bisa diambil lagi dari cache/disk.
+    Kunci sesi lain hanya bisa dibuang oleh thread sesinya sendiri, jadi
+    eviction lintas sesi ditunda sampai rerun berikutnya sesi tersebut.
+    """
+
+    def __init__(self, session_budget=SESSION_BUDGET_MB * 2**20, global_budget=GLOBAL_BUDGET_MB * 2**20, session_ttl=3600,
+                 max_events=200):
+        self.session_budget = session_budget
+        self.global_budget = global_budget
+        self.session_ttl = session_ttl
+        self.max_events = max_events
+        self._sessions = {}
+        self._pending = {}
+        self._evictors = {}
+        self._shared = {}
+        self.events = []
+        # Memori terhitung setelah penegakan anggaran global terakhir (None = di bawah anggaran)
+        self._enforced_at = None
+        self._lock = threading.Lock()
+
+    def register_evictable(self, key, evict):
+        """Daftarkan kunci sesi yang boleh dibuang; `evict(state, key)` membebaskan isinya."""
+        self._evictors[key] = evict
+
+    def register_shared(self, name, measure, shrink):
+        """Daftarkan sumber daya bersama: `measure()` -> byte, `shrink()` membebaskan memori."""
+        self._shared[name] = (measure, shrink)
+
+    def _log(self, session_id, target, nbytes, reason):
+        with self._lock:
+            self.events.append({'Waktu': time.strftime('%H:%M:%S'), 'Sesi': session_id[:8], 'Objek': target,
+                                'MB': nbytes / 2**20, 'Alasan': reason})
+            del self.events[:-self.max_events]
+
+    def _evict_key(self, session_id, state, key, nbytes, reason):
+        if key not in state:
+            return 0
+        self._evictors[key](state, key)
+        self._log(session_id, key, nbytes, reason)
+        return nbytes
+
+    def account(self, session_id, state, app=None):
+        """Ukur kunci sesi, terapkan eviction tertunda dan anggaran; kembalikan {kunci: byte}."""
+        sizes = {key: approx_nbytes(state[key]) for key in list(state.keys())}
+        with self._lock:
+            pending = self._pending.pop(session_id, set())
+        for key in pending:
+            self._evict_key(session_id, state, key, sizes.get(key, 0), "anggaran global")
+            sizes[key] = approx_nbytes(state[key]) if key in state else 0
+        total = sum(sizes.values())
+        if total > self.session_budget:
+            for key in sorted((k for k in sizes if k in self._evictors), key=sizes.get, reverse=True):
+                total -= self._evict_key(session_id, state, key, sizes[key], "anggaran sesi")
+                sizes[key] = approx_nbytes(state[key]) if key in state else 0
+                total += sizes[key]
+                if total <= self.session_budget:
+                    break
+
+        now = time.time()
+        with self._lock:
+            self._sessions[session_id] = {'app': app, 'seen': now, 'keys': sizes}
+            for sid in [s for s, info in self._sessions.items() if now - info['seen'] > self.session_ttl]:
+                del self._sessions[sid]
+                self._pending.pop(sid, None)
+        self.enforce_global(session_id)
+        return sizes
+
+    def shared_sizes(self):
+        return {name: measure() for name, (measure, _) in self._shared.items()}
+
+    def enforce_global(self, session_id=None):
+        """Terapkan anggaran global pada memori terhitung; kembalikan True bila eviction dijalankan.
+
+        Hanya dipicu saat memori terhitung melewati anggaran dan bertambah
+        sejak penegakan terakhir, sehingga rerun tanpa alokasi baru tidak
+        terus mengecilkan cache. Sumber daya bersama dikecilkan lebih dulu.
+        Bila masih kurang, kunci sesi yang dapat dibuang dijadwalkan untuk
+        eviction, terbesar lebih dulu. RSS proses tidak dipakai di sini karena
+        jarang turun setelah memori dibebaskan.
+        """
+        accounted = self.accounted_bytes()
+        with self._lock:
+            if accounted <= self.global_budget:
+                self._enforced_at = None
+                return False
+            if self._enforced_at is not None and accounted <= self._enforced_at:
+                return False
+        for name, (measure, shrink) in self._shared.items():
+            before = measure()
+            shrink()
+            freed = before - measure()
+            if freed > 0:
+                self._log(session_id or '-', name, freed, "anggaran global")
+        gc.collect()
+        over = self.accounted_bytes() - self.global_budget
+        if over > 0:
+            with self._lock:
+                candidates = [(size, sid, key) for sid, info in self._sessions.items()
+                              for key, size in info['keys'].items() if key in self._evictors]
+                for size, sid, key in sorted(candidates, reverse=True):
+                    if over <= 0:
+                        break
+                    self._pending.setdefault(sid, set()).add(key)
+                    self._sessions[sid]['keys'][key] = 0
+                    over -= size
+        accounted = self.accounted_bytes()
+        with self._lock:
+            self._enforced_at = accounted
+        return True
+
+    def accounted_bytes(self):
+        with self._lock:
+            sessions = sum(sum(info['keys'].values()) for info in self._sessions.values())
+        return sessions + sum(self.shared_sizes().values())
+
+    def session_table(self):
+        """Ringkasan per sesi: aplikasi, jumlah kunci, total MB dan detik sejak rerun terakhir."""
+        now = time.time()
+        with self._lock:
+            rows = [{'Sesi': sid[:8], 'Aplikasi': info['app'], 'Kunci': len(info['keys']),
+                     'MB': sum(info['keys'].values()) / 2**20, 'Terakhir (s)': now - info['seen']}
+                    for sid, info in self._sessions.items()]
+        return pd.DataFrame(rows).sort_values('MB', ascending=False, ignore_index=True) if rows else pd.DataFrame()
+
+    def key_table(self, session_id):
+        """Ukuran per kunci `st.session_state` untuk satu sesi."""
+        with self._lock:
+            keys = dict(self._sessions.get(session_id, {}).get('keys', {}))
+        rows = [{'Kunci': k, 'MB': v / 2**20, 'Dapat Dibuang': k in self._evictors} for k, v in keys.items()]
+        return pd.DataFrame(rows).sort_values('MB', ascending=False, ignore_index=True) if rows else pd.DataFrame()
+
+
+# --- Panel Sidebar ---
+
+def render_memory_panel(governor, session_id, container):
+    """Tampilkan memori proses, per sesi, per kunci sesi ini, sumber bersama dan log eviction."""
+    sizes = governor.shared_sizes()
+    rss = process_rss()
+    col_rss, col_budget = container.columns(2)
+    col_rss.metric("RSS Proses", f"{rss / 2**20:.0f} MB")
+    col_budget.metric("Anggaran Global", f"{governor.global_budget / 2**20:.0f} MB",
+                      help=f"Anggaran per sesi: {governor.session_budget / 2**20:.0f} MB. Eviction memakai memori "
+                           "terhitung, bukan RSS.")
+    if rss > governor.global_budget:
+        container.warning("RSS proses melebihi anggaran global. Memori yang sudah dibebaskan sering tidak "
+                          "dikembalikan ke OS; eviction hanya berjalan bila memori terhitung melewati anggaran.")
+
+    keys = governor.key_table(session_id)
+    if not keys.empty:
+        container.caption(f"Sesi ini: {keys['MB'].sum():.2f} MB di {len(keys)} kunci")
+        container.dataframe(keys.round(3), hide_index=True, use_container_width=True)
+    if sizes:
+        container.caption("Sumber daya bersama")
+        container.dataframe(pd.DataFrame({'Sumber': list(sizes), 'MB': [v / 2**20 for v in sizes.values()]}).round(2),
+                            hide_index=True, use_container_width=True)
+    sessions = governor.session_table()
+    if not sessions.empty:
+        box = container.expander(f"Semua sesi ({len(sessions)})")
+        box.dataframe(sessions.round(2), hide_index=True, use_container_width=True)
+    if governor.events:
+        box = container.expander(f"Log eviction ({len(governor.events)})")
+        box.dataframe(pd.DataFrame(governor.events[::-1]).round(2), hide_index=True, use_container_width=True)
@@ -0,0 +1,229 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from pls_engine import (
+    KEY_COLS, PLSResult, bootstrap_correlations, default_batch_size, parallel_bootstrap, parse_model_syntax,
+    pls_solve, resample_matrix, run_chunks, standardize,
+)
+
+# Ukuran grup minimum agar estimasi per grup bermakna
+MIN_GROUP_SIZE = 10
+
+
+# --- Pembagian Grup ---
+
+def split_groups(data, group_col, min_size=MIN_GROUP_SIZE):
+    """Label grup -> indeks posisi baris; grup lebih kecil dari `min_size` ditolak."""
+    if group_col not in data.columns:
+        raise ValueError(f"Kolom grup '{group_col}' tidak ada di data.")
+    labels = data[group_col]
+    if labels.isna().any():
+        raise ValueError(f"Kolom grup '{group_col}' memiliki nilai kosong.")
+    groups = {label: np.flatnonzero((labels == label).to_numpy()) for label in pd.unique(labels)}
+    if len(groups) < 2:
+        raise ValueError("Analisis multi-grup memerlukan minimal 2 grup.")
+    small = [f"{label} (n={idx.size})" for label, idx in groups.items() if idx.size < min_size]
+    if small:
+        raise ValueError(f"Grup terlalu kecil (minimal {min_size} responden): {', '.join(map(str, small))}")
+    return groups
+
+
+def _group_weights(groups, n):
+    masks = np.zeros((len(groups), n))
+    for g, idx in enumerate(groups.values()):
+        masks[g, idx] = 1.0
+    return masks
+
+
+# --- Fit Per Grup ---
+
+def fit_groups(desc, data, group_col, scheme='path', tol=1e-7, max_iter=300):
+    """Fit model untuk semua grup sekaligus (satu batch matriks korelasi per grup).
+
+    Mengembalikan dict label grup -> `PLSResult`.
+    """
+    spec = parse_model_syntax(desc)
+    groups = split_groups(data, group_col)
+    X = standardize(data[spec.indicators].to_numpy())
+    R = bootstrap_correlations(X, _group_weights(groups, X.shape[0]))
+    if not np.isfinite(R).all():
+        raise ValueError("Ada indikator tanpa variasi di salah satu grup; model per grup tidak dapat diestimasi.")
+    solution = pls_solve(R, spec, scheme=scheme, tol=tol, max_iter=max_iter)
+    return {
+        label: PLSResult(spec, {key: val[g:g + 1] for key, val in solution.items()}, idx.size, scheme)
+        for g, (label, idx) in enumerate(groups.items())
+    }
+
+
+def _bootstrap_group(desc, data, nboot, seed, fit_kwargs, warm_start, precision):
+    return parallel_bootstrap(desc, data, nboot, seed=seed, n_jobs=1, engine='native',
+                              fit_kwargs=fit_kwargs, warm_start=warm_start, precision=precision)
+
+
+def bootstrap_groups(desc, data, group_col, nboot, seed=42, n_jobs=None, scheme='path', warm_start=True,
+                     precision='float64', tol=1e-7, max_iter=300):
+    """Bootstrap terpisah per grup, grup dijalankan paralel; kembalikan dict label -> `BootstrapResult`.
+
+    Seed setiap grup diturunkan dari `seed` dan urutan grup, sehingga hasilnya
+    tidak bergantung pada jumlah worker. `tol`/`max_iter` berlaku untuk fit
+    sampel grup dan setiap replikasinya.
+    """
+    groups = split_groups(data, group_col)
+    child_seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(len(groups))]
+    jobs = [(data.iloc[idx], child_seeds[g]) for g, idx in enumerate(groups.values())]
+    fit_kwargs = {'scheme': scheme, 'tol': tol, 'max_iter': max_iter}
+    n_jobs = max(1, min(n_jobs or 1, len(jobs)))
+    if n_jobs == 1:
+        results = [_bootstrap_group(desc, d, nboot, s, fit_kwargs, warm_start, precision) for d, s in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [pool.submit(_bootstrap_group, desc, d, nboot, s, fit_kwargs, warm_start, precision)
+                       for d, s in jobs]
+            results = [f.result() for f in futures]
+    return dict(zip(groups, results))
+
+
+# --- Uji Permutasi ---
+
+def _permutation_batch(spec, X, n_first, seed_seqs, fit_kwargs, W0):
+    """Selisih parameter (grup 1 - grup 2) untuk sekumpulan permutasi label dalam satu batch PLS."""
+    n = X.shape[0]
+    first = np.zeros((len(seed_seqs), n))
+    for i, seed_seq in enumerate(seed_seqs):
+        first[i, np.random.default_rng(seed_seq).permutation(n)[:n_first]] = 1.0
+    R = np.concatenate([bootstrap_correlations(X, first), bootstrap_correlations(X, 1.0 - first)])
+    out = np.full((len(seed_seqs), spec.n_params), np.nan)
+    ok = np.isfinite(R).all(axis=(1, 2))
+    ok = ok[:len(seed_seqs)] & ok[len(seed_seqs):]
+    if ok.any():
+        sol = pls_solve(np.concatenate([R[:len(seed_seqs)][ok], R[len(seed_seqs):][ok]]), spec, W0=W0, **fit_kwargs)
+        params = np.hstack([sol['loadings'], sol['paths']])
+        out[ok] = params[:ok.sum()] - params[ok.sum():]
+    return out
+
+
+def _permutation_chunk(spec, X, n_first, seed_seqs, fit_kwargs, W0, batch_size):
+    """Worker: jalankan permutasi per batch agar memori matriks korelasi tetap terbatas."""
+    out = [_permutation_batch(spec, X, n_first, seed_seqs[i:i + batch_size], fit_kwargs, W0)
+           for i in range(0, len(seed_seqs), batch_size)]
+    return np.vstack(out), None
+
+
+def permutation_test(desc, data, group_col, group_a, group_b, n_perm=1000, seed=42, n_jobs=1, scheme='path',
+                     batch_size=None, progress=None, precision='float64', tol=1e-7, max_iter=300):
+    """Uji permutasi selisih parameter antara dua grup.
+
+    Label grup kedua grup diacak `n_perm` kali; setiap batch permutasi
+    diestimasi sebagai satu tumpukan matriks korelasi (tanpa refit per
+    permutasi di loop Python). p-value = (1 + #|d_perm| ≥ |d_obs|) / (1 + n_valid).
+    Selisih teramati selalu float64; `precision` hanya berlaku untuk permutasi,
+    sedangkan `tol`/`max_iter` berlaku untuk fit teramati dan permutasi.
+    """
+    spec = parse_model_syntax(desc)
+    groups = split_groups(data, group_col)
+    rows = np.concatenate([groups[group_a], groups[group_b]])
+    n_first = groups[group_a].size
+    X = standardize(data[spec.indicators].to_numpy()[rows])
+    fit_kwargs = {'scheme': scheme, 'tol': tol, 'max_iter': max_iter}
+
+    observed_R = bootstrap_correlations(X, _group_weights({0: np.arange(n_first), 1: np.arange(n_first, len(rows))},
+                                                          len(rows)))
+    observed = pls_solve(observed_R, spec, **fit_kwargs)
+    params = np.hstack([observed['loadings'], observed['paths']])
+    diff_obs = params[0] - params[1]
+
+    # Warm start dari bobot sampel gabungan kedua grup
+    W0 = pls_solve((X.T @ X / (X.shape[0] - 1))[None], spec, **fit_kwargs)['W'][0]
+    X_perm = resample_matrix(data[spec.indicators].to_numpy()[rows], precision)
+    if batch_size is None:
+        batch_size = default_batch_size(X_perm, 32e6)
+    seed_seqs = np.random.SeedSequence(seed).spawn(n_perm)
+    n_jobs = max(1, min(n_jobs or 1, n_perm))
+
+    def make_args(chunk):
+        return spec, X_perm, n_first, chunk, fit_kwargs, W0, batch_size
+
+    if n_jobs == 1:
+        blocks = run_chunks(_permutation_chunk, make_args, seed_seqs, 1, progress=progress, batch_size=batch_size)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = run_chunks(_permutation_chunk, make_args, seed_seqs, n_jobs, pool=pool, progress=progress,
+                                batch_size=batch_size)
+    perm = np.vstack([out for out, _ in blocks])
+
+    valid = perm[np.isfinite(perm).all(axis=1)]
+    exceed = (np.abs(valid) >= np.abs(diff_obs) - 1e-12).sum(axis=0)
+    pair_rows = [(spec.lvs[k], '=~', spec.indicators[c]) for k, c in spec.pairs]
+    out = pd.DataFrame(pair_rows + [(t, '~', f) for f, t in spec.paths], columns=KEY_COLS)
+    out[f'Estimate ({group_a})'] = params[0]
+    out[f'Estimate ({group_b})'] = params[1]
+    out['Selisih'] = diff_obs
+    out['p-value (permutasi)'] = (1 + exceed) / (1 + valid.shape[0])
+    out.attrs['n_valid'] = int(valid.shape[0])
+    return out
+
+
+def _offset_progress(progress, offset, total):
+    """Callback progres satu pasangan grup yang dilaporkan sebagai bagian dari progres keseluruhan."""
+    def report(done, _total):
+        progress(offset + done, total)
+    return report
+
+
+def pairwise_permutation_tests(desc, data, group_col, n_perm=1000, seed=42, n_jobs=1, scheme='path', progress=None,
+                               precision='float64', tol=1e-7, max_iter=300):
+    """Uji permutasi untuk setiap pasangan grup; kolom 'Grup A'/'Grup B' menandai pasangannya."""
+    labels = list(split_groups(data, group_col))
+    pairs = list(itertools.combinations(labels, 2))
+    tables = []
+    for k, (a, b) in enumerate(pairs):
+        pair_seed = int(np.random.SeedSequence([seed, k]).generate_state(1)[0])
+        pair_progress = _offset_progress(progress, k * n_perm, len(pairs) * n_perm) if progress is not None else None
+        table = permutation_test(desc, data, group_col, a, b, n_perm=n_perm, seed=pair_seed, n_jobs=n_jobs,
+                                 scheme=scheme, progress=pair_progress, precision=precision, tol=tol,
+                                 max_iter=max_iter)
+        table = table.rename(columns={f'Estimate ({a})': 'Estimate A', f'Estimate ({b})': 'Estimate B'})
+        table.insert(0, 'Grup B', b)
+        table.insert(0, 'Grup A', a)
+        tables.append(table)
+    return pd.concat(tables, ignore_index=True)
+
+
+# --- Ringkasan ---
+
+def group_bootstrap_table(boot_results, paths):
+    """Tabel lebar hasil bootstrap per grup (β, T-Stat, P-Value berdampingan) untuk jalur struktural."""
+    rows = []
+    for from_var, to_var in paths:
+        row = {'Jalur': f"{from_var} -> {to_var}"}
+        for label, boot_res in boot_results.items():
+            summary = boot_res.inspect(mode='estimates')
+            match = summary[(summary['lval'] == to_var) & (summary['op'] == '~') & (summary['rval'] == from_var)]
+            if match.empty:
+                continue
+            row[f'β [{label}]'] = match['Estimate'].iloc[0]
+            row[f'T-Stat [{label}]'] = match['T-stat'].iloc[0]
+            row[f'P-Value [{label}]'] = match['p-value'].iloc[0]
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def multigroup_analysis(desc, data, group_col, paths, nboot=1000, n_perm=1000, seed=42, n_jobs=1, scheme='path',
+                        warm_start=True, progress=None, precision='float64', tol=1e-7, max_iter=300):
+    """Analisis multi-grup lengkap: fit per grup, bootstrap per grup dan uji permutasi berpasangan."""
+    fits = fit_groups(desc, data, group_col, scheme=scheme, tol=tol, max_iter=max_iter)
+    boot_results = bootstrap_groups(desc, data, group_col, nboot, seed=seed, n_jobs=n_jobs, scheme=scheme,
+                                    warm_start=warm_start, precision=precision, tol=tol, max_iter=max_iter)
+    permutation = pairwise_permutation_tests(desc, data, group_col, n_perm=n_perm, seed=seed, n_jobs=n_jobs,
+                                             scheme=scheme, progress=progress, precision=precision, tol=tol,
+                                             max_iter=max_iter)
+    return {
+        'sizes': {label: res.n_obs for label, res in fits.items()},
+        'fits': fits,
+        'bootstrap': boot_results,
+        'bootstrap_table': group_bootstrap_table(boot_results, paths),
+        'permutation': permutation,
+    }
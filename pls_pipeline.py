@@ -0,0 +1,306 @@
+import json
+import time
+
+import pandas as pd
+import semopy
+
+from pls_cache import make_cache_key
+from pls_engine import (
+    BOOTSTRAP_MODES, INNER_SCHEMES, KEY_COLS, PRECISIONS, fit_pls, fit_pls_correlation, jackknife_estimates,
+    run_analysis,
+)
+from pls_effects import mediation_table
+
+# Nilai default spesifikasi analisis (sama dengan default halaman 2 & 3 aplikasi,
+# kecuali 'engine': pipeline batch sengaja memakai engine native, sedangkan aplikasi
+# memakai semopy sebagai default)
+SPEC_DEFAULTS = {
+    'alpha': 0.05,
+    'bootstrap_samples': 5000,
+    'loading_threshold': 0.708,
+    'engine': 'native',
+    'inner_scheme': 'path',
+    'bootstrap_mode': 'parallel',
+    'seed': 42,
+    'warm_start': True,
+    'ci_method': 'percentile',
+    'precision': 'float64',
+    # Solver native: sampel penuh, lalu replikasi bootstrap (None = sama dengan sampel penuh)
+    'tol': 1e-7,
+    'max_iter': 300,
+    'bootstrap_tol': None,
+    'bootstrap_max_iter': None,
+    'exclude_nonconverged': False,
+    'id_column': 'responden_id',
+    'csv': {},
+}
+
+
+# Metode interval bootstrap yang didukung `BootstrapResult.confidence_intervals`
+CI_METHODS = ['percentile', 'bc', 'bca']
+
+
+# --- Spesifikasi Analisis ---
+
+def validate_spec(spec):
+    """Lengkapi spesifikasi dengan default dan periksa isinya; kembalikan dict baru."""
+    missing = [key for key in ('latent_vars', 'paths') if key not in spec]
+    if missing:
+        raise ValueError(f"Spesifikasi model tidak lengkap: {', '.join(missing)}")
+    unknown = set(spec) - set(SPEC_DEFAULTS) - {'latent_vars', 'paths'}
+    if unknown:
+        raise ValueError(f"Kunci spesifikasi tidak dikenal: {', '.join(sorted(unknown))}")
+    out = dict(SPEC_DEFAULTS, **spec)
+    out['latent_vars'] = {lv: list(inds) for lv, inds in spec['latent_vars'].items() if inds}
+    out['paths'] = [tuple(p) for p in spec['paths']]
+    if not out['latent_vars']:
+        raise ValueError("Definisikan minimal 1 variabel laten dengan setidaknya 1 indikator.")
+    if not out['paths']:
+        raise ValueError("Definisikan minimal 1 jalur hipotesis.")
+    undefined = sorted({lv for p in out['paths'] for lv in p} - set(out['latent_vars']))
+    if undefined:
+        raise ValueError(f"Jalur memakai variabel laten yang tidak didefinisikan: {', '.join(undefined)}")
+    if out['engine'] not in ('native', 'semopy'):
+        raise ValueError(f"Engine tidak dikenal: {out['engine']}")
+    if out['inner_scheme'] not in INNER_SCHEMES:
+        raise ValueError(f"Skema inner weighting tidak dikenal: {out['inner_scheme']}")
+    if out['bootstrap_mode'] not in BOOTSTRAP_MODES:
+        raise ValueError(f"Mode bootstrap tidak dikenal: {out['bootstrap_mode']}")
+    if out['ci_method'] not in CI_METHODS:
+        raise ValueError(f"Metode interval tidak dikenal: {out['ci_method']}")
+    if out['precision'] not in PRECISIONS:
+        raise ValueError(f"Presisi tidak dikenal: {out['precision']}")
+    if out['precision'] != 'float64' and out['engine'] != 'native':
+        raise ValueError("Presisi float32 hanya tersedia untuk engine native.")
+    for key in ('tol', 'bootstrap_tol'):
+        if out[key] is not None and not out[key] > 0:
+            raise ValueError(f"`{key}` harus positif.")
+    for key in ('max_iter', 'bootstrap_max_iter'):
+        if out[key] is not None and (int(out[key]) != out[key] or out[key] < 1):
+            raise ValueError(f"`{key}` harus bilangan bulat minimal 1.")
+    return out
+
+
+def load_spec(path):
+    """Baca spesifikasi analisis dari file JSON."""
+    with open(path, encoding='utf-8') as f:
+        return validate_spec(json.load(f))
+
+
+def model_syntax(latent_vars, paths):
+    """Syntax model pengukuran dan model lengkap (pengukuran + struktural)."""
+    meas_model = "\n".join([f"{latent} =~ " + " + ".join(inds) for latent, inds in latent_vars.items()])
+    struct_model = "\n".join([f"{to_var} ~ {from_var}" for from_var, to_var in paths])
+    return meas_model, meas_model + "\n" + struct_model
+
+
+# --- Tahap Pipeline ---
+
+def loading_table(res, threshold):
+    """Tabel outer loading (Konstrak, Indikator, Loading, Valid) dari hasil fit."""
+    loadings = res.inspect(lv='all', rv='all', col='Loading', std=True, pretty_names=True)
+    loadings = loadings[loadings['op'] == '=~'].rename(columns={'lval': 'Konstrak', 'rval': 'Indikator', 'Estimate': 'Loading'})
+    loadings = loadings[['Konstrak', 'Indikator', 'Loading']].reset_index(drop=True)
+    loadings['Valid'] = loadings['Loading'].abs() >= threshold
+    return loadings
+
+
+def prune_indicators(latent_vars, loadings):
+    """Buang indikator tidak valid; konstrak tanpa indikator valid ikut dihapus (aturan halaman 3)."""
+    invalid = loadings.loc[~loadings['Valid'], 'Indikator'].tolist()
+    pruned = {}
+    for lv, inds in latent_vars.items():
+        valid_inds = [ind for ind in inds if ind not in invalid]
+        if valid_inds:
+            pruned[lv] = valid_inds
+    return pruned, invalid
+
+
+def hypothesis_table(paths, path_df, alpha, ci_df=None):
+    """Tabel uji hipotesis numerik (β, T-Stat, P-Value, CI, keputusan) per jalur."""
+    rows = []
+    for i, (from_var, to_var) in enumerate(paths):
+        path_row = path_df[(path_df['lval'] == to_var) & (path_df['op'] == '~') & (path_df['rval'] == from_var)]
+        if path_row.empty:
+            continue
+        beta = path_row['Estimate'].iloc[0]
+        p_val = path_row['p-value'].iloc[0]
+        row = {
+            'Hipotesis': f"H{i+1}",
+            'Jalur': f"{from_var} -> {to_var}",
+            'β (Koef. Jalur)': beta,
+            'T-Stat': path_row['T-stat'].iloc[0],
+            'P-Value': p_val,
+            'Arah': "Positif" if beta > 0 else "Negatif",
+            'Keputusan': "Diterima" if p_val < alpha and beta > 0 else "Ditolak",
+        }
+        if ci_df is not None:
+            ci_row = ci_df[(ci_df['lval'] == to_var) & (ci_df['op'] == '~') & (ci_df['rval'] == from_var)]
+            if not ci_row.empty:
+                row['CI Lower'] = ci_row['CI Lower'].iloc[0]
+                row['CI Upper'] = ci_row['CI Upper'].iloc[0]
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def merge_boot_pvalues(path_df, boot_df):
+    """Gabungkan T-stat dan p-value bootstrap ke tabel estimasi."""
+    try:
+        path_df = path_df.merge(boot_df[KEY_COLS + ['T-stat', 'p-value']], on=KEY_COLS,
+                                how='left', suffixes=('', '_boot'))
+        path_df['p-value'] = path_df['p-value_boot'].fillna(path_df['p-value'])
+        path_df = path_df.drop(columns=['p-value_boot'], errors='ignore')
+    except KeyError:
+        pass
+    return path_df
+
+
+def fit_model(desc, data, spec):
+    """Fit tunggal (tanpa bootstrap) dengan engine dan skema dari spesifikasi."""
+    if spec['engine'] == 'native':
+        return fit_pls(desc, data, scheme=spec['inner_scheme'], tol=spec['tol'], max_iter=spec['max_iter'])
+    return semopy.Model(desc).fit(data, algo="PLS")
+
+
+def validate_and_prune(fit_fn, spec):
+    """Uji loading model pengukuran dengan `fit_fn(desc)` lalu pruning indikator (halaman 3).
+
+    Mengembalikan `(loadings, latent_vars, invalid, dropped_lvs, paths)`.
+    """
+    meas_model, _ = model_syntax(spec['latent_vars'], spec['paths'])
+    loadings = loading_table(fit_fn(meas_model), spec['loading_threshold'])
+    latent_vars, invalid = prune_indicators(spec['latent_vars'], loadings)
+    loadings['Dihapus'] = loadings['Indikator'].isin(invalid)
+    dropped_lvs = [lv for lv in spec['latent_vars'] if lv not in latent_vars]
+    paths = [p for p in spec['paths'] if p[0] in latent_vars and p[1] in latent_vars]
+    if not paths:
+        raise ValueError(f"Tidak ada jalur tersisa setelah pruning (konstrak dihapus: {', '.join(dropped_lvs)}).")
+    return loadings, latent_vars, invalid, dropped_lvs, paths
+
+
+def run_pipeline(data, spec, n_jobs=1, replicate_store=None, profiler=None):
+    """Jalankan alur halaman 2 → 3 → 4 tanpa UI: uji loading, pruning, fit final dan bootstrap.
+
+    Mengembalikan dict berisi tabel `hypotheses`, `loadings`, `r2`, efek
+    tidak langsung/total `effects` dan ringkasan `summary`. `replicate_store`
+    opsional (`ReplicateStore`) dipakai agar dataset yang sama tidak
+    di-bootstrap ulang. Replikasi yang tidak konvergen selalu dihitung di
+    ringkasan dan dibuang dari uji bila `exclude_nonconverged`.
+    """
+    started = time.perf_counter()
+    data = data.drop(columns=[spec['id_column']] if spec['id_column'] in data.columns else [])
+    all_indicators = [ind for inds in spec['latent_vars'].values() for ind in inds]
+    missing = [ind for ind in all_indicators if ind not in data.columns]
+    if missing:
+        raise ValueError(f"Indikator tidak ditemukan di data: {', '.join(missing)}")
+
+    # Halaman 3: uji validitas konvergen dan pruning indikator
+    loadings, latent_vars, invalid, dropped_lvs, paths = validate_and_prune(
+        lambda desc: fit_model(desc, data, spec), spec
+    )
+
+    # Halaman 4: fit final dan bootstrap
+    _, full_model = model_syntax(latent_vars, paths)
+    analysis_kwargs = dict(
+        engine=spec['engine'], scheme=spec['inner_scheme'], nboot=spec['bootstrap_samples'],
+        bootstrap_mode=spec['bootstrap_mode'], seed=spec['seed'], warm_start=spec['warm_start'], alpha=spec['alpha'],
+        precision=spec['precision'], tol=spec['tol'], max_iter=spec['max_iter'], boot_tol=spec['bootstrap_tol'],
+        boot_max_iter=spec['bootstrap_max_iter']
+    )
+    model_data = data[[ind for inds in latent_vars.values() for ind in inds]]
+    cache_key = make_cache_key(model_data, full_model, spec['engine'], **{
+        k: v for k, v in analysis_kwargs.items() if k != 'alpha' or spec['bootstrap_mode'] == 'progressive'
+    })
+    stored_boot = replicate_store.load(cache_key) if replicate_store is not None else None
+    if stored_boot is not None:
+        # Replikasi tersimpan: cukup fit ulang sampel penuh
+        res = fit_model(full_model, model_data, spec)
+        boot_res = stored_boot
+    else:
+        res, boot_res = run_analysis(full_model, model_data, n_jobs=n_jobs, profiler=profiler, **analysis_kwargs)
+        if replicate_store is not None:
+            replicate_store.save(cache_key, boot_res)
+    n_nonconverged = getattr(boot_res, 'n_nonconverged', None)
+    if spec['exclude_nonconverged'] and n_nonconverged:
+        boot_res = boot_res.exclude_nonconverged()
+
+    path_df = merge_boot_pvalues(res.inspect(mode='estimates'), boot_res.inspect(mode='estimates'))
+    ci_df = None
+    jackknife = None
+    if hasattr(boot_res, 'confidence_intervals'):
+        # BCa: jackknife estimator native memakai worker yang sama dengan bootstrap
+        jackknife = (jackknife_estimates(full_model, model_data, scheme=spec['inner_scheme'], n_jobs=n_jobs,
+                                         tol=spec['tol'], max_iter=spec['max_iter'])
+                     if spec['ci_method'] == 'bca' else None)
+        ci_df = boot_res.confidence_intervals(level=1 - spec['alpha'], method=spec['ci_method'], jackknife=jackknife)
+    hypotheses = hypothesis_table(paths, path_df, spec['alpha'], ci_df)
+    effects = mediation_table(full_model, path_df, boot_res, level=1 - spec['alpha'], method=spec['ci_method'],
+                              jackknife=jackknife)
+
+    summary = {
+        'n_obs': int(len(data)),
+        'indikator_dihapus': invalid,
+        'konstrak_dihapus': dropped_lvs,
+        'jalur_dianalisis': len(paths),
+        'hipotesis_diterima': int((hypotheses['Keputusan'] == 'Diterima').sum()) if not hypotheses.empty else 0,
+        'replikasi_bootstrap': int(getattr(boot_res, 'replicates', pd.DataFrame()).shape[0]),
+        'replikasi_gagal': int(getattr(boot_res, 'n_failed', 0)),
+        'replikasi_tidak_konvergen': n_nonconverged,
+        'dari_replikasi_tersimpan': stored_boot is not None,
+        'model': full_model,
+        'detik': time.perf_counter() - started,
+    }
+    if hasattr(res, 'solver_summary'):
+        solver = res.solver_summary()
+        summary.update(iterasi_pls=solver['n_iter'], konvergen=solver['converged'])
+    return {'hypotheses': hypotheses, 'loadings': loadings, 'r2': res.inspect(mode='r2'), 'effects': effects,
+            'summary': summary}
+
+
+def run_moments_pipeline(moments, spec):
+    """Alur halaman 3 → 4 dari statistik cukup (`pls_data.StreamingMoments`) tanpa data mentah.
+
+    Selalu memakai estimator native pada matriks korelasi, sehingga memori
+    hanya sebanding dengan jumlah indikator. Bootstrap memerlukan baris data,
+    jadi tabel `hypotheses` hanya memuat koefisien jalur tanpa uji signifikansi.
+    """
+    started = time.perf_counter()
+    corr = moments.correlation()
+    n_obs = moments.n
+    loadings, latent_vars, invalid, dropped_lvs, paths = validate_and_prune(
+        lambda desc: fit_pls_correlation(corr, n_obs, desc, scheme=spec['inner_scheme'], tol=spec['tol'],
+                                         max_iter=spec['max_iter']), spec
+    )
+
+    _, full_model = model_syntax(latent_vars, paths)
+    res = fit_pls_correlation(corr, n_obs, full_model, scheme=spec['inner_scheme'], tol=spec['tol'],
+                              max_iter=spec['max_iter'])
+    path_df = res.inspect(mode='estimates')
+    rows = []
+    for i, (from_var, to_var) in enumerate(spec['paths']):
+        path_row = path_df[(path_df['lval'] == to_var) & (path_df['op'] == '~') & (path_df['rval'] == from_var)]
+        if path_row.empty:
+            continue
+        beta = path_row['Estimate'].iloc[0]
+        rows.append({
+            'Hipotesis': f"H{i+1}",
+            'Jalur': f"{from_var} -> {to_var}",
+            'β (Koef. Jalur)': beta,
+            'Arah': "Positif" if beta > 0 else "Negatif",
+        })
+
+    summary = {
+        'n_obs': int(n_obs),
+        'indikator_dihapus': invalid,
+        'konstrak_dihapus': dropped_lvs,
+        'jalur_dianalisis': len(paths),
+        'hipotesis_diterima': None,
+        'replikasi_bootstrap': 0,
+        'iterasi_pls': int(res.solution['n_iter']),
+        'konvergen': bool(res.solution['converged']),
+        'model': full_model,
+        'detik': time.perf_counter() - started,
+    }
+    effects = mediation_table(full_model, path_df)
+    return {'hypotheses': pd.DataFrame(rows), 'loadings': loadings, 'r2': res.inspect(mode='r2'), 'effects': effects,
+            'summary': summary}
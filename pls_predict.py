@@ -0,0 +1,226 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from pls_engine import _batched_solve, parse_model_syntax, path_matrix, pls_solve, run_chunks, weighted_moments
+
+
+def _endogenous_items(spec):
+    """Kolom (posisi pair) indikator milik konstrak endogen."""
+    endogenous = set(spec.endogenous)
+    return [k for k, lv in enumerate(spec.pair_lv) if lv in endogenous]
+
+
+def _prepare(desc, data):
+    spec = parse_model_syntax(desc)
+    missing = [ind for ind in spec.indicators if ind not in data.columns]
+    if missing:
+        raise ValueError(f"Indikator tidak ditemukan di data: {', '.join(missing)}")
+    if not len(spec.endogenous):
+        raise ValueError("Model tidak memiliki konstrak endogen untuk diprediksi.")
+    values = data[spec.indicators].to_numpy(dtype=float)
+    if np.isnan(values).any():
+        raise ValueError("Data mengandung nilai kosong; lengkapi atau hapus baris tersebut terlebih dahulu.")
+    mean, sd = values.mean(axis=0), values.std(axis=0, ddof=1)
+    if np.any(sd == 0):
+        raise ValueError("Ada indikator tanpa variasi (varians nol).")
+    return spec, (values - mean) / sd, sd
+
+
+# --- Blindfolding (Stone-Geisser Q²) ---
+
+def blindfolding(desc, data, omission_distance=7, scheme='path', tol=1e-7, max_iter=300):
+    """Q² Stone-Geisser (cross-validated redundancy) per konstrak endogen.
+
+    Setiap konstrak endogen dievaluasi terpisah: hanya titik data
+    indikatornya yang dihapus secara sistematis setiap `omission_distance`
+    posisi (urutan baris), diganti rata-rata kolom, lalu model di-fit ulang.
+    Putaran penghapusan satu konstrak diestimasi sebagai satu batch matriks
+    korelasi, dan hanya kolom indikator konstrak tersebut yang disalin per
+    putaran. Q² = 1 - SSE/SSO (skala terstandarisasi).
+    """
+    D = int(omission_distance)
+    if D < 2:
+        raise ValueError("Omission distance minimal 2.")
+    spec, X, _ = _prepare(desc, data)
+    n, p = X.shape
+    R_full = X.T @ X / (n - 1)
+
+    rows = []
+    for j in spec.endogenous:
+        items = np.flatnonzero(spec.pair_lv == j)
+        item_cols = spec.pair_col[items]
+        # Pola penghapusan: nomor titik data dihitung per baris melintasi indikator konstrak ini
+        position = np.arange(n)[:, None] * len(item_cols) + np.arange(len(item_cols))[None, :]
+        omitted = position[None] % D == np.arange(D)[:, None, None]
+        X_items = X[:, item_cols]
+        kept = ~omitted
+        col_mean = (X_items * kept).sum(axis=1) / kept.sum(axis=1)
+        Xd = np.where(omitted, col_mean[:, None, :], X_items)
+
+        # Korelasi hanya berubah pada baris/kolom indikator yang dihapus (kolom lain tetap terstandarisasi)
+        mean_d = Xd.mean(axis=1)
+        centered = Xd - mean_d[:, None, :]
+        sd_d = np.sqrt((centered ** 2).sum(axis=1) / (n - 1))
+        Zd = centered / sd_d[:, None, :]
+        R = np.repeat(R_full[None], D, axis=0)
+        cross = np.einsum('dnm,np->dmp', Zd, X) / (n - 1)
+        R[:, item_cols, :] = cross
+        R[:, :, item_cols] = cross.transpose(0, 2, 1)
+        R[:, item_cols[:, None], item_cols[None, :]] = np.einsum('dni,dnj->dij', Zd, Zd) / (n - 1)
+        sol = pls_solve(R, spec, scheme=scheme, tol=tol, max_iter=max_iter)
+
+        # Prediksi redundansi: skor konstrak pendahulu, lalu loading indikator konstrak ini
+        W = sol['W'].copy()
+        W_items = W[:, item_cols, :].copy()
+        W[:, item_cols, :] = 0.0
+        scores = X @ W + np.einsum('dnm,dmk->dnk', Zd, W_items)
+        B = path_matrix(spec, sol['paths'])
+        predicted_lv = np.einsum('dnk,dk->dn', scores, B[:, :, j])
+        pred = mean_d[:, None, :] + sd_d[:, None, :] * predicted_lv[:, :, None] * sol['loadings'][:, None, items]
+
+        sse = (((X_items[None] - pred) ** 2) * omitted).sum()
+        sso = ((X_items[None] ** 2) * omitted).sum()
+        rows.append({'Konstrak': spec.lvs[j], 'SSO': sso, 'SSE': sse, 'Q²': 1 - sse / sso})
+    out = pd.DataFrame(rows)
+    # Omission distance yang membagi habis n membuat pola penghapusan berulang per baris
+    out.attrs['divides_n'] = n % D == 0
+    out.attrs['omission_distance'] = D
+    return out
+
+
+# --- PLSpredict (k-fold Berulang) ---
+
+def _predict_chunk(spec, X, k, seed_seqs, fit_kwargs, batch_size):
+    """Worker: jumlah error kuadrat/absolut PLS, LM dan naive per indikator endogen, satu baris per repetisi."""
+    n = X.shape[0]
+    items = _endogenous_items(spec)
+    item_cols = spec.pair_col[items]
+    exo = [j for j in range(len(spec.lvs)) if spec.predecessors[j].size == 0]
+    exo_cols = np.unique(spec.pair_col[np.isin(spec.pair_lv, exo)])
+    K = len(spec.lvs)
+    exo_mask = np.zeros(K)
+    exo_mask[exo] = 1.0
+
+    out = np.full((len(seed_seqs), 5, len(items)), np.nan)
+    reps_per_batch = max(1, batch_size // k)
+    for start in range(0, len(seed_seqs), reps_per_batch):
+        block = seed_seqs[start:start + reps_per_batch]
+        folds = np.stack([np.random.default_rng(s).permutation(n) % k for s in block])
+        # Satu set training per (repetisi, fold): bobot baris 0/1
+        test = (folds[:, None, :] == np.arange(k)[None, :, None]).reshape(-1, n)
+        mean, cov = weighted_moments(X, 1.0 - test)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sd = np.sqrt(np.einsum('bii->bi', cov))
+            R = cov / (sd[:, :, None] * sd[:, None, :])
+        # Repetisi dengan satu fold degeneratif (indikator tanpa variasi) dibuang utuh, repetisi lain tetap dipakai
+        rep_ok = np.isfinite(R).all(axis=(1, 2)).reshape(len(block), k).all(axis=1)
+        if not rep_ok.any():
+            continue
+        fold_ok = np.repeat(rep_ok, k)
+        test, mean, cov, sd, R = test[fold_ok], mean[fold_ok], cov[fold_ok], sd[fold_ok], R[fold_ok]
+        sol = pls_solve(R, spec, **fit_kwargs)
+
+        # PLS: skor eksogen dari indikator uji (terstandarisasi statistik training), propagasi jalur
+        Z = (X[None] - mean[:, None, :]) / sd[:, None, :]
+        exo_scores = (Z @ sol['W']) * exo_mask
+        B = path_matrix(spec, sol['paths'])
+        total = np.linalg.inv(np.eye(K)[None] - B)
+        lv_pred = exo_scores @ total
+        pls_pred = mean[:, None, item_cols] + sd[:, None, item_cols] * (
+            lv_pred[:, :, spec.pair_lv[items]] * sol['loadings'][:, None, items]
+        )
+
+        # Benchmark LM: regresi setiap indikator endogen pada semua indikator eksogen
+        coef = _batched_solve(cov[:, exo_cols][:, :, exo_cols], cov[:, exo_cols][:, :, item_cols])
+        lm_pred = mean[:, None, item_cols] + (X[None][:, :, exo_cols] - mean[:, None, exo_cols]) @ coef
+        naive_pred = np.broadcast_to(mean[:, None, item_cols], pls_pred.shape)
+
+        actual = X[None][:, :, item_cols]
+        mask = test[:, :, None]
+        sums = np.stack([
+            (((actual - pls_pred) ** 2) * mask).sum(axis=1),
+            (np.abs(actual - pls_pred) * mask).sum(axis=1),
+            (((actual - lm_pred) ** 2) * mask).sum(axis=1),
+            (np.abs(actual - lm_pred) * mask).sum(axis=1),
+            (((actual - naive_pred) ** 2) * mask).sum(axis=1),
+        ], axis=1)
+        # Jumlahkan fold per repetisi
+        out[start:start + len(block)][rep_ok] = sums.reshape(int(rep_ok.sum()), k, 5, len(items)).sum(axis=1)
+    return out, None
+
+
+def pls_predict(desc, data, k=10, repeats=10, seed=42, n_jobs=1, scheme='path', batch_size=None, progress=None):
+    """PLSpredict: RMSE/MAE out-of-sample k-fold berulang untuk indikator endogen, dibandingkan model linear.
+
+    Semua fold dan repetisi memakai matriks data terstandarisasi yang sama;
+    set training dinyatakan sebagai bobot baris sehingga satu batch PLS
+    memuat banyak fold sekaligus. Repetisi dibagi ke worker proses dengan
+    stream RNG per repetisi, sehingga hasilnya tidak bergantung pada jumlah
+    worker. Metrik dilaporkan dalam satuan asli indikator dan dirata-rata
+    atas repetisi.
+    """
+    spec, X, sd = _prepare(desc, data)
+    n = X.shape[0]
+    if not 2 <= k <= n:
+        raise ValueError(f"Jumlah fold harus di antara 2 dan {n}.")
+    if all(spec.predecessors[j].size for j in range(len(spec.lvs))):
+        raise ValueError("Model tidak memiliki konstrak eksogen sebagai prediktor.")
+    if batch_size is None:
+        batch_size = max(k, int(4e6 // (n * X.shape[1])))
+    fit_kwargs = {'scheme': scheme}
+    seed_seqs = np.random.SeedSequence(seed).spawn(repeats)
+    n_jobs = max(1, min(n_jobs or 1, repeats))
+
+    def make_args(chunk):
+        return spec, X, k, chunk, fit_kwargs, batch_size
+
+    # Batas batch worker dalam satuan repetisi, sama untuk semua jumlah worker
+    reps_per_batch = max(1, batch_size // k)
+    if n_jobs == 1:
+        blocks = run_chunks(_predict_chunk, make_args, seed_seqs, 1, progress=progress, batch_size=reps_per_batch)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = run_chunks(_predict_chunk, make_args, seed_seqs, n_jobs, pool=pool, progress=progress,
+                                batch_size=reps_per_batch)
+    sums = np.concatenate([out for out, _ in blocks])
+    sums = sums[np.isfinite(sums).all(axis=(1, 2))]
+    if not sums.shape[0]:
+        raise ValueError("Semua repetisi gagal (indikator tanpa variasi pada data training).")
+
+    items = _endogenous_items(spec)
+    scale = sd[spec.pair_col[items]]
+    rmse_pls = (np.sqrt(sums[:, 0] / n) * scale).mean(axis=0)
+    mae_pls = (sums[:, 1] / n * scale).mean(axis=0)
+    rmse_lm = (np.sqrt(sums[:, 2] / n) * scale).mean(axis=0)
+    mae_lm = (sums[:, 3] / n * scale).mean(axis=0)
+    q2_predict = (1 - sums[:, 0] / sums[:, 4]).mean(axis=0)
+    out = pd.DataFrame({
+        'Konstrak': [spec.lvs[spec.pair_lv[i]] for i in items],
+        'Indikator': [spec.indicators[spec.pair_col[i]] for i in items],
+        'Q²_predict': q2_predict,
+        'RMSE (PLS)': rmse_pls,
+        'MAE (PLS)': mae_pls,
+        'RMSE (LM)': rmse_lm,
+        'MAE (LM)': mae_lm,
+    })
+    out['RMSE PLS - LM'] = out['RMSE (PLS)'] - out['RMSE (LM)']
+    out.attrs['repeats'] = int(sums.shape[0])
+    out.attrs['k'] = k
+    return out
+
+
+def predictive_power(predict_df):
+    """Klasifikasi daya prediksi (Shmueli dkk., 2019) dari jumlah indikator dengan RMSE PLS < LM."""
+    valid = predict_df[predict_df['Q²_predict'] > 0]
+    if len(valid) < len(predict_df):
+        return "Tidak ada daya prediksi (ada Q²_predict ≤ 0)"
+    better = int((predict_df['RMSE PLS - LM'] < 0).sum())
+    if better == len(predict_df):
+        return "Tinggi"
+    if better > len(predict_df) / 2:
+        return "Sedang"
+    if better > 0:
+        return "Rendah"
+    return "Tidak ada"
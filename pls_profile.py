@@ -0,0 +1,190 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+import pandas as pd
+
+from pls_data import process_rss
+
+# Perkiraan ukuran satu catatan tahap (dict ~13 kunci beserta nilainya) untuk akuntansi memori
+RECORD_BYTES = 1500
+
+# --- Profiler Tahap ---
+
+class StageProfiler:
+    """Catat wall time, CPU time dan memori untuk setiap tahap analisis.
+
+    Setiap rerun Streamlit dibuka dengan `begin_run()`, lalu setiap tahap
+    dibungkus `with profiler.stage("nama"):`. CPU time adalah milik thread
+    pemanggil (worker proses bootstrap tidak terhitung). Memori dicatat sebagai
+    selisih resident memory proses; puncak alokasi Python (tracemalloc)
+    opsional karena memperlambat kode yang diukur.
+    """
+
+    def __init__(self, trace_memory=False, max_records=2000):
+        self.trace_memory = trace_memory
+        self.max_records = max_records
+        self.records = []
+        self.run_id = 0
+        self.run_label = None
+        self._origin = time.perf_counter()
+        self._origin_epoch = time.time()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def begin_run(self, label=None):
+        """Tandai awal rerun baru; tabel 'rerun terakhir' hanya memuat tahap setelah ini."""
+        with self._lock:
+            self.run_id += 1
+            self.run_label = label
+
+    @contextmanager
+    def stage(self, name, category='app', **meta):
+        depth = getattr(self._local, 'depth', 0)
+        # Hanya tahap terluar yang memegang tracemalloc; tahap bersarang tidak mengukur puncak
+        owns_trace = self.trace_memory and not tracemalloc.is_tracing()
+        if owns_trace:
+            tracemalloc.start()
+        rss_before = process_rss()
+        start, cpu = time.perf_counter(), time.thread_time()
+        error = None
+        self._local.depth = depth + 1
+        try:
+            yield
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._local.depth = depth
+            end = time.perf_counter()
+            record = {
+                'run': self.run_id,
+                'page': self.run_label,
+                'stage': name,
+                'category': category,
+                'depth': depth,
+                'thread': threading.get_ident(),
+                'start': start - self._origin,
+                'seconds': end - start,
+                'cpu_seconds': time.thread_time() - cpu,
+                'rss_before': rss_before,
+                'rss_delta': process_rss() - rss_before,
+                'peak_bytes': None,
+                'error': error,
+            }
+            if owns_trace:
+                record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            record.update(meta)
+            with self._lock:
+                self.records.append(record)
+                del self.records[:-self.max_records]
+
+    def run(self, name, fn, *args, category='app', **kwargs):
+        """Jalankan `fn(*args, **kwargs)` sebagai satu tahap dan kembalikan hasilnya."""
+        with self.stage(name, category=category):
+            return fn(*args, **kwargs)
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+
+    def merge(self, other):
+        """Tambahkan catatan profiler lain (mis. milik job latar belakang) ke rerun saat ini.
+
+        Waktu mulai digeser ke origin profiler ini; thread asal tetap dicatat
+        sehingga tahap job tampil di jalur terpisah pada trace.
+        """
+        with other._lock:
+            records = list(other.records)
+        shift = other._origin - self._origin
+        with self._lock:
+            for record in records:
+                self.records.append(dict(record, run=self.run_id, page=record['page'] or self.run_label,
+                                         start=record['start'] + shift))
+            del self.records[:-self.max_records]
+
+    @property
+    def nbytes(self):
+        """Perkiraan memori catatan tanpa menelusuri setiap record (dipanggil setiap rerun)."""
+        return len(self.records) * RECORD_BYTES
+
+    def frame(self, last_run=False):
+        """Catatan tahap sebagai DataFrame (opsional hanya rerun terakhir)."""
+        with self._lock:
+            records = [r for r in self.records if not last_run or r['run'] == self.run_id]
+        # Tahap bersarang tercatat lebih dulu dari induknya; urutkan menurut waktu mulai
+        return pd.DataFrame(records).sort_values('start', ignore_index=True) if records else pd.DataFrame()
+
+    def summary(self):
+        """Agregasi per tahap: jumlah panggilan, total/rata-rata/maks wall time, CPU dan memori."""
+        df = self.frame()
+        if df.empty:
+            return df
+        grouped = df.groupby(['page', 'stage'], sort=False, dropna=False)
+        return pd.DataFrame({
+            'Panggilan': grouped.size(),
+            'Total (s)': grouped['seconds'].sum(),
+            'Rata-rata (s)': grouped['seconds'].mean(),
+            'Maks (s)': grouped['seconds'].max(),
+            'CPU (s)': grouped['cpu_seconds'].sum(),
+            'Maks Δ RSS (MB)': grouped['rss_delta'].max() / 2**20,
+        }).reset_index().sort_values('Total (s)', ascending=False)
+
+    def chrome_trace(self):
+        """Ekspor catatan sebagai Chrome Trace Event JSON (chrome://tracing, Perfetto, speedscope)."""
+        with self._lock:
+            records = list(self.records)
+        pid = os.getpid()
+        events = []
+        for r in records:
+            args = {k: v for k, v in r.items() if k not in ('stage', 'category', 'thread', 'start', 'seconds')}
+            events.append({
+                'name': r['stage'], 'cat': r['category'], 'ph': 'X', 'pid': pid, 'tid': r['thread'],
+                'ts': r['start'] * 1e6, 'dur': r['seconds'] * 1e6, 'args': args,
+            })
+        doc = {'traceEvents': events, 'displayTimeUnit': 'ms',
+               'otherData': {'origin_epoch': self._origin_epoch, 'pid': pid}}
+        return json.dumps(doc, default=str).encode()
+
+
+def profile_stage(profiler, name, category='app', **meta):
+    """`profiler.stage(...)` bila profiler diberikan, selain itu konteks kosong."""
+    return profiler.stage(name, category=category, **meta) if profiler is not None else nullcontext()
+
+
+# --- Panel Sidebar ---
+
+def render_profiler_panel(profiler, container, file_name='sempls_trace.json'):
+    """Tampilkan tabel tahap rerun terakhir, ringkasan kumulatif dan tombol ekspor trace.
+
+    `container` adalah objek Streamlit tujuan (mis. `st.sidebar`).
+    """
+    last = profiler.frame(last_run=True)
+    if last.empty:
+        container.caption("Belum ada tahap yang tercatat pada rerun ini.")
+    else:
+        table = pd.DataFrame({
+            'Tahap': ['  ' * d + s for d, s in zip(last['depth'], last['stage'])],
+            'Wall (s)': last['seconds'].round(3),
+            'CPU (s)': last['cpu_seconds'].round(3),
+            'Δ RSS (MB)': (last['rss_delta'] / 2**20).round(1),
+        })
+        if last['peak_bytes'].notna().any():
+            table['Puncak Alokasi (MB)'] = (last['peak_bytes'] / 2**20).round(1)
+        if last['error'].notna().any():
+            table['Error'] = last['error']
+        top = last[last['depth'] == 0]
+        container.caption(f"Rerun #{profiler.run_id} · {profiler.run_label} · "
+                          f"{top['seconds'].sum():.3f} s tercatat · RSS {process_rss() / 2**20:.0f} MB")
+        container.dataframe(table, hide_index=True, use_container_width=True)
+
+    summary = profiler.summary()
+    if not summary.empty:
+        summary_box = container.expander("Ringkasan kumulatif sesi")
+        summary_box.dataframe(summary.round(3), hide_index=True, use_container_width=True)
+        container.download_button("⬇️ Ekspor Trace (Chrome JSON)", profiler.chrome_trace(),
+                                  file_name=file_name, mime="application/json")
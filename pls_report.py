@@ -0,0 +1,120 @@
+import html
+import io
+import json
+import re
+import time
+import zipfile
+
+import numpy as np
+
+from pls_cache import replicate_arrays
+from pls_data import HAS_PYARROW
+
+# Format tabel di dalam paket ekspor (Parquet memerlukan pyarrow)
+TABLE_FORMATS = ['parquet', 'csv'] if HAS_PYARROW else ['csv']
+
+REPORT_STYLE = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 1100px; color: #212121; }
+h1, h2 { color: #004d40; }
+table { border-collapse: collapse; margin-bottom: 1.5em; font-size: 0.9em; }
+th, td { border: 1px solid #b2dfdb; padding: 4px 8px; text-align: right; }
+th { background: #e0f2f1; }
+td:first-child, th:first-child { text-align: left; }
+.meta td { text-align: left; }
+.diagram svg { max-width: 100%; height: auto; }
+@media print { h2 { page-break-before: auto; } table { page-break-inside: avoid; } }
+"""
+
+
+def table_slug(name):
+    """Nama berkas aman untuk satu tabel (huruf kecil, non-alfanumerik menjadi '_')."""
+    return re.sub(r'[^0-9a-z]+', '_', name.lower()).strip('_') or 'tabel'
+
+
+def table_bytes(df, fmt='parquet'):
+    """Serialisasi satu tabel hasil ke Parquet atau CSV UTF-8 (nama kolom dijadikan string)."""
+    df = df.rename(columns=str)
+    if fmt == 'parquet':
+        buf = io.BytesIO()
+        df.to_parquet(buf, index=False)
+        return buf.getvalue()
+    return df.to_csv(index=False).encode('utf-8')
+
+
+def replicate_bytes(boot_res):
+    """Replikasi bootstrap dalam format `.npz` yang sama dengan `ReplicateStore`."""
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **replicate_arrays(boot_res))
+    return buf.getvalue()
+
+
+def html_report(title, tables, diagram_svg=None, meta=None):
+    """Laporan HTML statis satu berkas: metadata, diagram jalur (SVG inline) dan semua tabel.
+
+    Tidak memuat aset eksternal, sehingga dapat dibuka offline atau dicetak
+    ke PDF dari browser.
+    """
+    parts = [f"<!DOCTYPE html>\n<html lang=\"id\">\n<head>\n<meta charset=\"utf-8\">\n"
+             f"<title>{html.escape(title)}</title>\n<style>{REPORT_STYLE}</style>\n</head>\n<body>",
+             f"<h1>{html.escape(title)}</h1>"]
+    if meta:
+        rows = "".join(f"<tr><th>{html.escape(str(k))}</th><td>{html.escape(str(v))}</td></tr>" for k, v in meta.items())
+        parts.append(f"<table class=\"meta\">{rows}</table>")
+    if diagram_svg:
+        svg = diagram_svg.decode('utf-8') if isinstance(diagram_svg, bytes) else diagram_svg
+        # Buang deklarasi XML/DOCTYPE agar SVG dapat disisipkan langsung di HTML
+        parts.append(f"<h2>Path Diagram</h2>\n<div class=\"diagram\">{svg[svg.find('<svg'):]}</div>")
+    for name, df in tables.items():
+        parts.append(f"<h2>{html.escape(name)}</h2>")
+        parts.append(df.to_html(index=False, na_rep="", border=0, float_format=lambda v: f"{v:.3f}"))
+    parts.append("</body>\n</html>\n")
+    return "\n".join(parts)
+
+
+def export_bundle(tables, boot_res=None, diagram_svg=None, meta=None, fmt=None, title="Laporan Analisis SEM-PLS",
+                  progress=None):
+    """Paket ZIP hasil analisis: `laporan.html`, `tabel/*`, `replikasi_bootstrap.npz` dan `metadata.json`.
+
+    Hanya menyerialisasi hasil yang sudah ada (tanpa fit atau bootstrap
+    ulang), sehingga cocok dijalankan sebagai job latar belakang.
+    `progress(done, total)` dipanggil setiap satu berkas selesai dan menjadi
+    titik pembatalan job. Berkas yang sudah terkompresi (Parquet, `.npz`)
+    disimpan tanpa kompresi ZIP tambahan.
+    """
+    fmt = fmt or TABLE_FORMATS[0]
+    if fmt not in TABLE_FORMATS:
+        raise ValueError(f"Format tabel tidak didukung: {fmt} (pilihan: {', '.join(TABLE_FORMATS)}).")
+    with_replicates = hasattr(boot_res, 'replicates')
+    total = len(tables) + 2 + with_replicates
+    done = 0
+
+    def step():
+        nonlocal done
+        done += 1
+        if progress is not None:
+            progress(done, total)
+
+    buf = io.BytesIO()
+    files = []
+    with zipfile.ZipFile(buf, 'w') as zf:
+        for name, df in tables.items():
+            path = f"tabel/{table_slug(name)}.{fmt}"
+            zf.writestr(path, table_bytes(df, fmt),
+                        compress_type=zipfile.ZIP_STORED if fmt == 'parquet' else zipfile.ZIP_DEFLATED)
+            files.append(path)
+            step()
+        if with_replicates:
+            zf.writestr('replikasi_bootstrap.npz', replicate_bytes(boot_res), compress_type=zipfile.ZIP_STORED)
+            files.append('replikasi_bootstrap.npz')
+            step()
+        zf.writestr('laporan.html', html_report(title, tables, diagram_svg, meta), compress_type=zipfile.ZIP_DEFLATED)
+        files.append('laporan.html')
+        step()
+        info = dict(meta or {}, dibuat=time.strftime('%Y-%m-%d %H:%M:%S'), berkas=files)
+        if with_replicates:
+            info['replikasi'] = {'jumlah': int(boot_res.replicates.shape[0]), 'valid': boot_res.n_valid,
+                                 'presisi': boot_res.precision}
+        zf.writestr('metadata.json', json.dumps(info, indent=2, ensure_ascii=False, default=str),
+                    compress_type=zipfile.ZIP_DEFLATED)
+        step()
+    return buf.getvalue()
@@ -0,0 +1,270 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from pls_engine import (
+    PLSResult, PLSSpec, _batched_solve, _resample_counts, _resolve_seed_jobs, bootstrap_correlations,
+    default_batch_size, fit_pls, parse_model_syntax, resample_matrix, run_chunks, standardize,
+)
+
+# Batas HTMT (Henseler dkk., 2015): 0.90 untuk konstrak yang mirip secara konseptual, 0.85 yang lebih ketat
+HTMT_THRESHOLD = 0.90
+
+# Ukuran reliabilitas konstrak, urutan sumbu kedua keluaran `reliability`
+RELIABILITY_COLS = ["Cronbach's Alpha", 'rho_A', 'Composite Reliability', 'AVE']
+
+
+def _pair_membership(spec):
+    """Matriks keanggotaan pasangan (konstrak, indikator) x konstrak."""
+    M = np.zeros((len(spec.pairs), len(spec.lvs)))
+    M[np.arange(len(spec.pairs)), spec.pair_lv] = 1.0
+    return M
+
+
+def _model_matrix(desc, data, precision=None):
+    """Spesifikasi model dan matriks indikator (urutan `spec.indicators`).
+
+    Tanpa `precision` matriks terstandarisasi; dengan `precision` matriks
+    resample dari `resample_matrix`.
+    """
+    spec = desc if isinstance(desc, PLSSpec) else parse_model_syntax(desc)
+    missing = [ind for ind in spec.indicators if ind not in data.columns]
+    if missing:
+        raise ValueError(f"Indikator tidak ditemukan di data: {', '.join(missing)}")
+    values = data[spec.indicators].to_numpy()
+    return spec, standardize(values) if precision is None else resample_matrix(values, precision)
+
+
+def _native_loadings(res, desc, data, scheme):
+    """Loading sampel penuh urut `spec.pairs`; hasil engine lain di-fit ulang dengan estimator native."""
+    if not isinstance(res, PLSResult):
+        res = fit_pls(desc, data, scheme=scheme)
+    return res.solution['loadings']
+
+
+def _interval_table(observed, replicates, level):
+    """Kolom Estimate, Sample Mean, CI Lower, CI Upper (percentile) dari replikasi valid."""
+    valid = replicates[np.isfinite(replicates).all(axis=1)]
+    lo_q, hi_q = (1 - level) / 2, 1 - (1 - level) / 2
+    lower, upper = np.quantile(valid, [lo_q, hi_q], axis=0) if valid.shape[0] else (np.nan, np.nan)
+    out = pd.DataFrame({
+        'Estimate': observed,
+        'Sample Mean': valid.mean(axis=0) if valid.shape[0] else np.nan,
+        'CI Lower': lower,
+        'CI Upper': upper,
+    })
+    out.attrs['n_valid'] = int(valid.shape[0])
+    return out
+
+
+# --- Resample Matriks Korelasi ---
+
+def _resample_chunk(stat_fn, n_stats, spec, X, seed_seqs, batch_size, context):
+    """Worker: matriks korelasi resample per batch lalu `stat_fn(R, spec, index, context)` per replikasi.
+
+    `index` adalah nomor replikasi (dari `spawn_key`), sehingga statistik bisa
+    dipasangkan dengan replikasi bootstrap jalur yang memakai seed yang sama.
+    """
+    out = np.full((len(seed_seqs), n_stats), np.nan)
+    for start in range(0, len(seed_seqs), batch_size):
+        block = seed_seqs[start:start + batch_size]
+        R = bootstrap_correlations(X, _resample_counts(X.shape[0], block))
+        ok = np.isfinite(R).all(axis=(1, 2))
+        index = np.array([s.spawn_key[-1] for s in block])
+        if ok.any():
+            out[start:start + len(block)][ok] = stat_fn(R[ok], spec, index[ok], context)
+    return out, None
+
+
+def resample_statistics(stat_fn, n_stats, spec, X, nboot, seed=42, n_jobs=1, context=None, batch_size=None, progress=None):
+    """Hitung `stat_fn` pada matriks korelasi resample bootstrap; kembalikan array (replikasi x statistik).
+
+    Resample ke-i identik dengan replikasi ke-i `parallel_bootstrap` dengan
+    `seed` yang sama, sehingga interval statistik kualitas model memakai
+    resample yang sama dengan koefisien jalur. Batas batch tidak bergantung
+    pada `n_jobs`, jadi hasilnya identik untuk semua jumlah worker.
+    Replikasi dengan indikator tanpa variasi bernilai NaN.
+    """
+    if batch_size is None:
+        # Batasi array resample sekitar 64 MB per batch (sama dengan bootstrap native)
+        batch_size = default_batch_size(X, 64e6)
+    seed, n_jobs = _resolve_seed_jobs(seed, n_jobs, nboot)
+    seed_seqs = np.random.SeedSequence(seed).spawn(nboot)
+
+    def make_args(chunk):
+        return stat_fn, n_stats, spec, X, chunk, batch_size, context
+
+    if n_jobs == 1:
+        blocks = run_chunks(_resample_chunk, make_args, seed_seqs, 1, progress=progress, batch_size=batch_size)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = run_chunks(_resample_chunk, make_args, seed_seqs, n_jobs, pool=pool, progress=progress,
+                                batch_size=batch_size)
+    return np.vstack([out for out, _ in blocks])
+
+
+# --- Validitas Diskriminan ---
+
+def htmt(R, spec):
+    """Heterotrait-monotrait ratio untuk batch matriks korelasi (batch x p x p) -> (batch x K x K).
+
+    Semua pasangan konstrak dihitung sekaligus dari jumlah blok
+    M' |R| M. Konstrak satu indikator memakai korelasi monotrait 1.
+    Diagonal bernilai NaN.
+    """
+    M = _pair_membership(spec)
+    A = np.abs(R[:, spec.pair_col][:, :, spec.pair_col])
+    S = M.T @ A @ M
+    size = M.sum(axis=0)
+    hetero = S / np.outer(size, size)
+    diag = np.einsum('bkk->bk', S)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mono = np.where(size > 1, (diag - size) / (size * (size - 1)), 1.0)
+        out = hetero / np.sqrt(mono[:, :, None] * mono[:, None, :])
+    out[:, np.arange(len(size)), np.arange(len(size))] = np.nan
+    return out
+
+
+def _htmt_stat(R, spec, index, context):
+    rows, cols = np.tril_indices(len(spec.lvs), k=-1)
+    return htmt(R, spec)[:, rows, cols]
+
+
+def htmt_matrix(desc, data):
+    """Matriks HTMT (segitiga bawah) sebagai DataFrame konstrak x konstrak."""
+    spec, X = _model_matrix(desc, data)
+    values = htmt((X.T @ X / (X.shape[0] - 1))[None], spec)[0]
+    values[np.triu_indices(len(spec.lvs))] = np.nan
+    return pd.DataFrame(values, index=spec.lvs, columns=spec.lvs)
+
+
+def htmt_bootstrap(desc, data, nboot, level=0.95, seed=42, n_jobs=1, batch_size=None, progress=None,
+                   precision='float64'):
+    """HTMT per pasangan konstrak dengan interval kepercayaan bootstrap percentile.
+
+    Hanya matriks korelasi resample yang dihitung ulang (tanpa fit PLS),
+    dalam batch per worker, dengan presisi data resample `precision`.
+    Kolom: Konstrak A, Konstrak B, HTMT, Sample Mean, CI Lower, CI Upper.
+    """
+    spec, X = _model_matrix(desc, data)
+    if len(spec.lvs) < 2:
+        raise ValueError("HTMT memerlukan minimal 2 konstrak.")
+    observed = _htmt_stat((X.T @ X / (X.shape[0] - 1))[None], spec, None, None)[0]
+    _, X_resample = _model_matrix(spec, data, precision)
+    replicates = resample_statistics(_htmt_stat, observed.size, spec, X_resample, nboot, seed=seed, n_jobs=n_jobs,
+                                     batch_size=batch_size, progress=progress)
+    rows, cols = np.tril_indices(len(spec.lvs), k=-1)
+    intervals = _interval_table(observed, replicates, level).rename(columns={'Estimate': 'HTMT'})
+    out = pd.concat([pd.DataFrame({
+        'Konstrak A': [spec.lvs[c] for c in cols],
+        'Konstrak B': [spec.lvs[r] for r in rows],
+    }), intervals], axis=1)
+    out.attrs['n_valid'] = intervals.attrs['n_valid']
+    return out
+
+
+def fornell_larcker(res, desc=None, data=None, scheme='path'):
+    """Tabel Fornell-Larcker: akar AVE di diagonal, korelasi antar konstrak di segitiga bawah.
+
+    `res` berupa `PLSResult`; hasil engine lain di-fit ulang dengan
+    estimator native dari `desc` dan `data`.
+    """
+    if not isinstance(res, PLSResult):
+        res = fit_pls(desc, data, scheme=scheme)
+    spec = res.spec
+    M = _pair_membership(spec)
+    ave = (res.solution['loadings'] ** 2) @ M / M.sum(axis=0)
+    values = res.solution['lv_corr'].copy()
+    values[np.triu_indices(len(spec.lvs), k=1)] = np.nan
+    values[np.diag_indices(len(spec.lvs))] = np.sqrt(ave)
+    return pd.DataFrame(values, index=spec.lvs, columns=spec.lvs)
+
+
+def fornell_larcker_violations(table):
+    """Pasangan konstrak yang korelasinya melebihi akar AVE salah satu konstrak."""
+    root_ave = np.diag(table.to_numpy())
+    violations = []
+    for i, a in enumerate(table.index):
+        for j in range(i):
+            corr = abs(table.iat[i, j])
+            if corr >= min(root_ave[i], root_ave[j]):
+                violations.append((table.columns[j], a, corr))
+    return violations
+
+
+# --- Reliabilitas Konstrak ---
+
+def reliability(R, loadings, spec):
+    """Cronbach's alpha, rho_A, composite reliability dan AVE -> (batch x 4 x K).
+
+    `R` adalah batch matriks korelasi indikator dan `loadings` (batch x
+    pasangan) loading outer yang berpadanan. Bobot outer untuk rho_A
+    dipulihkan dari loading Mode A (lambda = R_blok w) dengan satu solve
+    blok-diagonal untuk semua konstrak. Konstrak satu indikator bernilai 1
+    untuk alpha dan rho_A.
+    """
+    M = _pair_membership(spec)
+    size = M.sum(axis=0)
+    R_pairs = R[:, spec.pair_col][:, :, spec.pair_col]
+    R_block = R_pairs * (M @ M.T)
+    total = np.einsum('bkk->bk', M.T @ R_pairs @ M)
+
+    lam_sum = loadings @ M
+    lam_sq = (loadings ** 2) @ M
+    w = _batched_solve(R_block, loadings[..., None])
+    var = (w[..., 0] * (R_block @ w)[..., 0]) @ M
+    w = w[..., 0] / np.sqrt(var)[:, spec.pair_lv]
+    w_sq = (w ** 2) @ M
+    w_quad = (w ** 4) @ M
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = np.where(size > 1, size / (size - 1) * (1 - size / total), 1.0)
+        # rho_A (Dijkstra-Henseler) dengan w'Rw = 1: w'(R - diag R)w = 1 - w'w
+        rho_a = np.where(size > 1, w_sq ** 2 * (1 - w_sq) / (w_sq ** 2 - w_quad), 1.0)
+    cr = lam_sum ** 2 / (lam_sum ** 2 + size - lam_sq)
+    ave = lam_sq / size
+    return np.stack([alpha, rho_a, cr, ave], axis=1)
+
+
+def _reliability_stat(R, spec, index, context):
+    return reliability(R, context[index], spec).reshape(R.shape[0], -1)
+
+
+def reliability_table(res, desc, data, scheme='path'):
+    """Tabel reliabilitas sampel penuh (Konstrak x ukuran `RELIABILITY_COLS`)."""
+    spec, X = _model_matrix(desc, data)
+    R = (X.T @ X / (X.shape[0] - 1))[None]
+    values = reliability(R, _native_loadings(res, desc, data, scheme)[None], spec)[0]
+    return pd.DataFrame(values.T, index=pd.Index(spec.lvs, name='Konstrak'), columns=RELIABILITY_COLS)
+
+
+def reliability_bootstrap(res, boot_res, desc, data, level=0.95, scheme='path', n_jobs=1, batch_size=None,
+                          progress=None):
+    """Interval bootstrap percentile reliabilitas dari replikasi bootstrap jalur yang sudah ada.
+
+    Loading tiap replikasi diambil dari `boot_res.replicates`; matriks
+    korelasi replikasi yang sama dibentuk ulang dari `boot_res.seed`, jadi
+    tidak ada fit PLS atau resampling baru. Presisi data resample mengikuti
+    `boot_res.precision`. Kolom: Konstrak, Ukuran, Estimate, Sample Mean,
+    CI Lower, CI Upper.
+    """
+    if getattr(boot_res, 'replicates', None) is None:
+        raise ValueError("Interval reliabilitas memerlukan replikasi bootstrap (mode paralel atau progresif).")
+    spec, X = _model_matrix(desc, data, boot_res.precision)
+    est = boot_res.estimates
+    position = {key: i for i, key in enumerate(zip(est['lval'], est['op'], est['rval']))}
+    keys = [(spec.lvs[k], '=~', spec.indicators[c]) for k, c in spec.pairs]
+    missing = [f"{lv} =~ {ind}" for lv, op, ind in keys if (lv, op, ind) not in position]
+    if missing:
+        raise ValueError(f"Replikasi bootstrap tidak memuat loading: {', '.join(missing)}")
+    context = boot_res.replicates[:, [position[key] for key in keys]].astype(np.float64)
+
+    observed = reliability_table(res, spec, data, scheme=scheme).to_numpy().T.ravel()
+    replicates = resample_statistics(_reliability_stat, observed.size, spec, X, context.shape[0], seed=boot_res.seed,
+                                     n_jobs=n_jobs, context=context, batch_size=batch_size, progress=progress)
+    out = pd.concat([pd.DataFrame({
+        'Konstrak': np.tile(spec.lvs, len(RELIABILITY_COLS)),
+        'Ukuran': np.repeat(RELIABILITY_COLS, len(spec.lvs)),
+    }), _interval_table(observed, replicates, level)], axis=1)
+    out.attrs['n_valid'] = int(np.isfinite(replicates).all(axis=1).sum())
+    return out
@@ -0,0 +1,45 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LATENT_VARS = {'X': ['x1', 'x2', 'x3'], 'M': ['m1', 'm2', 'm3'], 'Y': ['y1', 'y2', 'y3']}
+PATHS = [('X', 'M'), ('M', 'Y'), ('X', 'Y')]
+DESC = "X =~ x1 + x2 + x3\nM =~ m1 + m2 + m3\nY =~ y1 + y2 + y3\nM ~ X\nY ~ M + X\n"
+
+
+def likert_sample(n, seed, loading=0.8, path_coef=0.4):
+    """Data Likert 1-5 dari model `DESC` dengan loading dan koefisien jalur populasi yang diketahui."""
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal(n)
+    m = path_coef * x + np.sqrt(1 - path_coef ** 2) * rng.standard_normal(n)
+    # Var(b·M + b·X) dengan Cor(M, X) = b; sisanya residual agar Var(Y) = 1
+    y = path_coef * (m + x) + np.sqrt(1 - 2 * path_coef ** 2 * (1 + path_coef)) * rng.standard_normal(n)
+    cols = {}
+    for eta, inds in zip((x, m, y), LATENT_VARS.values()):
+        for ind in inds:
+            z = loading * eta + np.sqrt(1 - loading ** 2) * rng.standard_normal(n)
+            cols[ind] = np.clip(np.round(3 + 1.2 * z), 1, 5)
+    return pd.DataFrame(cols)
+
+
+@pytest.fixture(scope='session')
+def desc():
+    """Model mediasi kecil: X -> M -> Y dan X -> Y, tiga indikator per konstrak."""
+    return DESC
+
+
+@pytest.fixture(scope='session')
+def model_spec():
+    """Spesifikasi model `DESC` dalam format JSON pipeline/CLI batch."""
+    return {'latent_vars': LATENT_VARS, 'paths': [list(p) for p in PATHS]}
+
+
+@pytest.fixture(scope='session')
+def data():
+    """Dataset Likert tetap (n=200, seed 7)."""
+    return likert_sample(200, 7)
@@ -0,0 +1,47 @@
+import json
+import os
+
+import pandas as pd
+
+from pls_batch import main
+from pls_report import TABLE_FORMATS
+
+
+def _write_inputs(tmp_path, data, model_spec, **settings):
+    spec_path = tmp_path / 'model.json'
+    spec_path.write_text(json.dumps(dict(model_spec, loading_threshold=0.5, **settings)))
+    os.makedirs(tmp_path / 'data')
+    data.to_csv(tmp_path / 'data' / 'gelombang_1.csv', index=False)
+    data.iloc[::-1].to_csv(tmp_path / 'data' / 'gelombang_2.csv', index=False)
+    return str(spec_path), str(tmp_path / 'data'), str(tmp_path / 'hasil')
+
+
+def test_batch_cli_writes_tables_for_every_dataset(tmp_path, data, model_spec):
+    spec_path, data_dir, output = _write_inputs(tmp_path, data, model_spec)
+    assert main([spec_path, data_dir, '--output', output, '--jobs', '1', '--nboot', '50', '--format', 'csv']) == 0
+
+    overview = pd.read_csv(os.path.join(output, 'ringkasan_batch.csv'))
+    assert list(overview['dataset']) == ['gelombang_1', 'gelombang_2'] and (overview['status'] == 'selesai').all()
+    for name in overview['dataset']:
+        target = os.path.join(output, name)
+        hypotheses = pd.read_csv(os.path.join(target, 'hipotesis.csv'))
+        assert len(hypotheses) == 3
+        assert len(pd.read_csv(os.path.join(target, 'loadings.csv'))) == 9
+        assert list(pd.read_csv(os.path.join(target, 'r2.csv'))['Konstrak']) == ['M', 'Y']
+        with open(os.path.join(target, 'ringkasan.json'), encoding='utf-8') as f:
+            assert json.load(f)['replikasi_bootstrap'] == 50
+
+
+def test_batch_cli_defaults_to_report_table_format(tmp_path, data, model_spec):
+    spec_path, data_dir, output = _write_inputs(tmp_path, data, model_spec)
+    assert main([spec_path, data_dir, '--output', output, '--jobs', '1', '--nboot', '20']) == 0
+    assert sorted(os.listdir(os.path.join(output, 'gelombang_1'))) == sorted(
+        [f'{name}.{TABLE_FORMATS[0]}' for name in ('hipotesis', 'loadings', 'r2', 'efek')] + ['ringkasan.json'])
+
+
+def test_batch_cli_report_writes_static_html(tmp_path, data, model_spec):
+    spec_path, data_dir, output = _write_inputs(tmp_path, data, model_spec)
+    assert main([spec_path, data_dir, '--output', output, '--jobs', '1', '--nboot', '50', '--report']) == 0
+    with open(os.path.join(output, 'gelombang_1', 'laporan.html'), encoding='utf-8') as f:
+        page = f.read()
+    assert "Laporan Analisis SEM-PLS: gelombang_1" in page and "<h2>Uji Hipotesis</h2>" in page
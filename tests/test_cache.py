@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from pls_cache import DatasetStore, FitCache, ReplicateStore, make_cache_key
+from pls_engine import parallel_bootstrap
+
+
+def _frame(seed, n=2000):
+    return pd.DataFrame(np.random.default_rng(seed).normal(size=(n, 4)), columns=list('abcd'))
+
+
+def test_fit_cache_evicts_least_recently_used(tmp_path):
+    cache = FitCache(max_bytes=2500)
+    for key in 'abc':
+        cache.put(key, np.zeros(100))
+    assert cache.get('a') is not None
+    cache.put('d', np.zeros(100))
+    assert 'b' not in cache and all(key in cache for key in 'acd')
+    assert cache.stats()['nbytes'] == 2400
+
+
+def test_fit_cache_spills_evicted_items_to_disk(tmp_path):
+    cache = FitCache(max_bytes=2500, disk_dir=str(tmp_path))
+    for i, key in enumerate('abcd'):
+        cache.put(key, np.full(100, float(i)))
+    assert 'a' in cache and cache.stats()['items'] == 3
+
+    # Instance baru (mis. proses lain) memuat item yang sudah di-spill dari direktori yang sama
+    reloaded = FitCache(max_bytes=2500, disk_dir=str(tmp_path))
+    assert np.array_equal(reloaded.get('a'), np.zeros(100))
+    assert reloaded.stats()['hits'] == 1 and reloaded.get('b') is None
+
+
+def test_cache_key_changes_with_data_model_and_settings(desc, data):
+    key = make_cache_key(data, desc, 'native', nboot=100, seed=1)
+    assert key == make_cache_key(data.copy(), desc, 'native', seed=1, nboot=100)
+    assert key != make_cache_key(data.iloc[1:], desc, 'native', nboot=100, seed=1)
+    assert key != make_cache_key(data, desc + "Y ~ X\n", 'native', nboot=100, seed=1)
+    assert key != make_cache_key(data, desc, 'native', nboot=100, seed=2)
+
+
+def test_replicate_store_round_trip(tmp_path, desc, data):
+    boot = parallel_bootstrap(desc, data, 30, seed=4, n_jobs=1, engine='native')
+    store = ReplicateStore(str(tmp_path))
+    assert store.load('k') is None
+    assert store.save('k', boot) and not store.save('k', boot)
+
+    loaded = store.load('k')
+    assert np.array_equal(loaded.replicates, boot.replicates) and loaded.seed == 4
+    pd.testing.assert_frame_equal(loaded.estimates, boot.estimates[['lval', 'op', 'rval', 'Estimate']])
+
+
+def test_replicate_store_keeps_float32_replicates(tmp_path, desc, data):
+    boot = parallel_bootstrap(desc, data, 30, seed=4, n_jobs=1, engine='native', precision='float32')
+    store = ReplicateStore(str(tmp_path))
+    store.save('k', boot)
+    loaded = store.load('k')
+    assert loaded.precision == 'float32' and np.array_equal(loaded.replicates, boot.replicates)
+
+
+def test_dataset_store_round_trip_as_read_only_memory_map(tmp_path):
+    store = DatasetStore(str(tmp_path))
+    df = _frame(1).assign(label=lambda d: np.where(d['a'] > 0, 'ya', 'tidak'))
+    key = store.put(df)
+    assert store.put(df.copy()) == key
+
+    pd.testing.assert_frame_equal(store.frame(key), df)
+    view = store.frame(key, columns=['b', 'a'])
+    assert list(view.columns) == ['b', 'a'] and not view['a'].to_numpy().flags.writeable
+
+
+def test_prune_skips_datasets_referenced_by_live_sessions(tmp_path):
+    store = DatasetStore(str(tmp_path), max_disk_bytes=1)
+    first = store.put(_frame(1))
+    store.acquire('sesi-1', first)
+    second = store.put(_frame(2))
+    assert first in store and second in store
+    pd.testing.assert_frame_equal(store.frame(first), _frame(1))
+
+    # Tanpa rujukan, dataset lama boleh di-prune saat dataset baru ditulis
+    store.release('sesi-1')
+    store.put(_frame(3))
+    assert first not in store
+
+
+def test_expired_references_do_not_pin_datasets(tmp_path):
+    store = DatasetStore(str(tmp_path), max_disk_bytes=1, ref_ttl=-1)
+    first = store.put(_frame(1))
+    store.acquire('sesi-1', first)
+    store.put(_frame(2))
+    assert first not in store
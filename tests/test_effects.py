@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from pls_effects import EffectPlan, mediation_table
+from pls_engine import fit_pls, jackknife_estimates, parallel_bootstrap, parse_model_syntax
+
+
+@pytest.fixture(scope='module')
+def estimates(desc, data):
+    return fit_pls(desc, data).inspect(mode='estimates')
+
+
+def _path(estimates, frm, to):
+    row = estimates[(estimates['lval'] == to) & (estimates['op'] == '~') & (estimates['rval'] == frm)]
+    return float(row['Estimate'].iloc[0])
+
+
+def _effect(table, op, frm, to):
+    row = table[(table['lval'] == to) & (table['op'] == op) & (table['rval'] == frm)]
+    assert len(row) == 1
+    return float(row['Estimate'].iloc[0])
+
+
+def test_effects_are_products_and_sums_of_paths(desc, estimates):
+    table = mediation_table(desc, estimates)
+    xm, my, xy = _path(estimates, 'X', 'M'), _path(estimates, 'M', 'Y'), _path(estimates, 'X', 'Y')
+    assert table.attrs['n_chains'] == 1
+    assert np.isclose(_effect(table, '~ind', 'X', 'Y'), xm * my)
+    assert np.isclose(_effect(table, '~tind', 'X', 'Y'), xm * my)
+    assert np.isclose(_effect(table, '~tot', 'X', 'Y'), xy + xm * my)
+    assert np.isclose(_effect(table, '~tot', 'X', 'M'), xm)
+    assert np.isclose(_effect(table, '~tot', 'M', 'Y'), my)
+
+
+def test_total_effects_match_matrix_inverse_on_longer_chain():
+    spec = parse_model_syntax("A =~ a1\nB =~ b1\nC =~ c1\nD =~ d1\nB ~ A\nC ~ A + B\nD ~ B + C\n")
+    plan = EffectPlan(spec)
+    paths = np.random.default_rng(0).uniform(-0.5, 0.5, (5, len(spec.paths)))
+    effects = plan.compute(paths)
+    labels = plan.labels()
+    lookup = {(f, t): col for col, (f, t) in enumerate(spec.paths)}
+    for b in range(paths.shape[0]):
+        beta = {edge: paths[b, col] for edge, col in lookup.items()}
+        # A -> D: A-B-D, A-C-D, A-B-C-D
+        indirect = (beta['A', 'B'] * beta['B', 'D'] + beta['A', 'C'] * beta['C', 'D']
+                    + beta['A', 'B'] * beta['B', 'C'] * beta['C', 'D'])
+        row = labels.index[(labels['op'] == '~tot') & (labels['rval'] == 'A') & (labels['lval'] == 'D')][0]
+        assert np.isclose(effects[b, row], indirect)
+        row = labels.index[(labels['op'] == '~tind') & (labels['rval'] == 'A') & (labels['lval'] == 'D')][0]
+        assert np.isclose(effects[b, row], indirect)
+        specific = labels.index[(labels['op'] == '~ind') & (labels['rval'] == 'A') & (labels['lval'] == 'D')]
+        assert np.isclose(effects[b, specific].sum(), indirect)
+
+
+def test_bootstrap_effects_match_per_replicate_products(desc, data, estimates):
+    boot = parallel_bootstrap(desc, data, 200, seed=4, n_jobs=1, engine='native')
+    jack = jackknife_estimates(desc, data)
+    table = mediation_table(desc, estimates, boot, method='bca', jackknife=jack)
+    keys = list(boot.estimates[['lval', 'op', 'rval']].itertuples(index=False, name=None))
+    reps = boot.valid_replicates()
+    indirect = reps[:, keys.index(('M', '~', 'X'))] * reps[:, keys.index(('Y', '~', 'M'))]
+    row = table[table['op'] == '~ind'].iloc[0]
+    assert np.isclose(row['Sample Mean'], indirect.mean())
+    assert np.isclose(row['Std. Err'], indirect.std(ddof=1))
+    assert row['CI Lower'] < row['Estimate'] < row['CI Upper']
+    assert table.attrs['n_valid'] == reps.shape[0]
@@ -0,0 +1,205 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from pls_engine import (
+    FIT_FUNCTIONS, FLOAT32_EXACT, PRECISION_TOLERANCE, bootstrap_intervals, bootstrap_summary, fit_pls,
+    jackknife_acceleration, jackknife_estimates, parallel_bootstrap, parse_model_syntax, precision_report,
+    progressive_bootstrap, resample_matrix, weighted_moments,
+)
+
+
+def _column_means(desc, data):
+    """Pengganti fit yang deterministik dan murah: rata-rata tiap kolom sebagai 'estimasi'."""
+    return pd.DataFrame({'lval': list(data.columns), 'op': '~1', 'rval': '', 'Estimate': data.mean().to_numpy()})
+
+
+def test_replicates_follow_seed_streams_for_any_n_jobs(desc, data, monkeypatch):
+    monkeypatch.setitem(FIT_FUNCTIONS, 'semopy', _column_means)
+    single = parallel_bootstrap(desc, data, 40, seed=9, n_jobs=1, engine='semopy')
+    multi = parallel_bootstrap(desc, data, 40, seed=9, n_jobs=3, engine='semopy')
+    assert np.array_equal(single.replicates, multi.replicates)
+    # Replikasi ke-i memakai stream RNG anak ke-i dari seed
+    idx = np.random.default_rng(np.random.SeedSequence(9).spawn(40)[7]).integers(0, len(data), size=len(data))
+    assert np.allclose(single.replicates[7], data.to_numpy()[idx].mean(axis=0))
+
+
+def test_bootstrap_summary_ignores_failed_replicates():
+    estimates = pd.DataFrame({'lval': ['Y', 'Y'], 'op': '~', 'rval': ['X', 'M'], 'Estimate': [0.5, -0.2]})
+    replicates = np.random.default_rng(0).normal([0.5, -0.2], 0.1, size=(50, 2))
+    replicates[[3, 17], 1] = np.nan
+    out = bootstrap_summary(estimates, replicates)
+    valid = replicates[np.isfinite(replicates).all(axis=1)]
+    se = valid.std(axis=0, ddof=1)
+    assert np.allclose(out['Sample Mean'], valid.mean(axis=0))
+    assert np.allclose(out['Std. Err'], se)
+    assert np.allclose(out['T-stat'], [0.5, 0.2] / se)
+    assert np.allclose(out['p-value'], 2 * stats.t.sf([0.5, 0.2] / se, df=valid.shape[0] - 1))
+
+
+def _reference_pls(desc, data, tol=1e-12, max_iter=1000):
+    """PLS-SEM Mode A + path weighting langsung pada skor konstrak (tanpa matriks korelasi bertumpuk)."""
+    spec = parse_model_syntax(desc)
+    Z = data[spec.indicators].to_numpy(dtype=float)
+    Z = (Z - Z.mean(axis=0)) / Z.std(axis=0, ddof=1)
+    K = len(spec.lvs)
+    blocks = [[c for k, c in spec.pairs if k == j] for j in range(K)]
+    preds = [[i for i, t in spec.path_pos if t == j] for j in range(K)]
+    succs = [[t for i, t in spec.path_pos if i == j] for j in range(K)]
+
+    def normalize(weights):
+        return [w / (Z[:, b] @ w).std(ddof=1) for w, b in zip(weights, blocks)]
+
+    def regress(Y, j):
+        return np.linalg.lstsq(Y[:, preds[j]], Y[:, j], rcond=None)[0]
+
+    weights = normalize([np.ones(len(b)) for b in blocks])
+    for _ in range(max_iter):
+        Y = np.column_stack([Z[:, b] @ w for w, b in zip(weights, blocks)])
+        inner = np.zeros_like(Y)
+        for j in range(K):
+            for i in succs[j]:
+                inner[:, j] += np.corrcoef(Y[:, i], Y[:, j])[0, 1] * Y[:, i]
+            if preds[j]:
+                inner[:, j] += Y[:, preds[j]] @ regress(Y, j)
+        new = normalize([Z[:, b].T @ inner[:, j] for j, b in enumerate(blocks)])
+        change = max(np.abs(a - b).max() for a, b in zip(new, weights))
+        weights = new
+        if change < tol:
+            break
+
+    Y = np.column_stack([Z[:, b] @ w for w, b in zip(weights, blocks)])
+    loadings = np.array([np.corrcoef(Z[:, c], Y[:, k])[0, 1] for k, c in spec.pairs])
+    sign = np.array([1.0 if sum(l for (k, _), l in zip(spec.pairs, loadings) if k == j) >= 0 else -1.0
+                     for j in range(K)])
+    loadings = loadings * sign[[k for k, _ in spec.pairs]]
+    Y = Y * sign
+    paths = np.empty(len(spec.path_pos))
+    for j in range(K):
+        if preds[j]:
+            for i, beta in zip(preds[j], regress(Y, j)):
+                paths[spec.path_pos.index((i, j))] = beta
+    return np.concatenate([loadings, paths])
+
+
+def test_native_estimates_match_reference(desc, data):
+    res = fit_pls(desc, data, tol=1e-12, max_iter=1000)
+    assert np.allclose(res.param_vector(), _reference_pls(desc, data), atol=1e-8)
+
+
+def test_warm_start_replicates_match_cold_start(desc, data):
+    kwargs = dict(seed=2, n_jobs=1, engine='native', fit_kwargs={'tol': 1e-10})
+    warm = parallel_bootstrap(desc, data, 100, warm_start=True, **kwargs)
+    cold = parallel_bootstrap(desc, data, 100, warm_start=False, **kwargs)
+    assert np.allclose(warm.replicates, cold.replicates, atol=1e-8)
+
+
+def _naive_leave_one_out(desc, data, tol):
+    return np.array([fit_pls(desc, data.drop(index=i), tol=tol, max_iter=1000).param_vector() for i in data.index])
+
+
+def test_jackknife_matches_naive_leave_one_out(desc, data):
+    jack = jackknife_estimates(desc, data, tol=1e-12, max_iter=1000, n_jobs=2)
+    naive = _naive_leave_one_out(desc, data, tol=1e-12)
+    assert jack.shape == naive.shape
+    assert np.allclose(jack.to_numpy(), naive, atol=1e-8)
+    assert np.allclose(jackknife_acceleration(jack.to_numpy()), jackknife_acceleration(naive), atol=1e-6)
+
+
+def test_bca_acceleration_matches_textbook_formula(desc, data):
+    naive = _naive_leave_one_out(desc, data, tol=1e-10)
+    d = naive.mean(axis=0) - naive
+    expected = (d ** 3).sum(axis=0) / (6 * ((d ** 2).sum(axis=0)) ** 1.5)
+    assert np.allclose(jackknife_acceleration(naive), expected)
+
+
+def test_bca_without_acceleration_equals_bc(desc, data):
+    boot = parallel_bootstrap(desc, data, 400, seed=11, n_jobs=1, engine='native')
+    original = boot.estimates['Estimate'].to_numpy()
+    flat_jack = np.ones((10, original.size))
+    bca = bootstrap_intervals(original, boot.valid_replicates(), method='bca', jackknife=flat_jack)
+    bc = bootstrap_intervals(original, boot.valid_replicates(), method='bc')
+    assert np.allclose(bca, bc)
+    lower, upper = bootstrap_intervals(original, boot.valid_replicates(), method='bca',
+                                       jackknife=jackknife_estimates(desc, data).to_numpy())
+    assert (lower <= original).all() and (original <= upper).all()
+
+
+def test_float32_precision_report_within_tolerance(desc, data):
+    report = precision_report(desc, data, nboot=200, seed=5)
+    assert report.attrs['n_compared'] == 200
+    assert report.attrs['max_abs_diff'] <= PRECISION_TOLERANCE
+    assert report.attrs['accepted']
+    assert report.attrs['bytes_float32'] * 2 == report.attrs['bytes_float64']
+
+
+def test_float32_moments_exact_beyond_single_sum_bound():
+    # Skala 0-100: satu jumlah float32 atas semua baris sudah melewati 2^24
+    rng = np.random.default_rng(3)
+    values = rng.integers(0, 101, size=(20_000, 4)).astype(float)
+    counts = rng.multinomial(len(values), np.full(len(values), 1 / len(values)), size=3)
+    X = resample_matrix(values, precision='float32')
+    assert len(values) * np.abs(X).max() ** 2 > FLOAT32_EXACT
+    mean, cov = weighted_moments(X, counts)
+    X64, total = X.astype(np.float64), counts.sum(axis=1, keepdims=True)
+    ref_mean = (counts @ X64) / total
+    assert np.array_equal(mean, ref_mean)
+    assert np.array_equal(cov, ((X64.T * counts[:, None, :]) @ X64) / total[:, :, None]
+                          - ref_mean[:, :, None] * ref_mean[:, None, :])
+
+
+def test_float32_precision_report_large_n(desc, data):
+    # Data Likert x 20 diulang: korelasi sama, tetapi n x maks|x|² jauh di atas 2^24
+    large = pd.concat([data * 20] * 200, ignore_index=True)
+    report = precision_report(desc, large, nboot=20, seed=5)
+    assert report.attrs['n_compared'] == 20
+    assert report.attrs['max_abs_diff'] <= PRECISION_TOLERANCE
+    assert report.attrs['accepted']
+
+
+def test_solver_telemetry_reports_convergence(desc, data):
+    summary = fit_pls(desc, data).solver_summary()
+    assert summary['converged'] and 1 < summary['n_iter'] < 300 and summary['delta'] < 1e-7
+    stalled = fit_pls(desc, data, max_iter=1).solver_summary()
+    assert not stalled['converged'] and stalled['n_iter'] == 1 and stalled['delta'] >= 1e-7
+
+
+def test_nonconverged_replicates_are_excluded_from_intervals(desc, data):
+    boot = parallel_bootstrap(desc, data, 200, seed=6, n_jobs=1, engine='native', warm_start=False,
+                              replicate_kwargs={'tol': 1e-4, 'max_iter': 4})
+    assert (boot.n_iter <= 4).all()
+    assert np.array_equal(boot.converged, boot.delta < 1e-4)
+    assert 0 < boot.n_nonconverged < 200
+    assert boot.iteration_summary()['non_converged'] == boot.n_nonconverged
+
+    kept = boot.exclude_nonconverged()
+    assert kept.n_valid == boot.n_valid - boot.n_nonconverged
+    ci = kept.confidence_intervals(level=0.9)
+    expected = np.quantile(boot.replicates[boot.converged], [0.05, 0.95], axis=0)
+    assert np.allclose(ci[['CI Lower', 'CI Upper']].to_numpy().T, expected)
+
+
+def test_native_replicates_bit_identical_across_n_jobs(desc, data):
+    single = parallel_bootstrap(desc, data, 300, seed=1, n_jobs=1, engine='native')
+    multi = parallel_bootstrap(desc, data, 300, seed=1, n_jobs=3, engine='native')
+    assert np.array_equal(single.replicates, multi.replicates)
+
+
+def test_native_replicates_bit_identical_with_explicit_batch_size(desc, data):
+    single = parallel_bootstrap(desc, data, 250, seed=3, n_jobs=1, engine='native', batch_size=16)
+    multi = parallel_bootstrap(desc, data, 250, seed=3, n_jobs=3, engine='native', batch_size=16)
+    assert np.array_equal(single.replicates, multi.replicates)
+
+
+def test_progressive_replicates_match_parallel(desc, data):
+    parallel = parallel_bootstrap(desc, data, 300, seed=5, n_jobs=1, engine='native')
+    for result, _ in progressive_bootstrap(desc, data, 300, alpha=0.05, seed=5, n_jobs=2, engine='native',
+                                           batch=100, min_boot=300):
+        pass
+    assert np.array_equal(result.replicates, parallel.replicates)
+
+
+def test_jackknife_bit_identical_across_n_jobs(desc, data):
+    single = jackknife_estimates(desc, data, n_jobs=1, batch_size=16)
+    multi = jackknife_estimates(desc, data, n_jobs=3, batch_size=16)
+    assert np.array_equal(single.to_numpy(), multi.to_numpy(), equal_nan=True)
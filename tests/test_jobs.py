@@ -0,0 +1,58 @@
+import threading
+import time
+
+from pls_jobs import JobManager
+from pls_profile import StageProfiler
+
+
+def _wait(manager, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while manager.get(job_id).is_active and time.time() < deadline:
+        time.sleep(0.01)
+    return manager.get(job_id)
+
+
+def test_job_profiler_records_merge_into_session_profiler():
+    session = StageProfiler()
+    session.begin_run("4. Hasil Analisis")
+    manager = JobManager(max_workers=1)
+
+    def work(job):
+        job.profiler = StageProfiler()
+        with job.profiler.stage("bootstrap"):
+            return threading.get_ident()
+
+    job = _wait(manager, manager.submit("uji", work))
+    assert job.status == 'selesai' and not session.records
+    session.merge(job.profiler)
+    record = session.records[0]
+    assert record['stage'] == "bootstrap" and record['run'] == session.run_id
+    assert record['page'] == "4. Hasil Analisis" and record['thread'] == job.result
+
+
+def test_cancel_stops_job_at_next_progress_report():
+    manager = JobManager(max_workers=1)
+    started = threading.Event()
+
+    def work(job):
+        started.set()
+        for done in range(1000):
+            job.report(done, 1000)
+            time.sleep(0.005)
+
+    job_id = manager.submit("uji", work, total=1000)
+    started.wait(5)
+    manager.cancel(job_id)
+    assert _wait(manager, job_id).status == 'dibatalkan'
+
+
+def test_job_result_and_error_are_recorded():
+    manager = JobManager(max_workers=1)
+    done = _wait(manager, manager.submit("uji", lambda job: 42))
+    assert done.status == 'selesai' and done.result == 42
+
+    def fail(job):
+        raise ValueError("data kosong")
+
+    failed = _wait(manager, manager.submit("uji", fail))
+    assert failed.status == 'gagal' and failed.error == "data kosong"
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from pls_engine import fit_pls
+from pls_mga import fit_groups, multigroup_analysis, pairwise_permutation_tests, permutation_test
+
+
+@pytest.fixture(scope='module')
+def grouped(data):
+    return data.assign(grup=np.where(np.arange(len(data)) % 2 == 0, 'A', 'B'))
+
+
+def test_fit_groups_match_separate_fits(desc, grouped):
+    results = fit_groups(desc, grouped, 'grup')
+    assert set(results) == {'A', 'B'}
+    for label, res in results.items():
+        subset = grouped[grouped['grup'] == label].drop(columns='grup')
+        assert res.n_obs == len(subset)
+        assert np.allclose(res.param_vector(), fit_pls(desc, subset).param_vector(), atol=1e-8)
+
+
+def test_permutation_test_identical_across_n_jobs(desc, grouped):
+    single = permutation_test(desc, grouped, 'grup', 'A', 'B', n_perm=150, seed=4, n_jobs=1)
+    multi = permutation_test(desc, grouped, 'grup', 'A', 'B', n_perm=150, seed=4, n_jobs=3)
+    assert single.equals(multi)
+
+
+def test_pairwise_permutation_progress_spans_all_pairs(desc, data):
+    three = data.assign(grup=np.array(['A', 'B', 'C'])[np.arange(len(data)) % 3])
+    calls = []
+    table = pairwise_permutation_tests(desc, three, 'grup', n_perm=40, seed=1,
+                                       progress=lambda done, total: calls.append((done, total)))
+    assert set(zip(table['Grup A'], table['Grup B'])) == {('A', 'B'), ('A', 'C'), ('B', 'C')}
+    assert calls[-1] == (120, 120)
+    assert all(total == 120 for _, total in calls)
+
+
+def test_multigroup_analysis_forwards_solver_settings(desc, grouped):
+    kwargs = dict(nboot=20, n_perm=20, seed=2, tol=1e-12, max_iter=2)
+    mga = multigroup_analysis(desc, grouped, 'grup', [('X', 'M')], **kwargs)
+    stopped = fit_groups(desc, grouped, 'grup', tol=1e-12, max_iter=2)
+    default = fit_groups(desc, grouped, 'grup')
+    for label, boot in mga['bootstrap'].items():
+        assert np.allclose(boot.estimates['Estimate'], stopped[label].param_vector(), rtol=0, atol=1e-10)
+        assert not np.allclose(boot.estimates['Estimate'], default[label].param_vector(), rtol=0, atol=1e-10)
+        assert (boot.n_iter <= 2).all() and not boot.converged.any()
+    default = permutation_test(desc, grouped, 'grup', 'A', 'B', n_perm=20, seed=2)
+    stalled = permutation_test(desc, grouped, 'grup', 'A', 'B', n_perm=20, seed=2, tol=1e-12, max_iter=2)
+    assert not np.allclose(stalled['Selisih'], default['Selisih'], rtol=0, atol=1e-12)
@@ -0,0 +1,35 @@
+import numpy as np
+
+from pls_data import StreamingMoments, read_upload
+from pls_engine import fit_pls
+from pls_pipeline import run_moments_pipeline, run_pipeline, validate_spec
+
+
+def test_run_pipeline_on_csv_matches_direct_fit(tmp_path, desc, data, model_spec):
+    path = tmp_path / 'survei.csv'
+    data.to_csv(path, index=False)
+    frame, _ = read_upload(str(path))
+    spec = validate_spec(dict(model_spec, bootstrap_samples=200, loading_threshold=0.5))
+    result = run_pipeline(frame, spec)
+
+    summary = result['summary']
+    assert summary['n_obs'] == 200 and summary['replikasi_bootstrap'] == 200
+    assert summary['indikator_dihapus'] == [] and result['loadings']['Valid'].all()
+    estimates = fit_pls(desc, data).inspect(mode='estimates').query("op == '~'")
+    expected = {f"{f} -> {t}": beta for t, f, beta in estimates[['lval', 'rval', 'Estimate']].itertuples(index=False)}
+    hypotheses = result['hypotheses'].set_index('Jalur')['β (Koef. Jalur)']
+    assert np.allclose(hypotheses[list(expected)], list(expected.values()))
+    assert (result['hypotheses']['Keputusan'] == 'Diterima').all()
+
+
+def test_moments_pipeline_matches_in_memory_pipeline(data, model_spec):
+    spec = validate_spec(dict(model_spec, bootstrap_samples=50, loading_threshold=0.5))
+    moments = StreamingMoments(data.columns)
+    for chunk in np.array_split(data.to_numpy(dtype=float), [13, 120]):
+        moments.update(chunk)
+    streamed = run_moments_pipeline(moments, spec)
+    in_memory = run_pipeline(data, spec)
+    assert streamed['summary']['n_obs'] == 200 and streamed['summary']['replikasi_bootstrap'] == 0
+    assert np.allclose(streamed['hypotheses']['β (Koef. Jalur)'], in_memory['hypotheses']['β (Koef. Jalur)'])
+    assert np.allclose(streamed['loadings']['Loading'], in_memory['loadings']['Loading'])
+    assert np.allclose(streamed['r2']['R²'], in_memory['r2']['R²'])
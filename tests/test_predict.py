@@ -0,0 +1,67 @@
+import numpy as np
+
+from pls_engine import parse_model_syntax, path_matrix, pls_solve
+from pls_predict import blindfolding, pls_predict
+
+
+def test_blindfolding_q2_positive_on_population_data(desc, data):
+    q2 = blindfolding(desc, data, omission_distance=7)
+    assert list(q2['Konstrak']) == ['M', 'Y']
+    assert (q2['Q²'] > 0).all()
+    np.testing.assert_allclose(q2['Q²'], 1 - q2['SSE'] / q2['SSO'])
+
+
+
+def _naive_blindfolding(desc, data, D, tol):
+    """Q² per konstrak dengan satu fit penuh per putaran; hanya indikator konstrak itu yang dihapus."""
+    spec = parse_model_syntax(desc)
+    X = data[spec.indicators].to_numpy(dtype=float)
+    X = (X - X.mean(axis=0)) / X.std(axis=0, ddof=1)
+    n = X.shape[0]
+    out = {}
+    for j in spec.endogenous:
+        items = np.flatnonzero(spec.pair_lv == j)
+        cols = spec.pair_col[items]
+        sse = sso = 0.0
+        for d in range(D):
+            omitted = (np.arange(n)[:, None] * len(cols) + np.arange(len(cols))) % D == d
+            Xd = X.copy()
+            for c, col in enumerate(cols):
+                Xd[omitted[:, c], col] = X[~omitted[:, c], col].mean()
+            mean, sd = Xd.mean(axis=0), Xd.std(axis=0, ddof=1)
+            Z = (Xd - mean) / sd
+            sol = pls_solve((Z.T @ Z / (n - 1))[None], spec, tol=tol, max_iter=1000)
+            lv_pred = (Z @ sol['W'][0]) @ path_matrix(spec, sol['paths'])[0][:, j]
+            pred = mean[cols] + sd[cols] * lv_pred[:, None] * sol['loadings'][0, items]
+            sse += ((X[:, cols] - pred) ** 2)[omitted].sum()
+            sso += (X[:, cols] ** 2)[omitted].sum()
+        out[spec.lvs[j]] = 1 - sse / sso
+    return out
+
+
+def test_blindfolding_omits_one_construct_at_a_time(desc, data):
+    q2 = blindfolding(desc, data, omission_distance=7, tol=1e-10, max_iter=1000).set_index('Konstrak')['Q²']
+    expected = _naive_blindfolding(desc, data, 7, tol=1e-10)
+    np.testing.assert_allclose(q2[list(expected)], list(expected.values()), atol=1e-8)
+
+def test_pls_predict_reports_every_endogenous_indicator(desc, data):
+    table = pls_predict(desc, data, k=5, repeats=3, seed=3)
+    assert len(table) == 6
+    assert (table['Q²_predict'] > 0).all()
+
+
+def test_pls_predict_identical_across_n_jobs(desc, data):
+    single = pls_predict(desc, data, k=5, repeats=6, seed=3, n_jobs=1, batch_size=10)
+    multi = pls_predict(desc, data, k=5, repeats=6, seed=3, n_jobs=3, batch_size=10)
+    assert single.equals(multi)
+    assert (single['Q²_predict'] > 0).all()
+
+
+def test_pls_predict_drops_only_degenerate_repetitions(desc, data):
+    # y1 hanya bervariasi di dua baris: repetisi yang menaruh keduanya di fold uji yang sama tidak dapat di-fit
+    sparse = data.assign(y1=0.0)
+    sparse.loc[sparse.index[:2], 'y1'] = 1.0
+    single = pls_predict(desc, sparse, k=2, repeats=20, seed=1, n_jobs=1)
+    multi = pls_predict(desc, sparse, k=2, repeats=20, seed=1, n_jobs=3)
+    assert 0 < single.attrs['repeats'] < 20
+    assert single.equals(multi) and single.attrs['repeats'] == multi.attrs['repeats']
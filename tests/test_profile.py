@@ -0,0 +1,27 @@
+import json
+
+import pytest
+
+from pls_profile import StageProfiler
+
+
+def test_stage_profiler_records_nested_stages_and_errors():
+    profiler = StageProfiler()
+    profiler.begin_run("1. Upload")
+    with profiler.stage("analisis"):
+        with profiler.stage("fit", category='engine', n_obs=200):
+            pass
+    with pytest.raises(ValueError):
+        with profiler.stage("gagal"):
+            raise ValueError("x")
+
+    frame = profiler.frame(last_run=True)
+    assert list(frame['stage']) == ["analisis", "fit", "gagal"]
+    assert list(frame['depth']) == [0, 1, 0] and frame.loc[1, 'n_obs'] == 200
+    assert frame.loc[2, 'error'] == "ValueError: x"
+    assert set(profiler.summary()['stage']) == {"analisis", "fit", "gagal"}
+
+    profiler.begin_run("2. Model")
+    assert profiler.frame(last_run=True).empty and len(profiler.frame()) == 3
+    events = json.loads(profiler.chrome_trace())['traceEvents']
+    assert [e['name'] for e in events] == ["fit", "analisis", "gagal"] and events[1]['ph'] == 'X'
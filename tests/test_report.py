@@ -0,0 +1,35 @@
+import io
+import json
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from pls_engine import fit_pls, parallel_bootstrap
+from pls_report import export_bundle, html_report
+
+
+def test_export_bundle_contains_tables_replicates_report_and_metadata(desc, data):
+    boot = parallel_bootstrap(desc, data, 50, seed=1, n_jobs=1, engine='native')
+    tables = {'Uji Hipotesis': boot.inspect(), 'R²': fit_pls(desc, data).inspect(mode='r2')}
+    calls = []
+    bundle = export_bundle(tables, boot, diagram_svg=b'<?xml version="1.0"?>\n<svg></svg>', meta={'n_obs': 200},
+                           fmt='csv', progress=lambda done, total: calls.append((done, total)))
+
+    with zipfile.ZipFile(io.BytesIO(bundle)) as zf:
+        assert zf.namelist() == ['tabel/uji_hipotesis.csv', 'tabel/r.csv', 'replikasi_bootstrap.npz', 'laporan.html',
+                                 'metadata.json']
+        pd.testing.assert_frame_equal(pd.read_csv(io.BytesIO(zf.read('tabel/r.csv'))), tables['R²'])
+        with np.load(io.BytesIO(zf.read('replikasi_bootstrap.npz'))) as f:
+            assert np.array_equal(f['replicates'], boot.replicates)
+        page = zf.read('laporan.html').decode('utf-8')
+        meta = json.loads(zf.read('metadata.json'))
+    assert '<svg></svg>' in page and '<?xml' not in page and '<h2>R²</h2>' in page
+    assert meta['n_obs'] == 200 and meta['replikasi']['jumlah'] == 50 and len(meta['berkas']) == 4
+    assert calls == [(k, 5) for k in range(1, 6)]
+
+
+def test_html_report_escapes_text():
+    page = html_report("Model <A & B>", {'Tabel': pd.DataFrame({'x': [1.23456]})}, meta={'catatan': '<b>'})
+    assert "<title>Model &lt;A &amp; B&gt;</title>" in page and "&lt;b&gt;" in page
+    assert "<td>1.235</td>" in page
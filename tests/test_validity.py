@@ -0,0 +1,64 @@
+import numpy as np
+
+from pls_engine import fit_pls, parse_model_syntax
+from pls_validity import htmt_bootstrap, htmt_matrix, reliability_table
+
+
+def _rho_a_reference(X, spec, weights):
+    """rho_A Dijkstra-Henseler per blok: (w'w)² · w'(S - diag S)w / w'(ww' - diag ww')w."""
+    S = np.corrcoef(X, rowvar=False)
+    out = []
+    for k in range(len(spec.lvs)):
+        sel = spec.pair_lv == k
+        cols = spec.pair_col[sel]
+        S_k = S[np.ix_(cols, cols)]
+        w = weights[sel] / np.sqrt(weights[sel] @ S_k @ weights[sel])
+        ww = np.outer(w, w)
+        out.append((w @ w) ** 2 * (w @ (S_k - np.diag(np.diag(S_k))) @ w) / (w @ (ww - np.diag(np.diag(ww))) @ w))
+    return np.array(out)
+
+
+def test_alpha_cr_ave_match_textbook_formulas(desc, data):
+    blocks = parse_model_syntax(desc).blocks
+    res = fit_pls(desc, data)
+    loadings = res.inspect(mode='estimates').query("op == '=~'").set_index('rval')['Estimate']
+    table = reliability_table(res, desc, data)
+    for lv, inds in blocks.items():
+        S = data[inds].corr().to_numpy()
+        p = len(inds)
+        lam = loadings[inds].to_numpy()
+        assert np.isclose(table.loc[lv, "Cronbach's Alpha"], p / (p - 1) * (1 - p / S.sum()))
+        assert np.isclose(table.loc[lv, 'Composite Reliability'], lam.sum() ** 2 / (lam.sum() ** 2 + (1 - lam ** 2).sum()))
+        assert np.isclose(table.loc[lv, 'AVE'], (lam ** 2).mean())
+
+
+def test_rho_a_matches_per_construct_reference(desc, data):
+    spec = parse_model_syntax(desc)
+    res = fit_pls(desc, data)
+    table = reliability_table(res, desc, data)
+    reference = _rho_a_reference(data[spec.indicators].to_numpy(), spec, res.solution['weights'])
+    np.testing.assert_allclose(table['rho_A'].to_numpy(), reference, rtol=1e-8)
+
+
+def test_rho_a_between_alpha_and_cr(desc, data):
+    table = reliability_table(fit_pls(desc, data), desc, data)
+    assert (table["Cronbach's Alpha"] <= table['rho_A'] + 1e-12).all()
+    assert (table['rho_A'] <= table['Composite Reliability'] + 1e-12).all()
+
+
+def test_htmt_bootstrap_identical_across_n_jobs(desc, data):
+    single = htmt_bootstrap(desc, data, 200, seed=2, n_jobs=1)
+    multi = htmt_bootstrap(desc, data, 200, seed=2, n_jobs=3)
+    assert single.equals(multi)
+
+
+def test_htmt_matches_pairwise_definition(desc, data):
+    blocks = parse_model_syntax(desc).blocks
+    corr = data.corr().abs()
+    table = htmt_matrix(desc, data)
+    for a, b in [('M', 'X'), ('Y', 'X'), ('Y', 'M')]:
+        ia, ib = blocks[a], blocks[b]
+        hetero = corr.loc[ia, ib].to_numpy().mean()
+        mono = [corr.loc[i, i].to_numpy()[np.triu_indices(len(i), k=1)].mean() for i in (ia, ib)]
+        assert np.isclose(table.loc[a, b], hetero / np.sqrt(mono[0] * mono[1]))
+    assert np.isnan(table.loc['X', 'M'])